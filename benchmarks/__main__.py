@@ -0,0 +1,87 @@
+'''
+Run the indexia benchmark suite or compare results with a baseline.
+
+Run from the repository root:
+
+    python -m benchmarks run --scales 100 10000 --output results.json
+    python -m benchmarks compare results.json baseline.json
+
+'''
+from benchmarks import suite
+from typing import Any
+import argparse
+import pandas as pd
+import sys
+import tempfile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = commands.add_parser('run', help='run the benchmark suite')
+    run_parser.add_argument('--scales', type=int, nargs='+', default=[100, 10000])
+    run_parser.add_argument('--species-per-genus', type=int, default=2)
+    run_parser.add_argument('--samples', type=int, default=50)
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--benchmarks', nargs='*', default=None)
+    
+    run_parser.add_argument(
+        '--fanout', choices=['fixed', 'uniform', 'zipf'], default='fixed'
+    )
+    
+    run_parser.add_argument('--zipf-exponent', type=float, default=1.0)
+    run_parser.add_argument('--directory', default=tempfile.gettempdir())
+    run_parser.add_argument('--output', default='benchmarks.json')
+    
+    compare_parser = commands.add_parser(
+        'compare', help='flag regressions against a baseline'
+    )
+    
+    compare_parser.add_argument('results')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('--tolerance', type=float, default=0.25)
+    
+    compare_parser.add_argument(
+        '--statistic', choices=['min', 'median', 'mean'], default='median'
+    )
+    
+    args: argparse.Namespace = parser.parse_args()
+    
+    if args.command == 'run':
+        results: dict[str, Any] = suite.run(
+            args.scales, args.directory,
+            species_per_genus=args.species_per_genus,
+            samples=args.samples,
+            repeat=args.repeat,
+            seed=args.seed,
+            names=args.benchmarks,
+            fanout=(args.fanout, args.zipf_exponent)
+        )
+        
+        suite.write(results, args.output)
+        print(pd.DataFrame(results['results']).to_string(index=False))
+        
+        return 0
+    
+    comparison: pd.DataFrame = suite.compare(
+        suite.read(args.results),
+        suite.read(args.baseline),
+        tolerance=args.tolerance,
+        statistic=args.statistic
+    )
+    
+    print(comparison.to_string(index=False))
+    regressions: pd.DataFrame = comparison[comparison.regression]
+    
+    if not regressions.empty:
+        print(f'\n{regressions.shape[0]} regression(s) beyond {args.tolerance:.0%}.')
+        
+        return 1
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
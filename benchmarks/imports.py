@@ -0,0 +1,87 @@
+'''
+Time cold imports of indexia modules & guard a start-up budget.
+
+Run from the repository root:
+
+    python -m benchmarks.imports --budget 0.1
+
+Exits with status 1 if the median import time of any module 
+exceeds the budget (in seconds).
+
+'''
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+MODULES: list[str] = [
+    'indexia.indexia',
+    'indexia.eidola',
+    'indexia.schemata'
+]
+
+def time_import(
+    module: str,
+    repeat: int
+) -> float:
+    '''
+    Time the cold import of a module in fresh interpreters.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module to import.
+    repeat : int
+        Number of interpreters to start.
+
+    Returns
+    -------
+    median : float
+        Median seconds spent importing the module, as 
+        reported by python -X importtime.
+
+    '''
+    durations: list[float] = []
+    
+    for _ in range(repeat):
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, check=True
+        )
+        
+        for line in result.stderr.splitlines():
+            fields: list[str] = [f.strip() for f in line.split('|')]
+            
+            if len(fields) == 3 and fields[2] == module:
+                durations += [int(fields[1]) / 1e6]
+    
+    median: float = statistics.median(durations)
+    
+    return median
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--modules', nargs='+', default=MODULES)
+    args: argparse.Namespace = parser.parse_args()
+    over_budget: list[str] = []
+    
+    for module in args.modules:
+        median: float = time_import(module, args.repeat)
+        print(f'{module:<20}{median:>10.4f} s')
+        
+        if median > args.budget:
+            over_budget += [module]
+    
+    if over_budget:
+        print(f'Over the {args.budget} s budget: {", ".join(over_budget)}')
+        
+        return 1
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+'''
+Compare write & read throughput of Indexia pragma profiles.
+
+Run from the repository root:
+
+    python -m benchmarks.profiles --beings 2000 --reads 2000
+
+'''
+from indexia.indexia import Indexia
+from sqlite3 import Connection
+from typing import Any
+import argparse
+import os
+import tempfile
+import time
+
+
+def time_profile(
+    db: str,
+    profile: str,
+    beings: int,
+    reads: int
+) -> dict[str, float]:
+    '''
+    Time a write & a read workload under one profile.
+    
+    The write workload adds beings creators & beings 
+    creatures one at a time, committing after each insert. 
+    The read workload looks up reads creatures by trait.
+
+    Parameters
+    ----------
+    db : str
+        Path to a database file. The file is removed 
+        before the workload runs.
+    profile : str
+        Name of the Indexia pragma profile.
+    beings : int
+        Number of creators & creatures to add.
+    reads : int
+        Number of trait lookups to perform.
+
+    Returns
+    -------
+    timings : dict[str, float]
+        Seconds spent on the write & read workloads.
+
+    '''
+    for suffix in ['', '-wal', '-shm']:
+        if os.path.isfile(f'{db}{suffix}'):
+            os.remove(f'{db}{suffix}')
+    
+    with Indexia(db, profile=profile) as ix:
+        cnxn: Connection = ix.open_cnxn(ix.db)
+        start: float = time.perf_counter()
+        
+        for i in range(beings):
+            creator: Any = ix.add_creator(
+                cnxn, 'creators', 'name', f'creator_{i}'
+            )
+            
+            ix.add_creature(
+                cnxn, 'creators', creator, 
+                'creatures', 'name', f'creature_{i}'
+            )
+            
+        write: float = time.perf_counter() - start
+        start = time.perf_counter()
+        
+        for i in range(reads):
+            ix.get_by_trait(cnxn, 'creatures', f'creature_{i % beings}')
+        
+        read: float = time.perf_counter() - start
+    
+    timings: dict[str, float] = {'write': write, 'read': read}
+    
+    return timings
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--beings', type=int, default=2000)
+    parser.add_argument('--reads', type=int, default=2000)
+    parser.add_argument('--directory', default=tempfile.gettempdir())
+    args: argparse.Namespace = parser.parse_args()
+    results: dict[str, dict[str, float]] = {}
+    
+    for profile in Indexia.profiles:
+        db: str = os.path.join(args.directory, f'bench_{profile}.db')
+        results[profile] = time_profile(db, profile, args.beings, args.reads)
+    
+    baseline: dict[str, float] = results['default']
+    print(f"{'profile':<12}{'write (s)':>12}{'speedup':>10}{'read (s)':>12}{'speedup':>10}")
+    
+    for profile, timings in results.items():
+        print(''.join([
+            f'{profile:<12}',
+            f"{timings['write']:>12.3f}",
+            f"{baseline['write'] / timings['write']:>9.2f}x",
+            f"{timings['read']:>12.3f}",
+            f"{baseline['read'] / timings['read']:>9.2f}x"
+        ]))
+
+
+if __name__ == '__main__':
+    main()
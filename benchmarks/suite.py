@@ -0,0 +1,401 @@
+'''
+Time the hot paths of indexia on databases generated by
+indexia.eidola.Maker.
+
+'''
+from indexia.eidola import Fanout, Maker
+from indexia.indexia import Indexia
+from indexia.schemata import Corpus, Dendron, Diktua
+from pyvis.network import Network # type: ignore
+from sqlite3 import Connection
+from typing import Any, Callable
+import json
+import os
+import pandas as pd
+import platform
+import random
+import sqlite3
+import statistics
+import time
+
+
+def make_database(
+    directory: str,
+    num_beings: int,
+    species_per_genus: int,
+    fanout: Fanout = 'fixed'
+) -> str:
+    '''
+    Make a benchmark database with indexia.eidola.Maker
+    in bulk mode, unless one with the same parameters already exists.
+    
+    The file is named by Maker.get_cache_key, which covers
+    Maker.version, & is built under a temporary name then
+    renamed into place, so that files of older versions or
+    of interrupted runs are never reused.
+    
+    Parameters
+    ----------
+    directory : str
+        Directory in which to create the database file.
+    num_beings : int
+        Number of beings in each table.
+    species_per_genus : int
+        Number of creature tables in each genus.
+    fanout : Fanout, optional
+        Distribution of creatures over their creators. See
+        indexia.eidola.Maker. The default is 'fixed'.
+    
+    Returns
+    -------
+    db : str
+        Path to the benchmark database file.
+    
+    '''
+    os.makedirs(directory, exist_ok=True)
+    partial_path: str = os.path.join(directory, f'bench.{os.getpid()}.partial')
+    
+    maker = Maker(
+        partial_path, species_per_genus, num_beings, 'name', 
+        bulk=True, fanout=fanout
+    )
+    
+    db: str = os.path.join(directory, f'bench_{maker.get_cache_key()}.db')
+    
+    if os.path.isfile(db):
+        return db
+    
+    for file_path in [partial_path, f'{partial_path}-wal', f'{partial_path}-shm']:
+        if os.path.isfile(file_path):
+            os.remove(file_path)
+    
+    maker.make()
+    os.replace(partial_path, db)
+    
+    return db
+
+def time_call(
+    call: Callable[[], Any],
+    repeat: int
+) -> dict[str, float]:
+    '''
+    Time repeated calls of a function.
+    
+    Parameters
+    ----------
+    call : Callable[[], Any]
+        Function to time.
+    repeat : int
+        Number of times to call the function.
+    
+    Returns
+    -------
+    timings : dict[str, float]
+        Minimum, median & mean seconds per call.
+    
+    '''
+    durations: list[float] = []
+    
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        call()
+        durations += [time.perf_counter() - start]
+    
+    timings: dict[str, float] = {
+        'min': min(durations),
+        'median': statistics.median(durations),
+        'mean': statistics.mean(durations)
+    }
+    
+    return timings
+
+def get_benchmarks(
+    db: str,
+    scratch_db: str,
+    num_beings: int,
+    samples: int,
+    seed: int,
+    names: list[str] | None = None
+) -> dict[str, Callable[[], Any]]:
+    '''
+    Get the benchmarked hot paths for a database.
+    
+    Corpus, Dendron & Diktua benchmarks start from the 
+    creator with id 1, which has the most creatures under 
+    a 'zipf' fanout. The corpus read by Diktua benchmarks 
+    is assembled on first use, before timing starts if 
+    one of them is in names.
+    
+    Parameters
+    ----------
+    db : str
+        Path to a database made by make_database.
+    scratch_db : str
+        Path to a database file used by write benchmarks.
+        The file is replaced on each call.
+    num_beings : int
+        Number of beings in each table of db.
+    samples : int
+        Number of beings looked up by each read benchmark.
+    seed : int
+        Seed for choosing the sampled beings.
+    names : list[str] | None, optional
+        Names of the benchmarks that will be run. If None, 
+        all benchmarks will be run. The default is None.
+    
+    Returns
+    -------
+    benchmarks : dict[str, Callable[[], Any]]
+        Functions keyed by benchmark name.
+    
+    '''
+    rng = random.Random(seed)
+    ids: list[int] = rng.sample(range(1, num_beings + 1), min(samples, num_beings))
+    
+    with Indexia(db) as ix:
+        cnxn: Connection = ix.open_cnxn(ix.db)
+        creators: pd.DataFrame = ix.get_df(cnxn, 'SELECT * FROM creators;')
+    
+    creator: pd.DataFrame = creators.loc[creators.id == 1]
+    corpora: list[pd.DataFrame] = []
+    
+    def get_corpus() -> pd.DataFrame:
+        if not corpora:
+            corpora.append(Corpus(db, 'creators', creator).assemble())
+        
+        return corpora[0]
+    
+    def add_beings() -> None:
+        if os.path.isfile(scratch_db):
+            os.remove(scratch_db)
+        
+        with Indexia(scratch_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i in ids:
+                creator: pd.DataFrame = ix.add_creator(
+                    cnxn, 'creators', 'name', f'creators_{i}'
+                )
+                
+                ix.add_creature(
+                    cnxn, 'creators', creator,
+                    'creatures_0', 'name', f'creatures_0_{i}'
+                )
+    
+    def get_by_trait() -> None:
+        with Indexia(db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i in ids:
+                ix.get_by_trait(cnxn, 'creatures_0', f'creatures_0_{i - 1}')
+    
+    def get_creatures() -> None:
+        with Indexia(db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i in ids:
+                ix.get_creatures(cnxn, 'creators', creators.loc[creators.id == i])
+    
+    def assemble() -> None:
+        Corpus(db, 'creators', creator).assemble()
+    
+    def render_image() -> None:
+        Dendron(db).render_image('creators', creator)
+    
+    def make_diktua() -> None:
+        Diktua(get_corpus(), as_nodes='species', as_edges='genus')
+    
+    def prepare_plot() -> None:
+        diktua = Diktua(get_corpus(), as_nodes='species', as_edges='genus')
+        diktua.style_nodes()
+        plot: Network = Network()
+        plot.from_nx(diktua.G) # type: ignore
+    
+    benchmarks: dict[str, Callable[[], Any]] = {
+        'add_creator_creature': add_beings,
+        'get_by_trait': get_by_trait,
+        'get_creatures': get_creatures,
+        'corpus_assemble': assemble,
+        'dendron_render_image': render_image,
+        'diktua_init': make_diktua,
+        'diktua_plot_prep': prepare_plot
+    }
+    
+    if any(
+        not names or n in names for n in ['diktua_init', 'diktua_plot_prep']
+    ):
+        get_corpus()
+    
+    return benchmarks
+
+def run(
+    scales: list[int],
+    directory: str,
+    species_per_genus: int = 2,
+    samples: int = 50,
+    repeat: int = 5,
+    seed: int = 0,
+    names: list[str] | None = None,
+    fanout: Fanout = 'fixed'
+) -> dict[str, Any]:
+    '''
+    Run the benchmark suite at each scale.
+    
+    Parameters
+    ----------
+    scales : list[int]
+        Numbers of beings per table at which to run the
+        suite.
+    directory : str
+        Directory in which benchmark databases are kept.
+    species_per_genus : int, optional
+        Number of creature tables in each genus. The
+        default is 2.
+    samples : int, optional
+        Number of beings looked up by each read benchmark.
+        The default is 50.
+    repeat : int, optional
+        Number of times each benchmark is timed. The
+        default is 5.
+    seed : int, optional
+        Seed for choosing the sampled beings. The default
+        is 0.
+    names : list[str] | None, optional
+        Names of the benchmarks to run. If None, run all
+        benchmarks. The default is None.
+    fanout : Fanout, optional
+        Distribution of creatures over their creators in
+        the benchmark databases. The default is 'fixed'.
+    
+    Returns
+    -------
+    results : dict[str, Any]
+        Machine & library versions under 'meta', & one
+        entry per benchmark & scale under 'results'.
+    
+    '''
+    results: dict[str, Any] = {
+        'meta': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'species_per_genus': species_per_genus,
+            'samples': samples,
+            'repeat': repeat,
+            'seed': seed,
+            'fanout': fanout
+        },
+        'results': []
+    }
+    
+    for scale in scales:
+        db: str = make_database(directory, scale, species_per_genus, fanout)
+        scratch_db: str = os.path.join(directory, 'bench_scratch.db')
+        
+        benchmarks: dict[str, Callable[[], Any]] = get_benchmarks(
+            db, scratch_db, scale, samples, seed, names
+        )
+        
+        for name, call in benchmarks.items():
+            if names and name not in names:
+                continue
+            
+            timings: dict[str, float] = time_call(call, repeat)
+            results['results'] += [{'name': name, 'scale': scale, **timings}]
+    
+    return results
+
+def write(
+    results: dict[str, Any],
+    file_path: str
+) -> str:
+    '''
+    Write benchmark results to a JSON file.
+    
+    Parameters
+    ----------
+    results : dict[str, Any]
+        Results returned by run.
+    file_path : str
+        Path of the JSON file to be created.
+    
+    Returns
+    -------
+    file_path : str
+        Path to the results file.
+    
+    '''
+    with open(file_path, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+    
+    return file_path
+
+def read(
+    file_path: str
+) -> dict[str, Any]:
+    '''
+    Read benchmark results from a JSON file.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path of a JSON file written by write.
+    
+    Returns
+    -------
+    results : dict[str, Any]
+        Benchmark results.
+    
+    '''
+    with open(file_path) as results_file:
+        results: dict[str, Any] = json.load(results_file)
+    
+    return results
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+    statistic: str = 'median'
+) -> pd.DataFrame:
+    '''
+    Compare benchmark results with a baseline.
+    
+    Parameters
+    ----------
+    results : dict[str, Any]
+        Benchmark results.
+    baseline : dict[str, Any]
+        Baseline benchmark results.
+    tolerance : float, optional
+        Fraction by which a benchmark may be slower than
+        the baseline before it is flagged as a regression.
+        The default is 0.25.
+    statistic : str, optional
+        Timing statistic to compare ('min', 'median' or
+        'mean'). The default is 'median'.
+    
+    Returns
+    -------
+    comparison : pandas.DataFrame
+        One row per benchmark & scale found in both
+        results, with baseline & current timings, their
+        ratio, & a regression flag.
+    
+    '''
+    key: list[str] = ['name', 'scale']
+    current: pd.DataFrame = pd.DataFrame(results['results'])
+    base: pd.DataFrame = pd.DataFrame(baseline['results'])
+    
+    comparison: pd.DataFrame = base[key + [statistic]].merge(
+        current[key + [statistic]], on=key, suffixes=('_baseline', '_current')
+    )
+    
+    comparison['ratio'] = (
+        comparison[f'{statistic}_current'] / comparison[f'{statistic}_baseline']
+    )
+    
+    comparison['regression'] = comparison['ratio'] > 1 + tolerance
+    
+    return comparison
@@ -0,0 +1,632 @@
+'''
+Freeze indexia data into a read-only snapshot.
+
+'''
+from __future__ import annotations
+from indexia.indexia import Indexia
+from indexia.inquiry import Tabula
+from typing import Any, TYPE_CHECKING
+import json
+import os
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+    import sqlite3
+
+
+class Apographon:
+    '''
+    Read-only columnar snapshot of the hierarchy of an
+    indexia database, memory-mapped from disk.
+    
+    '''
+    version: int = 1
+    
+    def __init__(
+        self,
+        snapshot_dir: str
+    ) -> None:
+        '''
+        Open a snapshot written by freeze.
+        
+        Each species has a code in the species table of the
+        snapshot, & three arrays named by its code: the ids
+        of its beings in ascending order (id), the id of the
+        creator of each being (parent, -1 if the species has
+        no creator), & the positions of the beings ordered
+        by creator id (order). The expressions of all beings
+        are kept in one UTF-8 buffer, sliced by the offsets
+        array of each species. Arrays are memory-mapped when
+        first used, so opening a snapshot reads only its
+        species table.
+        
+        Parameters
+        ----------
+        snapshot_dir : str
+            Directory of the snapshot.
+        
+        Raises
+        ------
+        ValueError
+            If snapshot_dir holds no snapshot, or a snapshot
+            of another version, raise a ValueError.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        table_path: str = os.path.join(snapshot_dir, 'species.json')
+        
+        if not os.path.isfile(table_path):
+            raise ValueError(f'Found no snapshot in {snapshot_dir}.')
+        
+        with open(table_path) as table_file:
+            table: dict[str, Any] = json.load(table_file)
+        
+        if table['version'] != self.version:
+            raise ValueError(' '.join([
+                f'Snapshot version must be {self.version}.',
+                f"Found {table['version']}."
+            ]))
+        
+        self.snapshot_dir: str = snapshot_dir
+        self.species: list[dict[str, Any]] = table['species']
+        self.codes: dict[str, int] = {s['name']: s['code'] for s in self.species}
+        self.arrays: dict[tuple[int, str], numpy.ndarray] = {}
+        self.buffer: numpy.ndarray | None = None
+    
+    @classmethod
+    def freeze(
+        cls,
+        db: str,
+        snapshot_dir: str,
+        **options: Any
+    ) -> Apographon:
+        '''
+        Write a snapshot of a database.
+        
+        Each table is read once, with expressions decoded
+        as described in indexia.indexia.Indexia.get_source.
+        The species table is written last, so an interrupted
+        snapshot cannot be opened.
+        
+        Parameters
+        ----------
+        db : str
+            Path to the indexia database file.
+        snapshot_dir : str
+            Directory in which to write the snapshot. Files
+            of an earlier snapshot are replaced.
+        **options : Any
+            Keyword arguments passed to the
+            indexia.indexia.Indexia instance created.
+        
+        Returns
+        -------
+        snapshot : Apographon
+            The written snapshot.
+        
+        '''
+        import numpy
+        
+        os.makedirs(snapshot_dir, exist_ok=True)
+        table_path: str = os.path.join(snapshot_dir, 'species.json')
+        
+        if os.path.isfile(table_path):
+            os.remove(table_path)
+        
+        species: list[dict[str, Any]] = []
+        written: int = 0
+        
+        with Indexia(db, **options) as ix, open(
+            os.path.join(snapshot_dir, 'expressions.bin'), 'wb'
+        ) as buffer:
+            cnxn: sqlite3.Connection = ix.open_cnxn(ix.db)
+            
+            for code, kind in enumerate(ix.get_all_tables(cnxn)):
+                genus: str | None = ix.get_creator_genus(cnxn, kind)
+                trait: str
+                trait_type: str
+                trait, trait_type = ix.describe_trait(cnxn, kind)
+                parent: str = f'{genus}_id' if genus else '-1'
+                
+                beings: pandas.DataFrame = ix.get_df(cnxn, ' '.join([
+                    f'SELECT id, {parent} AS parent, {trait} AS expression',
+                    f'FROM {ix.get_source(cnxn, kind)} ORDER BY id'
+                ]))
+                
+                encoded: list[bytes] = [str(e).encode() for e in beings.expression]
+                offsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+                offsets[1:] = numpy.cumsum([len(e) for e in encoded], dtype=numpy.int64)
+                buffer.write(b''.join(encoded))
+                ids = beings.id.to_numpy(dtype=numpy.int64)
+                parents = beings.parent.to_numpy(dtype=numpy.int64)
+                
+                for name, array in [
+                    ('id', ids),
+                    ('parent', parents),
+                    ('order', numpy.argsort(parents, kind='stable')),
+                    ('offsets', offsets + written)
+                ]:
+                    numpy.save(cls.get_path(snapshot_dir, code, name), array)
+                
+                written += int(offsets[-1])
+                
+                species += [{
+                    'code': code,
+                    'name': kind,
+                    'genus': genus,
+                    'trait': trait,
+                    'trait_type': trait_type,
+                    'count': len(encoded)
+                }]
+        
+        with open(table_path, 'w') as table_file:
+            json.dump({'version': cls.version, 'species': species}, table_file)
+        
+        snapshot: Apographon = cls(snapshot_dir)
+        
+        return snapshot
+    
+    @staticmethod
+    def get_path(
+        snapshot_dir: str,
+        code: int,
+        name: str
+    ) -> str:
+        '''
+        Get the path of an array of a species.
+        
+        Parameters
+        ----------
+        snapshot_dir : str
+            Directory of the snapshot.
+        code : int
+            Code of the species.
+        name : str
+            Name of the array ('id', 'parent', 'order' or
+            'offsets').
+        
+        Returns
+        -------
+        file_path : str
+            Path of the .npy file.
+        
+        '''
+        file_path: str = os.path.join(snapshot_dir, f'{code}_{name}.npy')
+        
+        return file_path
+    
+    def get_species(
+        self,
+        kind: str
+    ) -> dict[str, Any]:
+        '''
+        Get the entry of a species in the species table.
+        
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+        
+        Raises
+        ------
+        ValueError
+            If the snapshot has no such species, raise a
+            ValueError.
+        
+        Returns
+        -------
+        entry : dict[str, Any]
+            Code, name, genus, trait, trait type & count of
+            beings of the species.
+        
+        '''
+        if kind not in self.codes:
+            raise ValueError(f'Found no species {kind} in snapshot.')
+        
+        entry: dict[str, Any] = self.species[self.codes[kind]]
+        
+        return entry
+    
+    def get_array(
+        self,
+        kind: str,
+        name: str
+    ) -> numpy.ndarray:
+        '''
+        Get a memory-mapped array of a species.
+        
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+        name : str
+            Name of the array ('id', 'parent', 'order' or
+            'offsets').
+        
+        Returns
+        -------
+        array : numpy.ndarray
+            The read-only array.
+        
+        '''
+        import numpy
+        
+        key: tuple[int, str] = (self.get_species(kind)['code'], name)
+        
+        if key not in self.arrays:
+            self.arrays[key] = numpy.load(
+                self.get_path(self.snapshot_dir, *key), mmap_mode='r'
+            )
+        
+        array: numpy.ndarray = self.arrays[key]
+        
+        return array
+    
+    def get_creature_species(
+        self,
+        genus: str
+    ) -> list[str]:
+        '''
+        Get the names of the creature tables of a genus.
+        
+        Parameters
+        ----------
+        genus : str
+            Name of the creator table.
+        
+        Returns
+        -------
+        species : list[str]
+            Names of the creature tables.
+        
+        '''
+        species: list[str] = [
+            s['name'] for s in self.species if s['genus'] == genus
+        ]
+        
+        return species
+    
+    def locate(
+        self,
+        kind: str,
+        ids: Any
+    ) -> numpy.ndarray:
+        '''
+        Get the positions of beings in the arrays of their
+        species, by binary search of the id array.
+        
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+        ids : Any
+            Array-like of being ids.
+        
+        Returns
+        -------
+        positions : numpy.ndarray
+            Position of each id, or -1 if it is not in the
+            snapshot.
+        
+        '''
+        import numpy
+        
+        id_array: numpy.ndarray = self.get_array(kind, 'id')
+        wanted = numpy.asarray(ids, dtype=numpy.int64)
+        found = numpy.searchsorted(id_array, wanted)
+        clipped = numpy.minimum(found, max(id_array.shape[0] - 1, 0))
+        
+        positions: numpy.ndarray = numpy.where(
+            (found < id_array.shape[0]) & (id_array[clipped] == wanted), found, -1
+        ) if id_array.shape[0] else numpy.full(wanted.shape, -1)
+        
+        return positions
+    
+    def find_creatures(
+        self,
+        genus: str,
+        ids: Any
+    ) -> list[tuple[str, numpy.ndarray, numpy.ndarray]]:
+        '''
+        Find the creatures of many creators, by binary
+        search of the ordered parent array of each species.
+        
+        Parameters
+        ----------
+        genus : str
+            Name of the creator table.
+        ids : Any
+            Array-like of creator ids.
+        
+        Returns
+        -------
+        creatures : list[tuple[str, numpy.ndarray, numpy.ndarray]]
+            One three-tuple per creature table, holding its
+            name, the positions of the creatures found, &
+            the position in ids of the creator of each.
+            Creatures are grouped by creator, in the order
+            of ids.
+        
+        '''
+        import numpy
+        
+        wanted = numpy.asarray(ids, dtype=numpy.int64)
+        creatures: list[tuple[str, numpy.ndarray, numpy.ndarray]] = []
+        
+        for kind in self.get_creature_species(genus):
+            order: numpy.ndarray = self.get_array(kind, 'order')
+            parents = self.get_array(kind, 'parent')[order]
+            left = numpy.searchsorted(parents, wanted, side='left')
+            counts = numpy.searchsorted(parents, wanted, side='right') - left
+            starts = numpy.cumsum(counts) - counts
+            
+            within = numpy.arange(int(counts.sum())) - numpy.repeat(starts, counts)
+            positions = order[numpy.repeat(left, counts) + within]
+            sources = numpy.repeat(numpy.arange(wanted.shape[0]), counts)
+            
+            creatures += [(kind, positions, sources)]
+        
+        return creatures
+    
+    def get_expressions(
+        self,
+        kind: str,
+        positions: Any
+    ) -> list[Any]:
+        '''
+        Decode the expressions of beings from the UTF-8
+        buffer. Expressions of INTEGER, TIMESTAMP & REAL
+        traits are converted back to numbers.
+        
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+        positions : Any
+            Array-like of positions returned by locate or
+            find_creatures.
+        
+        Returns
+        -------
+        expressions : list[Any]
+            The expression of each being.
+        
+        '''
+        import numpy
+        
+        if self.buffer is None:
+            buffer_path: str = os.path.join(self.snapshot_dir, 'expressions.bin')
+            
+            self.buffer = numpy.memmap(
+                buffer_path, dtype=numpy.uint8, mode='r'
+            ) if os.path.getsize(buffer_path) else numpy.zeros(0, dtype=numpy.uint8)
+        
+        buffer: numpy.ndarray = self.buffer
+        offsets: numpy.ndarray = self.get_array(kind, 'offsets')
+        trait_type: str = self.get_species(kind)['trait_type']
+        
+        convert: Any = {
+            'INTEGER': int, 'TIMESTAMP': int, 'REAL': float
+        }.get(Tabula.get_trait_dtype(trait_type), str)
+        
+        expressions: list[Any] = [
+            convert(buffer[offsets[p]:offsets[p + 1]].tobytes().decode())
+            for p in numpy.asarray(positions, dtype=numpy.int64)
+        ]
+        
+        return expressions
+    
+    def get_beings(
+        self,
+        kind: str,
+        positions: Any
+    ) -> pandas.DataFrame:
+        '''
+        Get beings as a dataframe with the columns of their
+        table.
+        
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+        positions : Any
+            Array-like of positions returned by locate or
+            find_creatures.
+        
+        Returns
+        -------
+        beings : pandas.DataFrame
+            Dataframe of being data.
+        
+        '''
+        import pandas
+        
+        entry: dict[str, Any] = self.get_species(kind)
+        
+        beings: pandas.DataFrame = pandas.DataFrame(data={
+            'id': self.get_array(kind, 'id')[positions],
+            entry['trait']: self.get_expressions(kind, positions)
+        })
+        
+        if entry['genus']:
+            beings[f"{entry['genus']}_id"] = self.get_array(kind, 'parent')[positions]
+        
+        return beings
+    
+    def upward(
+        self,
+        species: str,
+        creature: pandas.DataFrame
+    ) -> list[tuple[str, pandas.DataFrame]]:
+        '''
+        Climb up one rung, as
+        indexia.schemata.ScalaNaturae.upward.
+        
+        Parameters
+        ----------
+        species : str
+            Name of the starting creature table.
+        creature : pandas.DataFrame
+            A dataframe of one or more creatures.
+        
+        Returns
+        -------
+        next_rung : list[tuple[str, pandas.DataFrame]]
+            List containing one tuple of (creator table
+            name, creator data), or an empty list if species
+            has no creator table. Creator data has one row
+            per creature found, with the index of creature.
+        
+        '''
+        genus: str | None = self.get_species(species)['genus']
+        
+        if not genus:
+            return []
+        
+        positions: numpy.ndarray = self.locate(species, creature.id)
+        found: numpy.ndarray = positions >= 0
+        parents: numpy.ndarray = self.get_array(species, 'parent')[positions[found]]
+        creator: pandas.DataFrame = self.get_beings(genus, self.locate(genus, parents))
+        creator.index = creature.index[found]
+        next_rung: list[tuple[str, pandas.DataFrame]] = [(genus, creator)]
+        
+        return next_rung
+    
+    def downward(
+        self,
+        genus: str,
+        creator: pandas.DataFrame
+    ) -> list[tuple[str, pandas.DataFrame]]:
+        '''
+        Climb down one rung, as
+        indexia.schemata.ScalaNaturae.downward, from every
+        row of creator.
+        
+        Parameters
+        ----------
+        genus : str
+            Name of the starting creator table.
+        creator : pandas.DataFrame
+            A dataframe of one or more creators.
+        
+        Returns
+        -------
+        next_rung : list[tuple[str, pandas.DataFrame]]
+            List of tuples of the form (species, creature),
+            where species is the name of a creature table &
+            creature is a dataframe of creature data.
+        
+        '''
+        next_rung: list[tuple[str, pandas.DataFrame]] = [
+            (kind, self.get_beings(kind, positions))
+            for kind, positions, _ in self.find_creatures(genus, creator.id)
+        ]
+        
+        return next_rung
+    
+    def assemble(
+        self,
+        genus: str,
+        creator_ids: list[int],
+        max_depth: int = 10
+    ) -> pandas.DataFrame:
+        '''
+        Assemble a corpus of creators, with the columns of
+        indexia.schemata.Corpus.assemble.
+        
+        The hierarchy is descended one generation at a time,
+        with one search per species of each generation.
+        Members are ordered as in
+        indexia.schemata.Corpus.make_body.
+        
+        Parameters
+        ----------
+        genus : str
+            Name of the creator table.
+        creator_ids : list[int]
+            IDs of the creators.
+        max_depth : int, optional
+            Maximum number of levels to descend. The default
+            is 10.
+        
+        Returns
+        -------
+        corpus : pandas.DataFrame
+            Dataframe representing all creatures of the
+            creators, up to the distance specified by
+            max_depth.
+        
+        '''
+        import numpy
+        import pandas
+        
+        columns: list[str] = [
+            'genus', 'creator_id', 'species',
+            'creature_id', 'trait', 'expression'
+        ]
+        
+        positions: numpy.ndarray = self.locate(genus, creator_ids)
+        positions = positions[positions >= 0]
+        trait: str = self.get_species(genus)['trait']
+        
+        head: pandas.DataFrame = pandas.DataFrame(data={
+            'genus': None,
+            'creator_id': None,
+            'species': genus,
+            'creature_id': self.get_array(genus, 'id')[positions],
+            'trait': trait,
+            'expression': self.get_expressions(genus, positions)
+        }, columns=columns)
+        
+        roots: dict[int, int] = {}
+        
+        for i, creator_id in enumerate(creator_ids):
+            roots.setdefault(int(creator_id), i)
+        
+        frontier: list[tuple[str, numpy.ndarray, numpy.ndarray]] = [(
+            genus, self.get_array(genus, 'id')[positions],
+            numpy.array([roots[int(i)] for i in head.creature_id], dtype=numpy.int64)
+        )]
+        
+        members: list[pandas.DataFrame] = []
+        
+        for depth in range(1, max_depth + 1):
+            next_frontier: list[tuple[str, numpy.ndarray, numpy.ndarray]] = []
+            
+            for kind, ids, root in frontier:
+                for species, found, sources in self.find_creatures(kind, ids):
+                    if not found.shape[0]:
+                        continue
+                    
+                    creature_ids: numpy.ndarray = self.get_array(species, 'id')[found]
+                    
+                    members += [pandas.DataFrame(data={
+                        'root': root[sources],
+                        'depth': depth,
+                        'genus': kind,
+                        'creator_id': ids[sources],
+                        'species': species,
+                        'creature_id': creature_ids,
+                        'trait': self.get_species(species)['trait'],
+                        'expression': self.get_expressions(species, found)
+                    })]
+                    
+                    next_frontier += [(species, creature_ids, root[sources])]
+            
+            frontier = next_frontier
+        
+        if not members:
+            return head
+        
+        body: pandas.DataFrame = pandas.concat(members, axis=0).sort_values(
+            by=['root', 'depth', 'species', 'creature_id'], kind='stable'
+        )[columns]
+        
+        corpus: pandas.DataFrame = pandas.concat([head, body], axis=0)
+        corpus.index = pandas.Index([i for i in range(corpus.shape[0])])
+        
+        return corpus
@@ -0,0 +1,251 @@
+'''
+Keep assembled indexia representations on disk.
+
+'''
+from __future__ import annotations
+from indexia.indexia import Indexia
+from indexia.inquiry import Tabula
+from typing import Any, TYPE_CHECKING
+import hashlib
+import json
+import os
+import pickle
+
+if TYPE_CHECKING:
+    import pandas
+    import sqlite3
+
+
+class Archeion:
+    '''
+    On-disk cache of assembled corpora & graphs, keyed
+    by database fingerprint & call parameters.
+    
+    '''
+    version: int = 1
+    
+    def __init__(
+        self,
+        cache_dir: str
+    ) -> None:
+        '''
+        Create an Archeion instance.
+        
+        Pass the instance to indexia.schemata.Corpus or
+        indexia.schemata.Diktua to keep their results in
+        cache_dir & reuse them while the database is
+        unchanged.
+        
+        Parameters
+        ----------
+        cache_dir : str
+            Directory in which results are pickled.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.cache_dir: str = cache_dir
+        self.hits: int = 0
+        self.misses: int = 0
+    
+    @staticmethod
+    def fingerprint(
+        db: str,
+        in_memory: bool = False
+    ) -> str:
+        '''
+        Get the fingerprint of a database's contents.
+        
+        The fingerprint is a hash of the maximum id of each
+        table & the greatest changelog sequence number, of
+        PRAGMA schema_version, & of the size & modification
+        time of the database file & its write-ahead log.
+        Each is read without scanning tables.
+        
+        If in_memory, the in-memory copy of the database 
+        (see indexia.indexia.Indexia.load) is fingerprinted 
+        instead, so that changes not yet written back to 
+        the file are seen. The file is then described as it 
+        was when copied, & commits to the copy since are 
+        detected with PRAGMA data_version (see 
+        indexia.indexia.Indexia.get_copy_state).
+        
+        Parameters
+        ----------
+        db : str
+            Path to the database file.
+        in_memory : bool, optional
+            Whether to fingerprint the in-memory copy of 
+            the database. The default is False.
+        
+        Returns
+        -------
+        fingerprint : str
+            Hexadecimal fingerprint.
+        
+        '''
+        with Indexia(db, in_memory=in_memory) as ix:
+            cnxn: sqlite3.Connection = ix.open_cnxn(ix.db)
+            tables: list[str] = ix.get_all_tables(cnxn)
+            
+            max_ids: list[Any] = ix.execute(cnxn, ' UNION ALL '.join([
+                f"SELECT '{t}', MAX(id) FROM {t}" for t in tables
+            ])).fetchall() if tables else []
+            
+            changelog: str = Tabula.get_changelog_table()[0]
+            
+            seq: int | None = ix.execute(
+                cnxn, f'SELECT MAX(seq) FROM {changelog}'
+            ).fetchone()[0] if ix.has_table(cnxn, changelog) else None
+            
+            schema_version: int = ix.execute(
+                cnxn, 'PRAGMA schema_version'
+            ).fetchone()[0]
+            
+            copy: dict[str, Any] | None = ix.get_copy_state() if in_memory else None
+        
+        files: list[list[int] | None] = [
+            [os.stat(f).st_size, os.stat(f).st_mtime_ns]
+            if os.path.isfile(f) else None for f in [db, f'{db}-wal']
+        ]
+        
+        state: dict[str, Any] = {
+            'tables': [list(m) for m in max_ids],
+            'seq': seq,
+            'schema_version': schema_version,
+            'files': files if copy is None else copy
+        }
+        
+        fingerprint: str = hashlib.sha256(
+            json.dumps(state, sort_keys=True).encode()
+        ).hexdigest()
+        
+        return fingerprint
+    
+    @staticmethod
+    def hash_frame(
+        df: pandas.DataFrame
+    ) -> str:
+        '''
+        Get a hash of a dataframe's values & columns.
+        
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            A dataframe.
+        
+        Returns
+        -------
+        digest : str
+            Hexadecimal hash.
+        
+        '''
+        import pandas
+        
+        digest = hashlib.sha256(json.dumps(list(map(str, df.columns))).encode())
+        digest.update(pandas.util.hash_pandas_object(df, index=False).values.tobytes())
+        
+        return digest.hexdigest()
+    
+    def get_path(
+        self,
+        kind: str,
+        params: dict[str, Any]
+    ) -> str:
+        '''
+        Get the path of a cached result.
+        
+        Parameters
+        ----------
+        kind : str
+            Kind of result (e.g., 'corpus' or 'diktua').
+        params : dict[str, Any]
+            Parameters that determine the result, including
+            the fingerprint of its source.
+        
+        Returns
+        -------
+        file_path : str
+            Path of the pickled result.
+        
+        '''
+        key: str = hashlib.sha256(json.dumps(
+            {'version': self.version, 'kind': kind, 'params': params},
+            sort_keys=True, default=str
+        ).encode()).hexdigest()
+        
+        file_path: str = os.path.join(self.cache_dir, f'{kind}_{key}.pkl')
+        
+        return file_path
+    
+    def load(
+        self,
+        kind: str,
+        params: dict[str, Any]
+    ) -> Any:
+        '''
+        Load a cached result.
+        
+        Parameters
+        ----------
+        kind : str
+            Kind of result.
+        params : dict[str, Any]
+            Parameters that determine the result.
+        
+        Returns
+        -------
+        result : Any
+            The cached result, or None if it is not cached.
+        
+        '''
+        file_path: str = self.get_path(kind, params)
+        
+        if not os.path.isfile(file_path):
+            self.misses += 1
+            
+            return None
+        
+        with open(file_path, 'rb') as cached:
+            result: Any = pickle.load(cached)
+        
+        self.hits += 1
+        
+        return result
+    
+    def store(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        result: Any
+    ) -> str:
+        '''
+        Cache a result.
+        
+        Parameters
+        ----------
+        kind : str
+            Kind of result.
+        params : dict[str, Any]
+            Parameters that determine the result.
+        result : Any
+            The result to cache.
+        
+        Returns
+        -------
+        file_path : str
+            Path of the pickled result.
+        
+        '''
+        os.makedirs(self.cache_dir, exist_ok=True)
+        file_path: str = self.get_path(kind, params)
+        partial_path: str = f'{file_path}.{os.getpid()}.partial'
+        
+        with open(partial_path, 'wb') as partial:
+            pickle.dump(result, partial)
+        
+        os.replace(partial_path, file_path)
+        
+        return file_path
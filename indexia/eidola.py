@@ -2,12 +2,23 @@
 Make sample creators & creatures.
 
 '''
+from __future__ import annotations
 from indexia.indexia import Indexia
+from indexia.inquiry import Tabula
 from datetime import datetime as dt, timedelta as td
-from typing import Any
+from typing import Any, TYPE_CHECKING
+import hashlib
+import itertools
+import json
+import os
 import random
 import sqlite3
-import pandas
+
+if TYPE_CHECKING:
+    import pandas
+
+
+Fanout = str | tuple[str, float]
 
 
 class Maker:
@@ -15,12 +26,21 @@ class Maker:
     Fashion any number of creators & creatures for testing.
     
     '''
+    distributions: list[str] = ['fixed', 'uniform', 'zipf']
+    version: int = 1
+    
     def __init__(
         self,
         test_db: str,
         species_per_genus: int,
         num_beings: int,
-        trait: str
+        trait: str,
+        bulk: bool = False,
+        depth: int = 3,
+        fanout: Fanout | list[Fanout] = 'fixed',
+        species_sizes: dict[str, int] | None = None,
+        seed: int = 0,
+        cache_dir: str | None = None
     ) -> None:
         '''
         Create a Maker instance.
@@ -36,16 +56,349 @@ class Maker:
             Number of creature records to be created.
         trait : str
             Text attribute of the creatures.
+        bulk : bool, optional
+            If True, write each table with a single 
+            executemany statement under the 'bulk_load' 
+            profile, instead of adding beings one at a 
+            time with get_or_create. Use to generate large 
+            databases quickly. The default is False.
+        depth : int, optional
+            Number of generations of creature tables below 
+            the creator table. The default is 3.
+        fanout : Fanout | list[Fanout], optional
+            Distribution of creatures over their creators, 
+            either for all generations or as a list with 
+            one entry per generation. Each entry is one of 
+            'fixed' (the i-th creature belongs to the i-th 
+            creator, wrapping around), 'uniform' (creators 
+            are drawn uniformly at random), or 'zipf' (the 
+            creator of rank r is drawn with probability 
+            proportional to 1 / r^s). A tuple ('zipf', s) 
+            sets the exponent s, which is otherwise 1. The 
+            default is 'fixed'.
+        species_sizes : dict[str, int] | None, optional
+            Number of beings in named tables. Tables not 
+            named have num_beings beings. The default is None.
+        seed : int, optional
+            Seed of the random draws made by the 'uniform' 
+            & 'zipf' fanouts. The default is 0.
+        cache_dir : str | None, optional
+            Directory in which made databases are cached, 
+            keyed by a hash of the parameters that determine 
+            their contents & Maker.version. If a cached 
+            database exists, make restores it with the 
+            SQLite backup API instead of rebuilding it. If 
+            None, databases are not cached. The default is 
+            None.
+
+        Raises
+        ------
+        ValueError
+            If fanout names an unknown distribution, or is 
+            a list whose length differs from depth, raise a 
+            ValueError.
 
         Returns
         -------
         None.
 
         '''
+        fanouts: list[Fanout] = fanout if isinstance(
+            fanout, list
+        ) else [fanout] * depth
+        
+        if len(fanouts) != depth:
+            raise ValueError(
+                f'Expected {depth} fanouts, found {len(fanouts)}.'
+            )
+        
+        for f in fanouts:
+            if self.get_distribution(f)[0] not in self.distributions:
+                raise ValueError(' '.join([
+                    f'Found no fanout distribution {f}.',
+                    f'Expected one of {self.distributions}.'
+                ]))
+        
         self.test_db: str = test_db
         self.species_per_genus: int = species_per_genus
         self.num_beings: int = num_beings
         self.trait: str = trait
+        self.bulk: bool = bulk
+        self.depth: int = depth
+        self.fanouts: list[Fanout] = fanouts
+        self.species_sizes: dict[str, int] = species_sizes or {}
+        self.seed: int = seed
+        self.cache_dir: str | None = cache_dir
+        self.rng = random.Random(seed)
+    
+    @staticmethod
+    def get_distribution(
+        fanout: Fanout
+    ) -> tuple[str, float]:
+        '''
+        Split a fanout into its distribution & parameter.
+
+        Parameters
+        ----------
+        fanout : Fanout
+            A fanout distribution name, or a tuple of a 
+            name & parameter.
+
+        Returns
+        -------
+        distribution : tuple[str, float]
+            Name of the distribution & its parameter. The 
+            parameter defaults to 1.
+
+        '''
+        if isinstance(fanout, tuple):
+            return fanout[0], float(fanout[1])
+        
+        return fanout, 1.0
+    
+    def get_cache_key(
+        self
+    ) -> str:
+        '''
+        Get the cache key of the instance's database.
+        
+        The key is a hash of the parameters that determine 
+        the contents of the database, & of Maker.version, 
+        which changes whenever the generated data changes.
+
+        Returns
+        -------
+        key : str
+            Hexadecimal cache key.
+
+        '''
+        params: dict[str, Any] = {
+            'version': self.version,
+            'species_per_genus': self.species_per_genus,
+            'num_beings': self.num_beings,
+            'trait': self.trait,
+            'depth': self.depth,
+            'fanouts': [self.get_distribution(f) for f in self.fanouts],
+            'species_sizes': self.species_sizes,
+            'seed': self.seed
+        }
+        
+        key: str = hashlib.sha256(
+            json.dumps(params, sort_keys=True).encode()
+        ).hexdigest()
+        
+        return key
+    
+    def get_cache_path(
+        self
+    ) -> str | None:
+        '''
+        Get the path of the instance's cached database.
+
+        Returns
+        -------
+        cache_path : str | None
+            Path of the cached database file, or None if 
+            the instance has no cache_dir.
+
+        '''
+        if not self.cache_dir:
+            return None
+        
+        cache_path: str = os.path.join(
+            self.cache_dir, f'maker_{self.get_cache_key()}.db'
+        )
+        
+        return cache_path
+    
+    def store(
+        self
+    ) -> str:
+        '''
+        Copy the instance's database into the cache.
+
+        Raises
+        ------
+        ValueError
+            If the instance has no cache_dir, raise a 
+            ValueError.
+
+        Returns
+        -------
+        cache_path : str
+            Path of the cached database file.
+
+        '''
+        cache_path: str | None = self.get_cache_path()
+        
+        if not cache_path:
+            raise ValueError('Caching requires a cache_dir.')
+        
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        partial_path: str = f'{cache_path}.{os.getpid()}.partial'
+        source: sqlite3.Connection = sqlite3.connect(self.test_db)
+        target: sqlite3.Connection = sqlite3.connect(partial_path)
+        
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        
+        os.replace(partial_path, cache_path)
+        
+        return cache_path
+    
+    def load(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> sqlite3.Connection:
+        '''
+        Copy the cached database into a connection, e.g. 
+        one to ':memory:'. If the database is not cached 
+        yet, it is made & cached first.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            Connection to the database that receives the 
+            copy. Its contents are replaced.
+
+        Raises
+        ------
+        ValueError
+            If the instance has no cache_dir, raise a 
+            ValueError.
+
+        Returns
+        -------
+        cnxn : sqlite3.Connection
+            The connection, holding the cached database.
+
+        '''
+        cache_path: str | None = self.get_cache_path()
+        
+        if not cache_path:
+            raise ValueError('Caching requires a cache_dir.')
+        
+        if not os.path.isfile(cache_path):
+            self.make()
+        
+        source: sqlite3.Connection = sqlite3.connect(cache_path)
+        
+        try:
+            source.backup(cnxn)
+        finally:
+            source.close()
+        
+        return cnxn
+    
+    def get_size(
+        self,
+        kind: str
+    ) -> int:
+        '''
+        Get the number of beings to make in a table.
+
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+
+        Returns
+        -------
+        size : int
+            Number of beings to make.
+
+        '''
+        size: int = self.species_sizes.get(kind, self.num_beings)
+        
+        return size
+    
+    def get_species_names(
+        self,
+        generation: int
+    ) -> list[str]:
+        '''
+        Get the names of the tables of a generation.
+
+        Parameters
+        ----------
+        generation : int
+            Number of the generation. The creator table is 
+            generation 0.
+
+        Returns
+        -------
+        names : list[str]
+            Table names, ordered as the tables are made.
+
+        '''
+        if not generation:
+            return ['creators']
+        
+        names: list[str] = [
+            '_'.join(['creatures', *[str(i) for i in suffix]])
+            for suffix in itertools.product(
+                range(self.species_per_genus), repeat=generation
+            )
+        ]
+        
+        return names
+    
+    def assign_creators(
+        self,
+        creator_ids: list[int],
+        num_creatures: int,
+        generation: int
+    ) -> list[int]:
+        '''
+        Draw the creator of each creature from the fanout 
+        distribution of a generation.
+
+        Parameters
+        ----------
+        creator_ids : list[int]
+            IDs of the available creators, in rank order.
+        num_creatures : int
+            Number of creatures to assign.
+        generation : int
+            Generation of the creatures (1 for the children 
+            of the creator table).
+
+        Returns
+        -------
+        assigned : list[int]
+            Creator ID of each creature.
+
+        '''
+        distribution: str
+        exponent: float
+        
+        distribution, exponent = self.get_distribution(
+            self.fanouts[generation - 1]
+        )
+        
+        if distribution == 'uniform':
+            assigned: list[int] = self.rng.choices(
+                creator_ids, k=num_creatures
+            )
+        elif distribution == 'zipf':
+            weights: list[float] = [
+                1 / (rank ** exponent) for rank in range(
+                    1, len(creator_ids) + 1
+                )
+            ]
+            
+            assigned = self.rng.choices(
+                creator_ids, weights=weights, k=num_creatures
+            )
+        else:
+            assigned = [
+                creator_ids[i % len(creator_ids)] for i in range(num_creatures)
+            ]
+        
+        return assigned
         
     def make_creators(
         self,
@@ -56,8 +409,8 @@ class Maker:
         '''
         Make creator beings.
         
-        The number of beings specified by num_beings
-        will be created in a table named genus.
+        The number of beings given by get_size will be 
+        created in a table named genus.
 
         Parameters
         ----------
@@ -74,13 +427,24 @@ class Maker:
             Dataframe of creator data.
 
         '''
-        for i in range(self.num_beings):
-            ix.add_creator(
-                cnxn, genus, 
-                self.trait, f'{genus}_{i}'
-            )
+        size: int = self.get_size(genus)
+        
+        if self.bulk:
+            dtype: dict[str, str] = Tabula.get_creator_table(
+                genus, self.trait
+            )[1]
             
-        sql = 'SELECT * FROM creators;'
+            ix.bulk_insert(cnxn, genus, dtype, [self.trait], [
+                (f'{genus}_{i}',) for i in range(size)
+            ])
+        else:
+            for i in range(size):
+                ix.add_creator(
+                    cnxn, genus, 
+                    self.trait, f'{genus}_{i}'
+                )
+            
+        sql = f'SELECT * FROM {genus};'
         creators: pandas.DataFrame = ix.get_df(cnxn, sql)
         
         return creators
@@ -90,13 +454,16 @@ class Maker:
         ix: Indexia,
         cnxn: sqlite3.Connection,
         genus: str,
-        species: str
+        species: str,
+        generation: int = 1
     ) -> pandas.DataFrame:
         '''
         Make sample creatures with a given genus & species.
         
-        A creature table named species is created, & num_beings 
-        creature records are added to the table. Each creature 
+        A creature table named species is created, & the 
+        number of creature records given by get_size are 
+        added to the table. Creators are assigned by the 
+        fanout distribution of the generation. Each creature 
         has the attribute trait.
     
         Parameters
@@ -109,6 +476,10 @@ class Maker:
             Name of the creator (parent) table.
         species : str
             Name of the creature (child) table.
+        generation : int, optional
+            Generation of the creature table (1 for the 
+            children of the creator table). The default 
+            is 1.
     
         Returns
         -------
@@ -116,13 +487,35 @@ class Maker:
             Dataframe of creature data.
     
         '''
-        for i in range(self.num_beings):
-            creator: pandas.DataFrame = ix.get_by_id(cnxn, genus, i + 1)
+        creator_ids: list[int] = [
+            int(i) for i in ix.get_df(
+                cnxn, f'SELECT id FROM {genus} ORDER BY id;'
+            ).id
+        ]
+        
+        creature_creators: list[int] = self.assign_creators(
+            creator_ids, self.get_size(species), generation
+        )
+        
+        if self.bulk:
+            dtype: dict[str, str] = Tabula.get_creature_table(
+                genus, species, self.trait
+            )[1]
             
-            ix.add_creature(
-                cnxn, genus, creator, 
-                species, self.trait, f'{species}_{i}'
+            ix.bulk_insert(
+                cnxn, species, dtype, [self.trait, f'{genus}_id'], [
+                    (f'{species}_{i}', creator_id) 
+                    for i, creator_id in enumerate(creature_creators)
+                ]
             )
+        else:
+            for i, creator_id in enumerate(creature_creators):
+                creator: pandas.DataFrame = ix.get_by_id(cnxn, genus, creator_id)
+                
+                ix.add_creature(
+                    cnxn, genus, creator, 
+                    species, self.trait, f'{species}_{i}'
+                )
         
         sql: str = f'SELECT * FROM {species};'
         creatures: pandas.DataFrame = ix.get_df(cnxn, sql)
@@ -134,15 +527,16 @@ class Maker:
         ix: Indexia,
         cnxn: sqlite3.Connection,
         genus: str,
-        species_prefix: str
+        species_prefix: str,
+        generation: int = 1
     ) -> list[pandas.DataFrame]:
         '''
         Make one or more species of a given genus.
         
         The number of species created for in the genus is 
         given by species_per_genus. For each species created,
-        num_beings creature records are added to the species, 
-        each having the attribute trait.
+        creature records are added to the species, each 
+        having the attribute trait.
     
         Parameters
         ----------
@@ -154,8 +548,10 @@ class Maker:
             Name of the creator (parent) table.
         species_prefix : str
             Prefix of the creature (child) table names.
-        species : str
-            Name of the creature (child) table.
+        generation : int, optional
+            Generation of the creature tables (1 for the 
+            children of the creator table). The default 
+            is 1.
     
         Returns
         -------
@@ -167,117 +563,106 @@ class Maker:
         
         for i in range(self.species_per_genus):
             species_name: str = f'{species_prefix}_{i}'
-            species += [self.make_creatures(ix, cnxn, genus, species_name)]
+            
+            species += [self.make_creatures(
+                ix, cnxn, genus, species_name, generation
+            )]
             
         return species
         
     def make(
         self
-    ) -> tuple[list[pandas.DataFrame], list[pandas.DataFrame], list[pandas.DataFrame], list[pandas.DataFrame]]:
+    ) -> tuple[list[pandas.DataFrame], ...]:
         '''
         Make test data.
         
-        Makes a single creator table & 3 generations of 
-        creature tables. Each generation has species_per_genus 
-        tables, with num_beings creatures in each table. The 
-        creators & creatures all have the attribute trait.
+        Makes a single creator table & depth generations 
+        of creature tables. Each genus has species_per_genus 
+        species, so generation g has (species_per_genus)^g 
+        tables. The creators & creatures all have the 
+        attribute trait.
+        
+        If the instance has a cache_dir holding a database 
+        made with the same parameters, it is restored into 
+        test_db instead. Otherwise the database made is 
+        stored in the cache.
     
         Returns
         -------
-        fathers : list[pandas.DataFrame]
-            List containing a single dataframe of creator 
-            data.
-        sons : list[pandas.DataFrame]
-            List containing species_per_genus dataframes 
-            of creature data.
-        grandsons : list[pandas.DataFrame]
-            List containing (species_per_genus)^2 dataframes 
-            of creature data.
-        great_grandsons : list[pandas.DataFrame]
-            List containing (species_per_genus)^3 dataframes 
-            of creature data.
+        generations : tuple[list[pandas.DataFrame], ...]
+            One list of dataframes per generation. With the 
+            default depth of 3, these are fathers (a single 
+            dataframe of creator data), sons, grandsons & 
+            great_grandsons (species_per_genus, 
+            (species_per_genus)^2 & (species_per_genus)^3 
+            dataframes of creature data).
 
         '''
-        with Indexia(self.test_db) as ix:
+        cache_path: str | None = self.get_cache_path()
+        
+        if cache_path and os.path.isfile(cache_path):
+            target: sqlite3.Connection = sqlite3.connect(self.test_db)
+            
+            try:
+                self.load(target)
+            finally:
+                target.close()
+            
+            return self.get()
+        
+        profile: str = 'bulk_load' if self.bulk else 'default'
+        self.rng = random.Random(self.seed)
+        
+        with Indexia(self.test_db, profile=profile) as ix:
             cnxn: sqlite3.Connection = ix.open_cnxn(ix.db)
-            genus = 'creators'
-
-            fathers: list[pandas.DataFrame] = [
-                self.make_creators(ix, cnxn, genus)
+            
+            generations: list[list[pandas.DataFrame]] = [
+                [self.make_creators(ix, cnxn, 'creators')]
             ]
-
-            species_prefix: str = 'creatures'
-
-            sons: list[pandas.DataFrame] = self.make_species(
-                ix, cnxn, genus, species_prefix
-            )
-
-            grandsons: list[pandas.DataFrame] = []
             
-            for i in range(self.species_per_genus):
-                genus: str = f'creatures_{i}'
-                species_prefix = f'creatures_{i}'
+            for generation in range(1, self.depth + 1):
+                species: list[pandas.DataFrame] = []
                 
-                grandsons += self. make_species(
-                    ix, cnxn, genus, species_prefix
-                )
-                
-            great_grandsons: list[pandas.DataFrame] = []
-            
-            for i in range(self.species_per_genus):
-                for j in range(self.species_per_genus):
-                    genus = f'creatures_{i}_{j}'
-                    species_prefix = f'creatures_{i}_{j}'
+                for genus in self.get_species_names(generation - 1):
+                    species_prefix: str = 'creatures' if (
+                        generation == 1
+                    ) else genus
                     
-                    great_grandsons += self.make_species(
-                        ix, cnxn, genus, species_prefix
+                    species += self.make_species(
+                        ix, cnxn, genus, species_prefix, generation
                     )
+                
+                generations += [species]
+        
+        if cache_path:
+            self.store()
                                 
-        return fathers, sons, grandsons, great_grandsons
+        return tuple(generations)
     
     def get(
         self
-    ) -> tuple[list[pandas.DataFrame], list[pandas.DataFrame], list[pandas.DataFrame], list[pandas.DataFrame]]:
+    ) -> tuple[list[pandas.DataFrame], ...]:
         '''
         Get test data.
 
         Returns
         -------
-        fathers : list[pandas.DataFrame]
-            List containing a single dataframe of creator 
-            data.
-        sons : list[pandas.DataFrame]
-            List containing species_per_genus dataframes 
-            of creature data.
-        grandsons : list[pandas.DataFrame]
-            List containing (species_per_genus)^2 dataframes 
-            of creature data.
-        great_grandsons : list[pandas.DataFrame]
-            List containing (species_per_genus)^3 dataframes 
-            of creature data.
+        generations : tuple[list[pandas.DataFrame], ...]
+            One list of dataframes per generation, ordered 
+            as returned by make.
 
         '''
         with Indexia(self.test_db) as ix:
             cnxn: sqlite3.Connection = ix.open_cnxn(ix.db)
-            sql = 'SELECT * FROM creators;'
-            fathers: list[pandas.DataFrame] = [ix.get_df(cnxn, sql)]
-            sons: list[pandas.DataFrame] = []
-            grandsons: list[pandas.DataFrame]  = []
-            great_grandsons: list[pandas.DataFrame]  = []
             
-            for i in range(self.species_per_genus):
-                sql: str = f'SELECT * FROM creatures_{i};'
-                sons += [ix.get_df(cnxn, sql)]
-                
-                for j in range(self.species_per_genus):
-                    sql = f'SELECT * FROM creatures_{i}_{j};'
-                    grandsons += [ix.get_df(cnxn, sql)]
-                    
-                    for k in range(self.species_per_genus):
-                        sql = f'SELECT * FROM creatures_{i}_{j}_{k};'
-                        great_grandsons += [ix.get_df(cnxn, sql)]
+            generations: tuple[list[pandas.DataFrame], ...] = tuple(
+                [
+                    ix.get_df(cnxn, f'SELECT * FROM {kind};') 
+                    for kind in self.get_species_names(generation)
+                ] for generation in range(self.depth + 1)
+            )
                         
-            return fathers, sons, grandsons, great_grandsons
+            return generations
 
 
 class Templates:
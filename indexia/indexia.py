@@ -2,11 +2,19 @@
 Defines core operations on indexia objects.
 
 '''
+from __future__ import annotations
 from indexia.inquiry import Inquiry, Tabula
-from typing import Any
+from typing import Any, TYPE_CHECKING
 import os
 import sqlite3
-import pandas
+import hashlib
+import time
+
+if TYPE_CHECKING:
+    from indexia.mensura import Mensura
+    from indexia.mneme import Mneme
+    from indexia.thesaurus import Thesaurus
+    import pandas
 
 
 class Indexia:
@@ -15,8 +23,43 @@ class Indexia:
     indexia objects.
     
     '''
+    profiles: dict[str, dict[str, Any]] = {
+        'default': {},
+        'read_heavy': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -65536,
+            'mmap_size': 268435456,
+            'temp_store': 'MEMORY',
+            'busy_timeout': 5000
+        },
+        'bulk_load': {
+            'journal_mode': 'WAL',
+            'synchronous': 'OFF',
+            'cache_size': -262144,
+            'mmap_size': 0,
+            'temp_store': 'MEMORY',
+            'busy_timeout': 30000
+        }
+    }
+    
+    max_params: int = 900
+    copies: dict[str, dict[str, Any]] = {}
+    
     def __init__(
-        self, db: str | None = None
+        self,
+        db: str | None = None,
+        profile: str = 'default',
+        mensura: Mensura | None = None,
+        closure: bool = False,
+        changelog: bool = False,
+        mneme: Mneme | None = None,
+        thesaurus: Thesaurus | None = None,
+        fulltext: bool | list[str] = False,
+        in_memory: bool = False,
+        write_back: bool | float = False,
+        backup_pages: int = -1,
+        backup_sleep: float = 0.25
     ) -> None:
         '''
         Create an indexia instance & build a path to 
@@ -26,18 +69,123 @@ class Indexia:
         ----------
         db : str, optional
             Path to a database file. The default is None.
+        profile : str, optional
+            Name of the pragma profile applied to each 
+            connection opened by the instance. Must be a 
+            key of Indexia.profiles. The 'default' profile 
+            keeps SQLite's own settings, 'read_heavy' 
+            enables WAL mode with a large page cache & 
+            memory-mapped reads, & 'bulk_load' trades 
+            durability for write throughput. The default 
+            is 'default'.
+        mensura : indexia.mensura.Mensura | None, optional
+            If supplied, every statement executed on the 
+            instance's connections is recorded by mensura. 
+            Statements run through get_df & execute are 
+            timed, & explained if slow. The default is None.
+        closure : bool, optional
+            If True, tables created by the instance get 
+            triggers maintaining the closure table, which 
+            holds one row per pair of a being & each of its 
+            ancestors. Triggers persist in the database file, 
+            so the closure table stays current for every 
+            later writer. See build_closure. The default is 
+            False.
+        changelog : bool, optional
+            If True, tables created by the instance get 
+            triggers appending each insert, update & delete 
+            of a being to the changelog table. See 
+            get_changes. The default is False.
+        mneme : indexia.mneme.Mneme | None, optional
+            If supplied, get_by_id & get_by_trait lookups 
+            are remembered by mneme & served from memory 
+            until a write through an Indexia instance sharing 
+            mneme affects them. Lookups are keyed by db, so 
+            that instances on different databases can share 
+            mneme. The default is None.
+        thesaurus : indexia.thesaurus.Thesaurus | None, optional
+            If supplied, results read by get_df are cached 
+            by thesaurus until the database changes. Queries 
+            made while a connection has uncommitted changes 
+            are not cached. The default is None.
+        fulltext : bool | list[str], optional
+            If True, tables created by the instance get 
+            triggers keeping the trait expressions of their 
+            beings in the full-text search table. If a list, 
+            only the listed tables get them. See search. The 
+            default is False.
+        in_memory : bool, optional
+            If True, the database file is copied into a 
+            shared in-memory database when a connection to 
+            db is first opened, & connections to db are 
+            opened on the copy. The copy is shared by all 
+            in_memory instances of the process open on the 
+            same file. See load. The default is False.
+        write_back : bool | float, optional
+            If True, changes made in memory are copied back 
+            to the database file when all connections are 
+            closed. If a positive number, they are also 
+            copied back after the first commit (see commit) 
+            at least that many seconds after the last copy. 
+            Writes made to the file by other connections in 
+            the meantime are overwritten. See flush. The default is False.
+        backup_pages : int, optional
+            Count of pages copied at each step of load & 
+            flush. The database file is only locked during 
+            each step, so that other processes can use it 
+            while a large database is copied. If 0 or less, 
+            the whole database is copied in one step. The 
+            default is -1.
+        backup_sleep : float, optional
+            Seconds to wait before retrying a step when the 
+            database file is busy or locked. The default is 
+            0.25.
+
+        Raises
+        ------
+        ValueError
+            If profile is not a known profile, or if 
+            write_back is a number that is not positive, 
+            raise a ValueError.
 
         Returns
         -------
         None.
 
         '''
+        if profile not in self.profiles:
+            raise ValueError(' '.join([
+                f'Found no profile {profile}.',
+                f'Expected one of {list(self.profiles.keys())}.'
+            ]))
+        
+        if not isinstance(write_back, bool) and write_back <= 0:
+            raise ValueError(f'write_back interval must be positive. Found {write_back}.')
+        
+        self.profile: str = profile
+        self.mensura: Mensura | None = mensura
+        self.closure: bool = closure
+        self.changelog: bool = changelog
+        self.mneme: Mneme | None = mneme
+        self.thesaurus: Thesaurus | None = thesaurus
+        self.fulltext: bool | list[str] = fulltext
+        self.in_memory: bool = in_memory
+        self.write_back: bool | float = write_back
+        self.backup_pages: int = backup_pages
+        self.backup_sleep: float = backup_sleep
+        self.memory: sqlite3.Connection | None = None
+        self.flushed: float = time.monotonic()
         self.cnxns: dict[str, list[sqlite3.Connection]] = {}
+        self.columns: dict[tuple[sqlite3.Connection, str], pandas.DataFrame] = {}
         
         self.db: str = db if db else os.path.join(
             os.path.abspath(__file__),
             '..', 'data', 'indexia.db'
         )
+        
+        digest: str = hashlib.sha256(os.path.abspath(self.db).encode()).hexdigest()
+        self.uri: str = f'file:indexia_{digest}?mode=memory&cache=shared'
+        self.lookup_db: str = self.uri if in_memory else os.path.abspath(self.db)
     
     def __enter__(
         self
@@ -78,7 +226,9 @@ class Indexia:
         self, db: str
     ) -> sqlite3.Connection:
         '''
-        Open a connection to a database.
+        Open a connection to a database. If the instance 
+        is in_memory & db is its database, the connection 
+        is opened on the in-memory copy.
 
         Parameters
         ----------
@@ -91,9 +241,20 @@ class Indexia:
             Connection to the database.
 
         '''
-        cnxn: sqlite3.Connection = sqlite3.connect(db)
+        if self.in_memory and db == self.db:
+            self.load()
+            cnxn: sqlite3.Connection = sqlite3.connect(self.uri, uri=True)
+        else:
+            cnxn = sqlite3.connect(db)
+        
         cnxn.execute('PRAGMA foreign_keys = 1')
         
+        for pragma, value in self.profiles[self.profile].items():
+            cnxn.execute(Inquiry.pragma(pragma, value))
+        
+        if self.mensura:
+            cnxn.set_trace_callback(self.mensura.trace)
+        
         if db in self.cnxns.keys():
             self.cnxns[db] += [cnxn]
         else:
@@ -120,13 +281,49 @@ class Indexia:
         for cnxn in self.cnxns[db]:
             cnxn.close()
         
+        self.columns = {
+            k: v for k, v in self.columns.items() if k[0] not in self.cnxns[db]
+        }
+        
         self.cnxns[db] = []
     
+    def get_db(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> str | None:
+        '''
+        Get the database file of a connection opened by 
+        the instance.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+
+        Returns
+        -------
+        db : str | None
+            Path to the database file, or None if the 
+            connection was not opened by the instance or 
+            is to an in-memory database (including the 
+            copy of an in_memory instance).
+
+        '''
+        for db, cnxns in self.cnxns.items():
+            if any(c is cnxn for c in cnxns):
+                in_memory: bool = db == ':memory:' or (self.in_memory and db == self.db)
+                
+                return db if db and not in_memory else None
+        
+        return None
+    
     def close_all_cnxns(
         self
     ) -> None:
         '''
-        Close all database connections.
+        Close all database connections. If the instance is 
+        in_memory, write changes back to the database file 
+        if write_back is set, & discard the in-memory copy.
 
         Returns
         -------
@@ -135,13 +332,183 @@ class Indexia:
         '''
         for db in self.cnxns:
             self.close_cnxn(db)
+        
+        if self.memory is None:
+            return
+        
+        if self.write_back is not False:
+            self.flush()
+        
+        self.memory.close()
+        self.memory = None
+        copy: dict[str, Any] = Indexia.copies[self.uri]
+        copy['instances'] -= 1
+        
+        if not copy['instances']:
+            copy['watcher'].close()
+            del Indexia.copies[self.uri]
+    
+    def load(
+        self
+    ) -> sqlite3.Connection:
+        '''
+        Copy the database file into memory with the SQLite 
+        backup API, unless it has already been copied.
+        
+        The instance keeps a connection to the copy, so that 
+        it persists until close_all_cnxns is called. If 
+        another in_memory instance holds a copy of the same 
+        file, the copy is reused, & the file is not read 
+        again. Keep one instance open while running jobs 
+        that open many instances (e.g., 
+        indexia.schemata.Corpus with in_memory=True) so 
+        that the file is copied once. Copies are listed in 
+        Indexia.copies while any instance keeps them; see 
+        get_copy_state.
+
+        Raises
+        ------
+        ValueError
+            If the instance is not in_memory, raise a 
+            ValueError.
+
+        Returns
+        -------
+        memory : sqlite3.Connection
+            The connection kept to the in-memory copy.
+
+        '''
+        if not self.in_memory:
+            raise ValueError('Pass in_memory=True to load the database into memory.')
+        
+        if self.memory is None:
+            memory: sqlite3.Connection = sqlite3.connect(self.uri, uri=True)
+            
+            loaded: int = memory.execute(
+                'SELECT COUNT(*) FROM sqlite_master'
+            ).fetchone()[0]
+            
+            files: list[list[int] | None] | None = None
+            
+            if not loaded:
+                files = [
+                    [os.stat(f).st_size, os.stat(f).st_mtime_ns]
+                    if os.path.isfile(f) else None for f in [self.db, f'{self.db}-wal']
+                ]
+                
+                source: sqlite3.Connection = sqlite3.connect(self.db)
+                
+                try:
+                    source.backup(
+                        memory, pages=self.backup_pages, sleep=self.backup_sleep
+                    )
+                finally:
+                    source.close()
+            
+            if self.uri not in Indexia.copies:
+                watcher: sqlite3.Connection = sqlite3.connect(self.uri, uri=True)
+                
+                Indexia.copies[self.uri] = {
+                    'watcher': watcher,
+                    'instances': 0,
+                    'data_version': watcher.execute('PRAGMA data_version').fetchone()[0],
+                    'files': files,
+                    'token': os.urandom(16).hex()
+                }
+            
+            Indexia.copies[self.uri]['instances'] += 1
+            self.memory = memory
+            self.flushed = time.monotonic()
+        
+        return self.memory
+    
+    def flush(
+        self
+    ) -> None:
+        '''
+        Copy the in-memory database back to the database 
+        file with the SQLite backup API. Changes not yet 
+        committed are not copied.
+
+        Raises
+        ------
+        ValueError
+            If the instance is not in_memory, raise a 
+            ValueError.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not self.in_memory:
+            raise ValueError('Pass in_memory=True to flush the database to disk.')
+        
+        if self.memory is None:
+            return
+        
+        target: sqlite3.Connection = sqlite3.connect(self.db)
+        
+        try:
+            self.memory.backup(
+                target, pages=self.backup_pages, sleep=self.backup_sleep
+            )
+        finally:
+            target.close()
+        
+        self.flushed = time.monotonic()
+    
+    def get_copy_state(
+        self
+    ) -> dict[str, Any]:
+        '''
+        Describe the in-memory copy of the database without 
+        reading its tables, loading it if needed.
+        
+        Commits to the copy are detected with PRAGMA 
+        data_version, read on a connection kept for as long 
+        as the copy is kept, so that versions read at 
+        different times are comparable.
+
+        Raises
+        ------
+        ValueError
+            If the instance is not in_memory, raise a 
+            ValueError.
+
+        Returns
+        -------
+        state : dict[str, Any]
+            The size & modification time of the database 
+            file & its write-ahead log when the copy was 
+            made ('files'), & None if nothing has been 
+            committed to the copy since, or else a token 
+            unique to the copy & its data_version 
+            ('changed').
+
+        '''
+        self.load()
+        copy: dict[str, Any] = Indexia.copies[self.uri]
+        
+        data_version: int = copy['watcher'].execute(
+            'PRAGMA data_version'
+        ).fetchone()[0]
+        
+        changed: list[Any] | None = None if (
+            copy['files'] is not None and data_version == copy['data_version']
+        ) else [copy['token'], data_version]
+        
+        state: dict[str, Any] = {'files': copy['files'], 'changed': changed}
+        
+        return state
             
     def get_df(
         self,
         cnxn: sqlite3.Connection,
         sql: str,
         expected_columns: list[str]=[],
-        raise_errors: bool=False
+        raise_errors: bool=False,
+        params: tuple[Any, ...] | list[Any] = ()
     ) -> pandas.DataFrame:
         '''
         Get result of SQL query as a pandas dataframe.
@@ -161,6 +528,9 @@ class Indexia:
         raise_errors : bool, optional
             Whether to raise exceptions encountered during 
             execution. The default is False.
+        params : tuple[Any, ...] | list[Any], optional
+            Values bound to placeholders in sql. The 
+            default is ().
 
         Raises
         ------
@@ -175,10 +545,25 @@ class Indexia:
             SQL query.
 
         '''
+        import pandas
+        
         error: ValueError | Exception | None = None
+        db: str | None = None
+        
+        if self.thesaurus and not cnxn.in_transaction:
+            db = self.get_db(cnxn)
+        
+        if db and self.thesaurus:
+            cached: pandas.DataFrame | None = self.thesaurus.get(db, sql, params)
+            
+            if cached is not None and (
+                not expected_columns or 
+                set(cached.columns) == set(expected_columns)
+            ):
+                return cached
         
         try:
-            df: pandas.DataFrame = pandas.read_sql(sql, cnxn) # type: ignore
+            df: pandas.DataFrame = self.read_sql(cnxn, sql, params)
             
             if expected_columns and set(df.columns) != set(expected_columns):
                 err_msg: str = ' '.join([
@@ -194,9 +579,208 @@ class Indexia:
             
         if error and raise_errors:
             raise error
+        
+        if db and self.thesaurus and not error:
+            self.thesaurus.put(db, sql, params, df)
             
         return df
+    
+    def read_sql(
+        self,
+        cnxn: sqlite3.Connection,
+        sql: str,
+        params: tuple[Any, ...] | list[Any] = ()
+    ) -> pandas.DataFrame:
+        '''
+        Read the result of a SQL query into a dataframe, 
+        timing the query if the instance has a Mensura.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            Connection to the database.
+        sql : str
+            SQL to be executed by pandas.read_sql.
+        params : tuple[Any, ...] | list[Any], optional
+            Values bound to placeholders in sql. The 
+            default is ().
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            A dataframe containing the results of the 
+            SQL query.
+
+        '''
+        import pandas
+        
+        def run() -> pandas.DataFrame:
+            return pandas.read_sql(sql, cnxn, params=params or None) # type: ignore
+        
+        if not self.mensura:
+            return run()
+        
+        df: pandas.DataFrame = self.mensura.measure(
+            sql, params, run, cnxn=cnxn
+        )[0]
+        
+        return df
+    
+    def execute(
+        self,
+        cnxn: sqlite3.Connection,
+        sql: str,
+        params: tuple[Any, ...] | list[Any] = ()
+    ) -> sqlite3.Cursor:
+        '''
+        Execute a SQL statement, timing the statement if 
+        the instance has a Mensura.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        sql : str
+            The SQL statement to execute.
+        params : tuple[Any, ...] | list[Any], optional
+            Values bound to placeholders in sql. The 
+            default is ().
+
+        Returns
+        -------
+        cursor : sqlite3.Cursor
+            Cursor of the executed statement.
+
+        '''
+        def run() -> sqlite3.Cursor:
+            return cnxn.execute(sql, params)
+        
+        if self.mensura:
+            cursor: sqlite3.Cursor = self.mensura.measure(
+                sql, params, run, cnxn=cnxn
+            )[0]
+        else:
+            cursor = run()
+        
+        if not cnxn.in_transaction:
+            self.commit(cnxn)
+        
+        return cursor
+    
+    def commit(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> None:
+        '''
+        Commit the open transaction of a connection. If 
+        the instance is in_memory & write_back is a number, 
+        changes are then copied back to the database file 
+        if at least write_back seconds have passed since 
+        the last copy.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+
+        Returns
+        -------
+        None.
+
+        '''
+        cnxn.commit()
+        
+        if (
+            self.memory is not None and 
+            not isinstance(self.write_back, bool) and 
+            time.monotonic() - self.flushed >= self.write_back
+        ):
+            self.flush()
+    
+    def get_query_stats(
+        self,
+        as_frame: bool = True
+    ) -> pandas.DataFrame | dict[str, dict[str, Any]]:
+        '''
+        Get statistics of the statements executed on the 
+        instance's connections.
+
+        Parameters
+        ----------
+        as_frame : bool, optional
+            If True, return a dataframe. Otherwise return a 
+            dict keyed by statement shape. The default is True.
+
+        Raises
+        ------
+        ValueError
+            If the instance was created without a Mensura, 
+            raise a ValueError.
+
+        Returns
+        -------
+        stats : pandas.DataFrame | dict[str, dict[str, Any]]
+            Count, total, mean & percentile durations, & rows 
+            of each statement shape. See 
+            indexia.mensura.Mensura.get_stats.
+
+        '''
+        if not self.mensura:
+            raise ValueError('Query statistics require a Mensura.')
+        
+        stats: pandas.DataFrame | dict[str, dict[str, Any]] = (
+            self.mensura.get_stats(as_frame=as_frame)
+        )
+        
+        return stats
+            
+    def create_table(
+        self,
+        cnxn: sqlite3.Connection,
+        tablename: str,
+        dtype: dict[str, str]
+    ) -> bool:
+        '''
+        Create a table if it does not exist, & install the 
+        triggers enabled on the instance on it. Tables 
+        known to exist are skipped without any statement.
+        
+        If the trait of a new table is of type LEXICON, its 
+        lexicon is created too, & the trait of a new 
+        creature table is indexed.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        tablename : str
+            Name of the database table.
+        dtype : dict[str, str]
+            Dict of table columns & column data types.
+
+        Returns
+        -------
+        created : bool
+            Whether the table was created.
+
+        '''
+        if not self.get_table_columns(cnxn, tablename).empty:
+            return False
+        
+        create: str = Inquiry.create(tablename, dtype)
+        self.execute(cnxn, create)
+        self.install_triggers(cnxn, tablename)
+        
+        if self.get_trait_type(cnxn, tablename) == 'LEXICON':
+            self.execute(cnxn, Inquiry.create(*Tabula.get_lexicon_table(tablename)))
             
+            if self.get_creator_genus(cnxn, tablename):
+                self.index_trait(cnxn, tablename)
+        
+        self.commit(cnxn)
+        
+        return True
+    
     def get_or_create(
         self,
         cnxn: sqlite3.Connection,
@@ -241,9 +825,8 @@ class Indexia:
             value criteria.
 
         '''
-        create: str = Inquiry.create(tablename, dtype)
-        cnxn.execute(create)
-        cnxn.commit()
+        if retry:
+            self.create_table(cnxn, tablename, dtype)
         
         where: str = Inquiry.where(cols, vals)
         select: str = Inquiry.select(tablename, ['*'], where)
@@ -251,8 +834,9 @@ class Indexia:
         
         if result.empty and retry:
             insert: str = Inquiry.insert(tablename, [tuple(vals)], columns=cols)
-            cnxn.execute(insert)
-            cnxn.commit()
+            self.execute(cnxn, insert)
+            self.commit(cnxn)
+            self.invalidate(cnxn, tablename, lookups=['trait'])
             
             return self.get_or_create(
                 cnxn, tablename, dtype, cols, vals, retry=False
@@ -263,6 +847,82 @@ class Indexia:
         
         return result
                 
+    def bulk_insert(
+        self,
+        cnxn: sqlite3.Connection,
+        tablename: str,
+        dtype: dict[str, str],
+        cols: list[str],
+        rows: list[tuple[Any, ...]]
+    ) -> int:
+        '''
+        Create a table if it does not exist & insert many 
+        rows with executemany in a single transaction.
+        
+        Unlike get_or_create, rows are inserted without 
+        first checking whether they exist, & inserted 
+        rows are not retrieved. Expressions of a LEXICON 
+        trait are replaced with their codes (see intern).
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        tablename : str
+            Name of the database table. If the table does 
+            not exist, it will be created.
+        dtype : dict[str, str]
+            Dict of table columns & column data types.
+        cols : list[str]
+            Columns into which values are inserted.
+        rows : list[tuple[Any, ...]]
+            Values to insert, one tuple per row, ordered 
+            as cols.
+
+        Returns
+        -------
+        rows_inserted : int
+            Count of rows inserted.
+
+        '''
+        self.create_table(cnxn, tablename, dtype)
+        trait: str
+        trait_type: str
+        trait, trait_type = self.describe_trait(cnxn, tablename)
+        
+        if trait_type == 'LEXICON' and trait in cols:
+            position: int = cols.index(trait)
+            
+            codes: dict[Any, int | None] = {
+                e: self.intern(cnxn, tablename, e) 
+                for e in dict.fromkeys(r[position] for r in rows)
+            }
+            
+            rows = [
+                (*r[:position], codes[r[position]], *r[position + 1:]) for r in rows
+            ]
+        
+        insert: str = Inquiry.insert_many(tablename, cols)
+        
+        def run() -> sqlite3.Cursor:
+            with cnxn:
+                cursor: sqlite3.Cursor = cnxn.executemany(insert, rows)
+            
+            return cursor
+        
+        if self.mensura:
+            cursor: sqlite3.Cursor = self.mensura.measure(
+                insert, rows[0] if rows else (), run, cnxn=cnxn
+            )[0]
+        else:
+            cursor = run()
+        
+        self.commit(cnxn)
+        rows_inserted: int = cursor.rowcount
+        self.invalidate(cnxn, tablename, lookups=['trait'])
+        
+        return rows_inserted
+                
     def delete(
         self,
         cnxn: sqlite3.Connection,
@@ -289,10 +949,10 @@ class Indexia:
         '''
         where: str = Inquiry.where(['id'], [entity_id])
         delete: str = Inquiry.delete(species, where)
-        cursor: sqlite3.Cursor = cnxn.cursor()
-        cursor.execute(delete)
-        cnxn.commit()
+        cursor: sqlite3.Cursor = self.execute(cnxn, delete)
+        self.commit(cnxn)
         rows_deleted: int = cursor.rowcount
+        self.invalidate(cnxn, species, ids=[entity_id], cascade=True)
         
         return rows_deleted
     
@@ -341,16 +1001,94 @@ class Indexia:
             Number of rows affected by update statement.
 
         '''
+        try:
+            trait: str | None = self.get_trait(cnxn, tablename)
+        except ValueError:
+            trait = None
+        
+        if trait in set_cols:
+            set_vals = [
+                self.encode_expression(cnxn, tablename, v) if c == trait else v 
+                for c, v in zip(set_cols, set_vals)
+            ]
+        
+        if trait in where_cols:
+            trait_type: str = self.get_trait_type(cnxn, tablename)
+            where_vals = list(where_vals)
+            i: int = where_cols.index(trait)
+            
+            if trait_type == 'LEXICON':
+                where_vals[i] = self.intern(cnxn, tablename, where_vals[i], create=False)
+            else:
+                where_vals[i] = Tabula.encode_trait(where_vals[i], trait_type)
+        
         where: str = Inquiry.where(where_cols, where_vals)
         update: str = Inquiry.update(tablename, set_cols, set_vals, where)
-        cursor: sqlite3.Cursor = cnxn.cursor()
-        cursor.execute(update)
-        cnxn.commit()
+        
+        if self.mneme and self.mneme.entries:
+            select: str = Inquiry.select(tablename, ['id'], where)
+            ids: list[int] = [int(i) for i in self.get_df(cnxn, select).id]
+        
+        cursor: sqlite3.Cursor = self.execute(cnxn, update)
+        self.commit(cnxn)
         rows_updated: int = cursor.rowcount
         
+        if self.mneme and self.mneme.entries:
+            self.invalidate(cnxn, tablename, ids=ids, lookups=['id'])
+            self.invalidate(cnxn, tablename, lookups=['trait'])
+            
+            if 'id' in set_cols:
+                for species in self.get_creature_species(cnxn, tablename):
+                    self.invalidate(cnxn, species, cascade=True)
+        
         return rows_updated
     
     
+    def invalidate(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        ids: list[int] | None = None,
+        lookups: list[str] = ['id', 'trait'],
+        cascade: bool = False
+    ) -> None:
+        '''
+        Forget lookups remembered by the instance's Mneme 
+        that a write may have changed.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the written table.
+        ids : list[int] | None, optional
+            If supplied, forget only lookups whose result 
+            includes one of these ids. The default is None.
+        lookups : list[str], optional
+            Types of lookup to forget ('id' and/or 'trait'). 
+            The default is ['id', 'trait'].
+        cascade : bool, optional
+            Whether to also forget every lookup of the 
+            creature tables below kind, whose rows are 
+            changed by cascading deletes & updates. The 
+            default is False.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not self.mneme or not self.mneme.entries:
+            return
+        
+        self.mneme.forget(self.lookup_db, kind, ids=ids, lookups=lookups)
+        
+        if cascade:
+            for species in self.get_creature_species(cnxn, kind):
+                self.invalidate(cnxn, species, cascade=True)
+    
+    
     ##########
     # adders #
     ##########
@@ -360,7 +1098,8 @@ class Indexia:
         cnxn: sqlite3.Connection,
         genus: str,
         trait: str,
-        expr: str
+        expr: Any,
+        trait_type: str = 'TEXT'
     ) -> pandas.DataFrame:
         '''
         Get or create a creator entity.
@@ -373,9 +1112,15 @@ class Indexia:
             Name of the creator (parent) table to be retrieved 
             or created.
         trait : str
-            Name of the creator's text attribute.
-        expr : str
-            Value of the creator's text attribute.
+            Name of the creator's attribute.
+        expr : Any
+            Value of the creator's attribute, converted as by 
+            encode_expression.
+        trait_type : str, optional
+            Type of the attribute if the table is created: 
+            'TEXT', 'INTEGER', 'REAL', 'TIMESTAMP' or 
+            'LEXICON'. The type of an existing table is kept. 
+            The default is 'TEXT'.
 
         Returns
         -------
@@ -384,11 +1129,16 @@ class Indexia:
 
         '''
         creator_table: tuple[str, dict[Any, str]] = Tabula.get_creator_table(
-            genus, trait
+            genus, trait, trait_type
         )
 
         dtype: dict[str, Any | str] = creator_table[1]
-        creator: pandas.DataFrame = self.get_or_create(cnxn, genus, dtype, [trait], [expr])
+        self.create_table(cnxn, genus, dtype)
+        value: Any = self.encode_expression(cnxn, genus, expr, trait_type)
+        creator: pandas.DataFrame = self.get_or_create(cnxn, genus, dtype, [trait], [value])
+        
+        if self.get_trait_type(cnxn, genus) == 'LEXICON':
+            creator[trait] = expr
         
         return creator
     
@@ -399,7 +1149,8 @@ class Indexia:
         creator: pandas.DataFrame, 
         species: str,
         trait: str,
-        expr: str
+        expr: Any,
+        trait_type: str = 'TEXT'
     ) -> pandas.DataFrame:
         '''
         Get or create a creature of a given creator.
@@ -416,9 +1167,15 @@ class Indexia:
             Name of the creature (child) table to be retrieved 
             or created.
         trait : str
-            Name of the creature's text attribute.
-        expr : str
-            Value of the creature's text attribute.
+            Name of the creature's attribute.
+        expr : Any
+            Value of the creature's attribute, converted as by 
+            encode_expression.
+        trait_type : str, optional
+            Type of the attribute if the table is created: 
+            'TEXT', 'INTEGER', 'REAL', 'TIMESTAMP' or 
+            'LEXICON'. The type of an existing table is kept. 
+            The default is 'TEXT'.
 
         Returns
         -------
@@ -429,28 +1186,107 @@ class Indexia:
         creator_id: int = list(creator.id)[0]
 
         creature_table: tuple[str, dict[str, str]] = Tabula.get_creature_table(
-            genus, species, trait
+            genus, species, trait, trait_type
         )
 
         dtype: dict[str, Any | str] = creature_table[1]
+        self.create_table(cnxn, species, dtype)
+        value: Any = self.encode_expression(cnxn, species, expr, trait_type)
 
         creature: pandas.DataFrame = self.get_or_create(
-            cnxn, species, dtype, [trait, f'{genus}_id'], [expr, creator_id]
+            cnxn, species, dtype, [trait, f'{genus}_id'], [value, creator_id]
         )
         
+        if self.get_trait_type(cnxn, species) == 'LEXICON':
+            creature[trait] = expr
+        
         return creature
     
     
+    def encode_expression(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        expr: Any,
+        trait_type: str = 'TEXT'
+    ) -> Any:
+        '''
+        Convert a trait expression to the value stored in 
+        a table.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table.
+        expr : Any
+            The trait expression.
+        trait_type : str, optional
+            Type of the trait if the table does not exist. 
+            The default is 'TEXT'.
+
+        Returns
+        -------
+        value : Any
+            The code of expr in the table's lexicon if the 
+            trait is of type LEXICON, or expr converted as by 
+            indexia.inquiry.Tabula.encode_trait.
+
+        '''
+        if not self.get_table_columns(cnxn, kind).empty:
+            trait_type = self.get_trait_type(cnxn, kind)
+        
+        if trait_type.upper() == 'LEXICON':
+            return self.intern(cnxn, kind, expr)
+        
+        value: Any = Tabula.encode_trait(expr, trait_type)
+        
+        return value
+    
+    
     ###########
     # getters #
     ###########
     
+    def recall(
+        self,
+        cnxn: sqlite3.Connection,
+        key: tuple[str, str, str, Any]
+    ) -> pandas.DataFrame | None:
+        '''
+        Recall a lookup remembered by the instance's Mneme.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        key : tuple[str, str, str, Any]
+            Key of the lookup. See indexia.mneme.Mneme.get.
+
+        Returns
+        -------
+        being : pandas.DataFrame | None
+            The remembered dataframe, or None if the lookup 
+            is not remembered or the instance has no Mneme.
+
+        '''
+        if not self.mneme:
+            return None
+        
+        self.mneme.check(cnxn)
+        being: pandas.DataFrame | None = self.mneme.get(key)
+        
+        return being
+    
+    
     def get_all_tables(
         self,
         cnxn: sqlite3.Connection
     ) -> list[str]:
         '''
-        Get all tables in the instance database.
+        Get all tables in the instance database, except 
+        SQLite's & indexia's internal tables.
 
         Parameters
         ----------
@@ -465,11 +1301,39 @@ class Indexia:
         '''
         where: str = Inquiry.where(['type'], ['table'])
         where = f"{where} AND name NOT LIKE 'sqlite_%'"
+        where = f"{where} AND name NOT LIKE 'indexia_%'"
         sql: str = Inquiry.select('sqlite_schema', ['name'], where)
         tables: list[Any] = list(self.get_df(cnxn, sql).name)
         
         return tables
     
+    def has_table(
+        self,
+        cnxn: sqlite3.Connection,
+        tablename: str
+    ) -> bool:
+        '''
+        Check whether a table exists in the database.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        tablename : str
+            Name of the table.
+
+        Returns
+        -------
+        exists : bool
+            True if the table exists.
+
+        '''
+        where: str = Inquiry.where(['type', 'name'], ['table', tablename])
+        sql: str = Inquiry.select('sqlite_schema', ['name'], where)
+        exists: bool = not self.get_df(cnxn, sql).empty
+        
+        return exists
+    
     def get_table_columns(
         self,
         cnxn: sqlite3.Connection,
@@ -477,6 +1341,10 @@ class Indexia:
     ) -> pandas.DataFrame:
         '''
         Get columns of a database table.
+        
+        Columns of existing tables are remembered for the 
+        life of the connection, since indexia does not 
+        alter tables.
 
         Parameters
         ----------
@@ -491,6 +1359,11 @@ class Indexia:
             Dataframe describing table columns.
 
         '''
+        key: tuple[sqlite3.Connection, str] = (cnxn, tablename)
+        
+        if key in self.columns:
+            return self.columns[key]
+        
         pragma: str = f'PRAGMA TABLE_INFO({tablename});'
         
         columns: pandas.DataFrame = self.get_df(cnxn, pragma)[
@@ -502,15 +1375,19 @@ class Indexia:
             'pk': 'is_pk'
         })
         
+        if not columns.empty:
+            self.columns[key] = columns
+        
         return columns
     
-    def get_trait(self,
+    def describe_trait(
+        self,
         cnxn: sqlite3.Connection,
         kind: str
-    ) -> str:
+    ) -> tuple[str, str]:
         '''
         Gets the trait (attribute) column of the given 
-        kind.
+        kind & its type.
 
         Parameters
         ----------
@@ -530,239 +1407,1686 @@ class Indexia:
         -------
         trait : str
             Name of the trait column.
+        trait_type : str
+            Declared type of the trait column (e.g., 'TEXT', 
+            'INTEGER', 'REAL' or 'TIMESTAMP').
 
         '''
-        columns: pandas.Series[str] = self.get_table_columns(
-            cnxn, kind
-        ).column_name
+        columns: pandas.DataFrame = self.get_table_columns(cnxn, kind)
 
-        traits: list[str] = [
-            c for c in columns if c != 'id' and not c.endswith('_id')
-        ]
+        traits: pandas.DataFrame = columns[[
+            c != 'id' and not c.endswith('_id') for c in columns.column_name
+        ]]
         
-        if not traits or len(traits) > 1:
+        if traits.empty or traits.shape[0] > 1:
             err_msg: str = 'Found multiple trait columns'
-            err_msg = err_msg if traits else 'Found no trait column'
+            err_msg = err_msg if not traits.empty else 'Found no trait column'
             err_msg = f'{err_msg} for {kind}.'
             raise ValueError(err_msg)
             
-        trait: str = traits[0]
+        trait: str = traits.column_name.iloc[0]
+        trait_type: str = str(traits.data_type.iloc[0]).upper()
         
-        return trait
+        return trait, trait_type
     
-    def get_by_trait(
-        self,
+    def get_trait(self,
         cnxn: sqlite3.Connection,
-        kind: str,
-        expr: str
-    ) -> pandas.DataFrame:
+        kind: str
+    ) -> str:
         '''
-        Get being(s) by the text attribute value.
-        
-        Note that since values of the trait column need not be 
-        unique, it is possible that the dataframe returned 
-        will contain more than one being.
+        Gets the trait (attribute) column of the given 
+        kind.
 
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
         kind : str
-            Name of the table to query.
-        expr : str
-            Value of the being's trait (text attribute).
+            Name of the table.
+
+        Raises
+        ------
+        ValueError
+            If no trait column is identified, or if more 
+            than one trait column is identified, raise a 
+            ValueError.
 
         Returns
         -------
-        being : pandas.DataFrame
-            Dataframe of one or more beings.
+        trait : str
+            Name of the trait column.
 
         '''
-        trait: str = self.get_trait(cnxn, kind)
-        where: str = Inquiry.where([trait], [expr])
-        select: str = Inquiry.select(kind, ['*'], where)
-        being: pandas.DataFrame = self.get_df(cnxn, select)
+        trait: str = self.describe_trait(cnxn, kind)[0]
         
-        return being
+        return trait
     
-    def get_by_id(
+    def get_trait_type(
         self,
         cnxn: sqlite3.Connection,
-        kind: str,
-        being_id: int
-    ) -> pandas.DataFrame:
+        kind: str
+    ) -> str:
         '''
-        Get an entity by its id.
+        Gets the type of the trait (attribute) column of 
+        the given kind.
 
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
         kind : str
-            Name of the table to query.
-        being_id : int
-            Value of the entity's id.
+            Name of the table.
+
+        Raises
+        ------
+        ValueError
+            If no trait column is identified, or if more 
+            than one trait column is identified, raise a 
+            ValueError.
 
         Returns
         -------
-        being : pandas.DataFrame
-            Dataframe of being data.
+        trait_type : str
+            Declared type of the trait column. See 
+            indexia.inquiry.Tabula.get_trait_dtype.
 
         '''
-        where: str = Inquiry.where(['id'], [being_id])
-        select: str = Inquiry.select(kind, ['*'], where)
-        being: pandas.DataFrame = self.get_df(cnxn, select)
+        trait_type: str = self.describe_trait(cnxn, kind)[1]
         
-        return being
+        return trait_type
     
-    def get_creator_genus(
+    def get_source(
         self,
         cnxn: sqlite3.Connection,
-        species: str
-    ) -> str | None:
+        kind: str
+    ) -> str:
         '''
-        Get table name of creator (parent) table.
+        Get the table or subquery from which beings of a 
+        kind are read.
 
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
-        species : str
-            Name of the creature (child) table.
-
-        Raises
-        ------
-        ValueError
-            If more than one creator table is found, 
-            raise a ValueError. Each creature table 
-            should have one & only one creator.
+        kind : str
+            Name of the table.
 
         Returns
         -------
-        genus : str | None
-            Name of the creator (parent) table.
+        source : str
+            The name of the table, or, if its trait is of 
+            type LEXICON, a subquery with the same columns 
+            selecting the expression of each code from the 
+            table's lexicon.
 
         '''
-        pragma: str = f'PRAGMA FOREIGN_KEY_LIST({species});'
-        foreign_keys: pandas.DataFrame = self.get_df(cnxn, pragma)
-        genus: str | None = None
+        columns: pandas.DataFrame = self.get_table_columns(cnxn, kind)
         
-        if foreign_keys.shape[0] > 1:
-            msg: str = ' '.join([
-                'Data integrity error:',
-                f'{species} shows more than one creator',
-                f'({str(list(foreign_keys.table))}).'
-            ])
-            
-            raise ValueError(msg)
-            
-        elif not foreign_keys.empty:
-            table_names: list[Any] = foreign_keys.table.tolist()
-            genus = str(table_names[0])
-            
-        return genus
+        if columns.empty or 'LEXICON' not in list(columns.data_type.str.upper()):
+            return kind
+        
+        trait: str = self.get_trait(cnxn, kind)
+        lexicon: str = Tabula.get_lexicon_table(kind)[0]
+        
+        selected: list[str] = [
+            f'l.expression AS {c}' if c == trait else f't.{c} AS {c}' 
+            for c in columns.column_name
+        ]
+        
+        source: str = ' '.join([
+            f"(SELECT {', '.join(selected)} FROM {kind} t",
+            f'JOIN {lexicon} l ON l.code = t.{trait})'
+        ])
+        
+        return source
     
-    def get_creature_species(
+    def intern(
         self,
         cnxn: sqlite3.Connection,
-        genus: str
-    ) -> list[str]:
+        kind: str,
+        expr: str,
+        create: bool = True
+    ) -> int | None:
         '''
-        Get types of all creatures with a given creator genus.
+        Get the code of an expression in the lexicon of a 
+        table, adding the expression if it is new. The 
+        lexicon is created with the table (see 
+        create_table).
 
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
-        genus : str
-            Name of the creator (parent) table.
+        kind : str
+            Name of a table whose trait is of type LEXICON.
+        expr : str
+            The expression.
+        create : bool, optional
+            Whether to add a new expression to the lexicon. 
+            The default is True.
 
         Returns
         -------
-        species : list[str]
-            List of creature (child) table names.
+        code : int | None
+            Code of the expression, or None if it is not in 
+            the lexicon & create is False.
 
         '''
-        tables: list[str] = self.get_all_tables(cnxn)
+        lexicon_table: tuple[str, dict[str, str]] = Tabula.get_lexicon_table(kind)
+        lexicon: str = lexicon_table[0]
         
-        species: list[str] = [
-            t for t in tables if self.get_creator_genus(cnxn, t) == genus
-        ]
+        if create:
+            self.execute(
+                cnxn, f'INSERT OR IGNORE INTO {lexicon} (expression) VALUES (?)', 
+                [str(expr)]
+            )
         
-        return species
-                
-    def get_creator(
+        elif not self.has_table(cnxn, lexicon):
+            return None
+        
+        found: list[Any] = self.execute(
+            cnxn, f'SELECT code FROM {lexicon} WHERE expression = ?', [str(expr)]
+        ).fetchall()
+        
+        code: int | None = int(found[0][0]) if found else None
+        
+        return code
+    
+    def get_by_trait(
         self,
         cnxn: sqlite3.Connection,
-        species: str,
-        creature: pandas.DataFrame
-    ) -> list[tuple[str, pandas.DataFrame]]:
+        kind: str,
+        expr: str
+    ) -> pandas.DataFrame:
         '''
-        Get the creator of a given creature.
+        Get being(s) by the text attribute value.
+        
+        Note that since values of the trait column need not be 
+        unique, it is possible that the dataframe returned 
+        will contain more than one being.
 
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
-        species : str
-            Name of the creature (child) table.
-        creature : pandas.DataFrame
-            A single-row dataframe of creature entity data.
+        kind : str
+            Name of the table to query.
+        expr : str
+            Value of the being's trait (text attribute). 
+            Expressions of typed traits are converted as by 
+            indexia.inquiry.Tabula.encode_trait.
 
         Returns
         -------
-        creator : list[tuple[str, pandas.DataFrame]]
-            List containing a single tuple of (creator table name, creator data).
+        being : pandas.DataFrame
+            Dataframe of one or more beings.
 
         '''
-        genus: str | None = self.get_creator_genus(cnxn, species)
-        creator: list[tuple[str, pandas.DataFrame]] = []
+        key: tuple[str, str, str, Any] = (self.lookup_db, 'trait', kind, expr)
+        remembered: pandas.DataFrame | None = self.recall(cnxn, key)
         
-        if genus:
-            creator_id: int = creature[f'{genus}_id'].values[0]
-            where: str = Inquiry.where(['id'], [creator_id])
-            select: str = Inquiry.select(genus, ['*'], where)
-            creator = [(genus, self.get_df(cnxn, select))]
+        if remembered is not None:
+            return remembered
         
-        return creator
+        trait: str
+        trait_type: str
+        trait, trait_type = self.describe_trait(cnxn, kind)
+        where: str = Inquiry.where([trait], [Tabula.encode_trait(expr, trait_type)])
+        select: str = Inquiry.select(self.get_source(cnxn, kind), ['*'], where)
+        being: pandas.DataFrame = self.get_df(cnxn, select)
+        
+        if self.mneme:
+            self.mneme.put(key, being)
+        
+        return being
     
-    def get_creatures(
+    def index_trait(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str
+    ) -> str:
+        '''
+        Create an index on the trait column of a table, 
+        if it does not exist, so that get_by_trait, 
+        get_by_trait_prefix & get_by_trait_range read 
+        only matching rows.
+        
+        The trait columns of creator tables are unique & 
+        already indexed.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table.
+
+        Returns
+        -------
+        indexname : str
+            Name of the index.
+
+        '''
+        trait: str = self.get_trait(cnxn, kind)
+        indexname: str = f'{kind}_{trait}'
+        
+        with cnxn:
+            self.execute(cnxn, Inquiry.create_index(indexname, kind, [trait]))
+        
+        return indexname
+    
+    def get_by_trait_range(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        lo: Any = None,
+        hi: Any = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> pandas.DataFrame:
+        '''
+        Get beings whose trait expressions fall in a range, 
+        ordered by expression & id.
+        
+        Expressions of TEXT traits are compared as text, so 
+        the range suits any expression whose text sorts in 
+        its own order (e.g., dates formatted as 
+        YYYY-MM-DD-HH-MM). Bounds of typed traits are 
+        converted as by indexia.inquiry.Tabula.encode_trait 
+        & compared as numbers. If the trait column is 
+        indexed (see index_trait), only the rows in the 
+        range are read.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table to query.
+        lo : Any, optional
+            Least expression included. If None, the range 
+            has no lower bound. The default is None.
+        hi : Any, optional
+            Least expression excluded. If None, the range 
+            has no upper bound. The default is None.
+        limit : int | None, optional
+            Maximum count of beings returned. If None, 
+            return all beings in the range. The default is 
+            None.
+        offset : int, optional
+            Count of beings in the range skipped before the 
+            first returned. The default is 0.
+
+        Returns
+        -------
+        beings : pandas.DataFrame
+            Dataframe of beings.
+
+        '''
+        trait: str
+        trait_type: str
+        trait, trait_type = self.describe_trait(cnxn, kind)
+        conditions: list[str] = []
+        params: list[Any] = []
+        
+        if lo is not None:
+            conditions += [f'{trait} >= ?']
+            params += [Tabula.encode_trait(lo, trait_type)]
+        
+        if hi is not None:
+            conditions += [f'{trait} < ?']
+            params += [Tabula.encode_trait(hi, trait_type)]
+        
+        where: str = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        select: str = Inquiry.select(
+            self.get_source(cnxn, kind), ['*'], 
+            f'{where} ORDER BY {trait}, id LIMIT ? OFFSET ?'
+        )
+        
+        params += [-1 if limit is None else int(limit), int(offset)]
+        beings: pandas.DataFrame = self.get_df(cnxn, select, params=params)
+        
+        return beings
+    
+    def get_by_trait_prefix(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        prefix: str,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> pandas.DataFrame:
+        '''
+        Get beings whose trait expressions start with a 
+        prefix, ordered by expression & id.
+        
+        The prefix is matched case-sensitively, as a range 
+        of expressions from prefix up to (but excluding) 
+        the prefix with its last character incremented, so 
+        that an index on the trait column is used.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table to query.
+        prefix : str
+            Start of the expressions to match.
+        limit : int | None, optional
+            Maximum count of beings returned. If None, 
+            return all matching beings. The default is None.
+        offset : int, optional
+            Count of matching beings skipped before the 
+            first returned. The default is 0.
+
+        Raises
+        ------
+        ValueError
+            If the trait of kind is of a numeric or 
+            timestamp type, raise a ValueError.
+
+        Returns
+        -------
+        beings : pandas.DataFrame
+            Dataframe of beings.
+
+        '''
+        trait_type: str = self.get_trait_type(cnxn, kind)
+        
+        if trait_type in ['INTEGER', 'REAL', 'TIMESTAMP']:
+            raise ValueError(f'Cannot match a prefix of {trait_type} trait of {kind}.')
+        
+        stem: str = prefix.rstrip(chr(0x10FFFF))
+        hi: str | None = f'{stem[:-1]}{chr(ord(stem[-1]) + 1)}' if stem else None
+        
+        beings: pandas.DataFrame = self.get_by_trait_range(
+            cnxn, kind, lo=prefix, hi=hi, limit=limit, offset=offset
+        )
+        
+        return beings
+    
+    def get_by_id(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        being_id: int
+    ) -> pandas.DataFrame:
+        '''
+        Get an entity by its id.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table to query.
+        being_id : int
+            Value of the entity's id.
+
+        Returns
+        -------
+        being : pandas.DataFrame
+            Dataframe of being data.
+
+        '''
+        key: tuple[str, str, str, Any] = (self.lookup_db, 'id', kind, int(being_id))
+        remembered: pandas.DataFrame | None = self.recall(cnxn, key)
+        
+        if remembered is not None:
+            return remembered
+        
+        where: str = Inquiry.where(['id'], [being_id])
+        select: str = Inquiry.select(self.get_source(cnxn, kind), ['*'], where)
+        being: pandas.DataFrame = self.get_df(cnxn, select)
+        
+        if self.mneme:
+            self.mneme.put(key, being)
+        
+        return being
+    
+    def get_by_ids(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        ids: list[int],
+        cols: list[str] = ['*']
+    ) -> pandas.DataFrame:
+        '''
+        Get many entities by id, with one query per chunk 
+        of max_params distinct ids.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table to query.
+        ids : list[int]
+            Values of the entities' ids.
+        cols : list[str], optional
+            Columns to select. The default is ['*'].
+
+        Returns
+        -------
+        beings : pandas.DataFrame
+            Dataframe of being data, with one row per 
+            distinct id found.
+
+        '''
+        import pandas
+        
+        source: str = self.get_source(cnxn, kind)
+        frames: list[pandas.DataFrame] = []
+        
+        for chunk in self.chunk(list(dict.fromkeys(int(i) for i in ids))) or [[]]:
+            placeholders: str = ','.join('?' for _ in chunk)
+            where: str = f'WHERE id IN ({placeholders})'
+            select: str = Inquiry.select(source, cols, where)
+            frames += [self.get_df(cnxn, select, params=chunk)]
+        
+        beings: pandas.DataFrame = pandas.concat(frames, ignore_index=True)
+        
+        return beings
+    
+    def get_creator_genus(
+        self,
+        cnxn: sqlite3.Connection,
+        species: str
+    ) -> str | None:
+        '''
+        Get table name of creator (parent) table.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        species : str
+            Name of the creature (child) table.
+
+        Raises
+        ------
+        ValueError
+            If more than one creator table is found, 
+            raise a ValueError. Each creature table 
+            should have one & only one creator.
+
+        Returns
+        -------
+        genus : str | None
+            Name of the creator (parent) table.
+
+        '''
+        pragma: str = f'PRAGMA FOREIGN_KEY_LIST({species});'
+        foreign_keys: pandas.DataFrame = self.get_df(cnxn, pragma)
+        genus: str | None = None
+        
+        if foreign_keys.shape[0] > 1:
+            msg: str = ' '.join([
+                'Data integrity error:',
+                f'{species} shows more than one creator',
+                f'({str(list(foreign_keys.table))}).'
+            ])
+            
+            raise ValueError(msg)
+            
+        elif not foreign_keys.empty:
+            table_names: list[Any] = foreign_keys.table.tolist()
+            genus = str(table_names[0])
+            
+        return genus
+    
+    def get_creature_species(
+        self,
+        cnxn: sqlite3.Connection,
+        genus: str
+    ) -> list[str]:
+        '''
+        Get types of all creatures with a given creator genus.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        genus : str
+            Name of the creator (parent) table.
+
+        Returns
+        -------
+        species : list[str]
+            List of creature (child) table names.
+
+        '''
+        tables: list[str] = self.get_all_tables(cnxn)
+        
+        species: list[str] = [
+            t for t in tables if self.get_creator_genus(cnxn, t) == genus
+        ]
+        
+        return species
+                
+    def get_creator(
+        self,
+        cnxn: sqlite3.Connection,
+        species: str,
+        creature: pandas.DataFrame
+    ) -> list[tuple[str, pandas.DataFrame]]:
+        '''
+        Get the creator of a given creature.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        species : str
+            Name of the creature (child) table.
+        creature : pandas.DataFrame
+            A single-row dataframe of creature entity data.
+
+        Returns
+        -------
+        creator : list[tuple[str, pandas.DataFrame]]
+            List containing a single tuple of (creator table name, creator data).
+
+        '''
+        genus: str | None = self.get_creator_genus(cnxn, species)
+        creator: list[tuple[str, pandas.DataFrame]] = []
+        
+        if genus:
+            creator_id: int = creature[f'{genus}_id'].values[0]
+            creator = [(genus, self.get_by_id(cnxn, genus, creator_id))]
+        
+        return creator
+    
+    def get_creators(
+        self,
+        cnxn: sqlite3.Connection,
+        species: str,
+        creatures: pandas.DataFrame
+    ) -> list[tuple[str, pandas.DataFrame]]:
+        '''
+        Get the creators of many creatures, with one query 
+        per chunk of max_params distinct creator ids (see 
+        get_by_ids).
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        species : str
+            Name of the creature (child) table.
+        creatures : pandas.DataFrame
+            Dataframe of creature entity data.
+
+        Returns
+        -------
+        creators : list[tuple[str, pandas.DataFrame]]
+            List containing a single tuple of (creator table 
+            name, creator data), or an empty list if species 
+            has no creator table. Creator data has one row 
+            per creature, with the index of creatures; a 
+            creator shared by several creatures is repeated.
+
+        '''
+        genus: str | None = self.get_creator_genus(cnxn, species)
+        creators: list[tuple[str, pandas.DataFrame]] = []
+        
+        if genus:
+            creator_ids: list[int] = [int(i) for i in creatures[f'{genus}_id']]
+            found: pandas.DataFrame = self.get_by_ids(cnxn, genus, creator_ids)
+            
+            aligned: pandas.DataFrame = found.set_index(
+                'id', drop=False
+            ).reindex(creator_ids)
+            
+            aligned.index = creatures.index
+            creators = [(genus, aligned)]
+        
+        return creators
+    
+    def get_creatures(
         self, cnxn: sqlite3.Connection,
         genus: str,
-        creator: pandas.DataFrame
+        creator: pandas.DataFrame
+    ) -> list[tuple[str, pandas.DataFrame]]:
+        '''
+        Get all creatures of a given creator.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        genus : str
+            Name of the creator (parent) table.
+        creator : pandas.DataFrame
+            A single-row dataframe of creator entity data.
+
+        Returns
+        -------
+        creatures : list[tuple[str, pandas.DataFrame]]
+            List of two-tuples whose first entry is the 
+            name of the creature (child) table, & whose 
+            second entry is a dataframe of creature data.
+
+        '''
+        creator_id: int = creator.id.values[0]
+        species: list[str] = self.get_creature_species(cnxn, genus)
+        creatures: list[Any] = []
+        
+        for s in species:
+            where: str = Inquiry.where([f'{genus}_id'], [creator_id])
+            select: str = Inquiry.select(self.get_source(cnxn, s), ['*'], where)
+            
+            members: pandas.DataFrame = self.get_df(cnxn, select)
+            
+            creatures += [(s, members)]
+            
+        return creatures
+    
+    def chunk(
+        self,
+        values: list[Any]
+    ) -> list[list[Any]]:
+        '''
+        Split values bound to a query into chunks of at 
+        most max_params values, to stay below SQLite's 
+        limit on bound parameters.
+
+        Parameters
+        ----------
+        values : list[Any]
+            Values to split.
+
+        Returns
+        -------
+        chunks : list[list[Any]]
+            List of consecutive chunks of values.
+
+        '''
+        chunks: list[list[Any]] = [
+            values[i:i + self.max_params] for i in range(
+                0, len(values), self.max_params
+            )
+        ]
+        
+        return chunks
+    
+    def get_lineage(
+        self,
+        cnxn: sqlite3.Connection,
+        species: str
+    ) -> list[str]:
+        '''
+        Get the path of creator tables above a table.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        species : str
+            Name of the starting table.
+
+        Raises
+        ------
+        ValueError
+            If a table appears twice on the path, raise 
+            a ValueError.
+
+        Returns
+        -------
+        lineage : list[str]
+            Names of species & of each of its ancestor 
+            tables, from its creator table upward.
+
+        '''
+        lineage: list[str] = [species]
+        genus: str | None = self.get_creator_genus(cnxn, species)
+        
+        while genus:
+            if genus in lineage:
+                raise ValueError(' '.join([
+                    'Data integrity error:',
+                    f'{genus} is its own ancestor.'
+                ]))
+            
+            lineage += [genus]
+            genus = self.get_creator_genus(cnxn, genus)
+        
+        return lineage
+    
+    def ascend_all(
+        self,
+        cnxn: sqlite3.Connection,
+        species: str,
+        creature_ids: list[int],
+        expressions: bool = False
+    ) -> pandas.DataFrame:
+        '''
+        Get the complete ancestry of many creatures, with 
+        one query joining their table to each ancestor 
+        table (one query per chunk of max_params ids).
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        species : str
+            Name of the creature table.
+        creature_ids : list[int]
+            IDs of the creatures.
+        expressions : bool, optional
+            Whether to also get the trait value of each 
+            creature & ancestor. The default is False.
+
+        Returns
+        -------
+        lineages : pandas.DataFrame
+            Dataframe with one row per creature id, in 
+            the order given, & one column {table}_id per 
+            table from species upward (followed by 
+            {table}_{trait} if expressions is True). 
+            Values are missing for ids not found in 
+            species.
+
+        '''
+        import pandas
+        
+        lineage: list[str] = self.get_lineage(cnxn, species)
+        
+        traits: list[str] | None = [
+            self.get_trait(cnxn, kind) for kind in lineage
+        ] if expressions else None
+        
+        sources: list[str] | None = [
+            self.get_source(cnxn, kind) for kind in lineage
+        ] if expressions else None
+        
+        ids: list[int] = [int(i) for i in creature_ids]
+        frames: list[pandas.DataFrame] = []
+        
+        for chunk in self.chunk(list(dict.fromkeys(ids))) or [[]]:
+            placeholders: str = ','.join('?' for _ in chunk)
+            where: str = f'WHERE t0.id IN ({placeholders})'
+            select: str = Inquiry.select_lineage(lineage, traits, where, sources)
+            frames += [self.get_df(cnxn, select, params=chunk)]
+        
+        lineages: pandas.DataFrame = pandas.concat(
+            frames, ignore_index=True
+        ).set_index(f'{species}_id').reindex(ids).reset_index()
+        
+        return lineages
+            
+    
+    
+    ###########
+    # closure #
+    ###########
+    
+    def install_triggers(
+        self,
+        cnxn: sqlite3.Connection,
+        tablename: str
+    ) -> None:
+        '''
+        Install the triggers enabled on the instance on 
+        a table. Called whenever the instance creates a 
+        table.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        tablename : str
+            Name of the table.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if self.closure:
+            self.install_closure(cnxn, tablename)
+        
+        if self.changelog:
+            self.install_changelog(cnxn, tablename)
+        
+        if self.fulltext is True or (
+            isinstance(self.fulltext, list) and tablename in self.fulltext
+        ):
+            self.install_search(cnxn, tablename)
+    
+    def install_all_triggers(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> None:
+        '''
+        Install the triggers enabled on the instance on 
+        every table of the database, including tables 
+        created without them.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+
+        Returns
+        -------
+        None.
+
+        '''
+        for tablename in self.get_all_tables(cnxn):
+            self.install_triggers(cnxn, tablename)
+        
+        self.commit(cnxn)
+    
+    def install_closure(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str
+    ) -> None:
+        '''
+        Create the closure table if it does not exist, & 
+        the triggers maintaining it on a table.
+        
+        Inserting a being adds a row for the being itself 
+        at depth 0 & one for each of its creator's ancestors. 
+        Deleting a being removes its rows (those of its 
+        creatures are removed as the delete cascades), & 
+        moving a being to another creator moves its whole 
+        subtree. Rows already in the table are not added; 
+        see build_closure.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        closure_table: tuple[str, dict[str, str]] = Tabula.get_closure_table()
+        closure: str = closure_table[0]
+        columns: list[str] = [c for c in closure_table[1] if c != 'PRIMARY KEY']
+        column_str: str = ','.join(columns)
+        
+        self.execute(cnxn, Inquiry.create(*closure_table))
+        
+        self.execute(cnxn, Inquiry.create_index(
+            f'{closure}_descendant', closure, ['descendant_kind', 'descendant_id']
+        ))
+        
+        genus: str | None = self.get_creator_genus(cnxn, kind)
+        
+        insert: list[str] = [' '.join([
+            f'INSERT INTO {closure} ({column_str})',
+            f"VALUES ('{kind}', NEW.id, '{kind}', NEW.id, 0)"
+        ])]
+        
+        if genus:
+            insert += [' '.join([
+                f'INSERT INTO {closure} ({column_str})',
+                f"SELECT ancestor_kind, ancestor_id, '{kind}', NEW.id, depth + 1",
+                f'FROM {closure}',
+                f"WHERE descendant_kind = '{genus}'",
+                f'AND descendant_id = NEW.{genus}_id'
+            ])]
+        
+        delete: list[str] = [' '.join([
+            f'DELETE FROM {closure}',
+            f"WHERE descendant_kind = '{kind}' AND descendant_id = OLD.id"
+        ])]
+        
+        self.execute(cnxn, Inquiry.create_trigger(
+            f'{closure}_{kind}_insert', kind, 'INSERT', insert
+        ))
+        
+        self.execute(cnxn, Inquiry.create_trigger(
+            f'{closure}_{kind}_delete', kind, 'DELETE', delete
+        ))
+        
+        if genus:
+            subtree: str = ' '.join([
+                f'SELECT descendant_kind, descendant_id FROM {closure}',
+                f"WHERE ancestor_kind = '{kind}' AND ancestor_id = NEW.id"
+            ])
+            
+            move: list[str] = [' '.join([
+                f'DELETE FROM {closure}',
+                f'WHERE (descendant_kind, descendant_id) IN ({subtree})',
+                f'AND (ancestor_kind, ancestor_id) NOT IN ({subtree})'
+            ]), ' '.join([
+                f'INSERT INTO {closure} ({column_str})',
+                'SELECT a.ancestor_kind, a.ancestor_id,',
+                'd.descendant_kind, d.descendant_id, a.depth + d.depth + 1',
+                f'FROM {closure} a, {closure} d',
+                f"WHERE a.descendant_kind = '{genus}'",
+                f'AND a.descendant_id = NEW.{genus}_id',
+                f"AND d.ancestor_kind = '{kind}' AND d.ancestor_id = NEW.id"
+            ])]
+            
+            self.execute(cnxn, Inquiry.create_trigger(
+                f'{closure}_{kind}_move', kind, f'UPDATE OF {genus}_id', move,
+                when=f'OLD.{genus}_id IS NOT NEW.{genus}_id'
+            ))
+    
+    def build_closure(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> int:
+        '''
+        Install closure triggers on every table & rebuild 
+        the closure table from the beings in the database. 
+        Needed once for databases written without closure 
+        triggers.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        
+        Returns
+        -------
+        rows_inserted : int
+            Count of rows in the rebuilt closure table.
+        
+        '''
+        closure_table: tuple[str, dict[str, str]] = Tabula.get_closure_table()
+        closure: str = closure_table[0]
+        columns: list[str] = [c for c in closure_table[1] if c != 'PRIMARY KEY']
+        column_str: str = ','.join(columns)
+        
+        tables: list[str] = self.get_all_tables(cnxn)
+        
+        genera: dict[str, str | None] = {
+            t: self.get_creator_genus(cnxn, t) for t in tables
+        }
+        
+        for kind in tables:
+            self.install_closure(cnxn, kind)
+        
+        rows_inserted: int = 0
+        built: list[str] = []
+        
+        with cnxn:
+            self.execute(cnxn, Inquiry.delete(closure))
+            
+            while len(built) < len(tables):
+                rung: list[str] = [
+                    t for t in tables if t not in built and 
+                    (genera[t] is None or genera[t] in built)
+                ]
+                
+                if not rung:
+                    break
+                
+                for kind in rung:
+                    genus: str | None = genera[kind]
+                    
+                    inserts: list[str] = [' '.join([
+                        f'INSERT INTO {closure} ({column_str})',
+                        f"SELECT '{kind}', id, '{kind}', id, 0 FROM {kind}"
+                    ])]
+                    
+                    if genus:
+                        inserts += [' '.join([
+                            f'INSERT INTO {closure} ({column_str})',
+                            f"SELECT c.ancestor_kind, c.ancestor_id, '{kind}',",
+                            't.id, c.depth + 1',
+                            f'FROM {kind} t JOIN {closure} c',
+                            f"ON c.descendant_kind = '{genus}'",
+                            f'AND c.descendant_id = t.{genus}_id'
+                        ])]
+                    
+                    for insert in inserts:
+                        rows_inserted += self.execute(cnxn, insert).rowcount
+                
+                built += rung
+        
+        self.commit(cnxn)
+        
+        return rows_inserted
+    
+    def has_closure(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> bool:
+        '''
+        Check whether the database has a closure table 
+        maintained on every table. Tables created without 
+        closure triggers (e.g., by an instance without 
+        closure=True) are missing from the closure table 
+        until build_closure is called.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        
+        Returns
+        -------
+        exists : bool
+            True if the closure table exists & every table 
+            has closure triggers.
+        
+        '''
+        closure: str = Tabula.get_closure_table()[0]
+        
+        if not self.has_table(cnxn, closure):
+            return False
+        
+        where: str = Inquiry.where(['type'], ['trigger'])
+        sql: str = Inquiry.select('sqlite_schema', ['name'], where)
+        triggers: set[str] = set(self.get_df(cnxn, sql).name)
+        
+        exists: bool = all(
+            f'{closure}_{t}_insert' in triggers for t in self.get_all_tables(cnxn)
+        )
+        
+        return exists
+    
+    def get_closure_rows(
+        self,
+        cnxn: sqlite3.Connection,
+        sql: str,
+        params: list[Any],
+        expected_columns: list[str]
+    ) -> pandas.DataFrame:
+        '''
+        Read rows of the closure table.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        sql : str
+            A SQL query of the closure table.
+        params : list[Any]
+            Values bound to placeholders in sql.
+        expected_columns : list[str]
+            Columns returned by sql.
+        
+        Raises
+        ------
+        ValueError
+            If the database has no closure table, raise 
+            a ValueError.
+        
+        Returns
+        -------
+        rows : pandas.DataFrame
+            Dataframe of query results.
+        
+        '''
+        rows: pandas.DataFrame = self.get_df(
+            cnxn, sql, expected_columns=expected_columns, params=params
+        )
+        
+        if rows.empty and not self.has_closure(cnxn):
+            raise ValueError(' '.join([
+                'Found no closure table.',
+                'Pass closure=True or call build_closure.'
+            ]))
+        
+        return rows
+    
+    def descendants(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        being_id: int,
+        max_depth: int | None = None
+    ) -> pandas.DataFrame:
+        '''
+        Get all descendants of a being with a single query 
+        of the closure table.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the being's table.
+        being_id : int
+            ID of the being.
+        max_depth : int | None, optional
+            Maximum distance of descendants from the being. 
+            If None, get descendants at any distance. The 
+            default is None.
+        
+        Raises
+        ------
+        ValueError
+            If the database has no closure table, raise 
+            a ValueError.
+        
+        Returns
+        -------
+        descendants : pandas.DataFrame
+            Dataframe with the descendant_kind, descendant_id 
+            & depth of each descendant, ordered by depth.
+        
+        '''
+        closure: str = Tabula.get_closure_table()[0]
+        columns: list[str] = ['descendant_kind', 'descendant_id', 'depth']
+        where: str = 'WHERE ancestor_kind = ? AND ancestor_id = ? AND depth > 0'
+        params: list[Any] = [kind, int(being_id)]
+        
+        if max_depth is not None:
+            where = f'{where} AND depth <= ?'
+            params += [int(max_depth)]
+        
+        select: str = Inquiry.select(closure, columns, where)
+        select = f'{select} ORDER BY depth, descendant_kind, descendant_id'
+        
+        descendants: pandas.DataFrame = self.get_closure_rows(
+            cnxn, select, params, columns
+        )
+        
+        return descendants
+    
+    def ancestors(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str,
+        being_id: int
+    ) -> pandas.DataFrame:
+        '''
+        Get the lineage of a being with a single query 
+        of the closure table.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the being's table.
+        being_id : int
+            ID of the being.
+        
+        Raises
+        ------
+        ValueError
+            If the database has no closure table, raise 
+            a ValueError.
+        
+        Returns
+        -------
+        ancestors : pandas.DataFrame
+            Dataframe with the ancestor_kind, ancestor_id 
+            & depth of each ancestor, from the being's 
+            creator (depth 1) upward.
+        
+        '''
+        closure: str = Tabula.get_closure_table()[0]
+        columns: list[str] = ['ancestor_kind', 'ancestor_id', 'depth']
+        where: str = 'WHERE descendant_kind = ? AND descendant_id = ? AND depth > 0'
+        select: str = Inquiry.select(closure, columns, where)
+        select = f'{select} ORDER BY depth'
+        
+        ancestors: pandas.DataFrame = self.get_closure_rows(
+            cnxn, select, [kind, int(being_id)], columns
+        )
+        
+        return ancestors
+    
+    def get_subtrees(
+        self,
+        cnxn: sqlite3.Connection,
+        genus: str,
+        creator_ids: list[int],
+        max_depth: int | None = None,
+        traits: bool = True
     ) -> list[tuple[str, pandas.DataFrame]]:
         '''
-        Get all creatures of a given creator.
-
+        Get the descendants of many creators, with one 
+        query of the closure table joined to each species 
+        of descendant.
+        
         Parameters
         ----------
         cnxn : sqlite3.Connection
             A database connection.
         genus : str
-            Name of the creator (parent) table.
-        creator : pandas.DataFrame
-            A single-row dataframe of creator entity data.
-
+            Name of the creator table.
+        creator_ids : list[int]
+            IDs of the creators.
+        max_depth : int | None, optional
+            Maximum distance of descendants from their 
+            creator. If None, get descendants at any 
+            distance. The default is None.
+        traits : bool, optional
+            If False, only the id & creator id of each 
+            descendant are read, & traits are skipped. The 
+            default is True.
+        
+        Raises
+        ------
+        ValueError
+            If the database has no closure table, raise 
+            a ValueError.
+        
         Returns
         -------
-        creatures : list[tuple[str, pandas.DataFrame]]
+        subtrees : list[tuple[str, pandas.DataFrame]]
             List of two-tuples whose first entry is the 
-            name of the creature (child) table, & whose 
-            second entry is a dataframe of creature data.
-
+            name of a descendant table, & whose second is 
+            a dataframe of its descendants' data, with the 
+            id of their creator in genus (root_id) & their 
+            distance from it (depth).
+        
         '''
-        creator_id: int = creator.id.values[0]
-        species: list[str] = self.get_creature_species(cnxn, genus)
-        creatures: list[Any] = []
+        import pandas
         
-        for s in species:
-            where: str = Inquiry.where([f'{genus}_id'], [creator_id])
-            select: str = Inquiry.select(s, ['*'], where)
+        closure: str = Tabula.get_closure_table()[0]
+        chunks: list[list[int]] = self.chunk([int(i) for i in creator_ids])
+        
+        def get_where(chunk: list[int]) -> tuple[str, list[Any]]:
+            placeholders: str = ','.join('?' for _ in chunk)
+            where: str = ' '.join([
+                'c.ancestor_kind = ?',
+                f'AND c.ancestor_id IN ({placeholders})',
+                'AND c.depth > 0'
+            ])
+            params: list[Any] = [genus, *chunk]
             
-            members: pandas.DataFrame = self.get_df(cnxn, select)
+            if max_depth is not None:
+                where = f'{where} AND c.depth <= ?'
+                params += [int(max_depth)]
             
-            creatures += [(s, members)]
+            return where, params
+        
+        kinds: list[str] = []
+        
+        for chunk in chunks:
+            where, params = get_where(chunk)
             
-        return creatures
+            select: str = ' '.join([
+                f'SELECT DISTINCT c.descendant_kind FROM {closure} c',
+                f'WHERE {where}'
+            ])
+            
+            kinds += [
+                k for k in self.get_closure_rows(
+                    cnxn, select, params, ['descendant_kind']
+                ).descendant_kind if k not in kinds
+            ]
+        
+        subtrees: list[tuple[str, pandas.DataFrame]] = []
+        
+        for kind in kinds:
+            frames: list[pandas.DataFrame] = []
+            source: str = self.get_source(cnxn, kind) if traits else kind
+            columns: str = 't.*'
+            
+            if not traits:
+                columns = f't.id, t.{self.get_creator_genus(cnxn, kind)}_id'
+            
+            for chunk in chunks:
+                where, params = get_where(chunk)
+                
+                select = ' '.join([
+                    f'SELECT c.ancestor_id AS root_id, c.depth, {columns}',
+                    f'FROM {closure} c JOIN {source} t ON t.id = c.descendant_id',
+                    f'WHERE {where} AND c.descendant_kind = ?'
+                ])
+                
+                frames += [self.get_df(cnxn, select, params=[*params, kind])]
+            
+            subtrees += [(kind, pandas.concat(frames, ignore_index=True))]
+        
+        return subtrees
+    
+    
+    #############
+    # changelog #
+    #############
+    
+    def install_changelog(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str
+    ) -> None:
+        '''
+        Create the changelog table if it does not exist, 
+        & the triggers appending changes of a table to it.
+        
+        Each change is logged with the time at which it 
+        was made, in seconds since the epoch. Deletes & 
+        updates cascading from a creator are logged for 
+        each affected creature.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table.
+
+        Returns
+        -------
+        None.
+
+        '''
+        changelog_table: tuple[str, dict[str, str]] = Tabula.get_changelog_table()
+        changelog: str = changelog_table[0]
+        self.execute(cnxn, Inquiry.create(*changelog_table))
+        ts: str = "(julianday('now') - 2440587.5) * 86400.0"
+        
+        for op, row in [('insert', 'NEW'), ('update', 'NEW'), ('delete', 'OLD')]:
+            log: str = ' '.join([
+                f'INSERT INTO {changelog} (kind, id, op, ts)',
+                f"VALUES ('{kind}', {row}.id, '{op}', {ts})"
+            ])
+            
+            self.execute(cnxn, Inquiry.create_trigger(
+                f'{changelog}_{kind}_{op}', kind, op.upper(), [log]
+            ))
+    
+    def get_changes(
+        self,
+        cnxn: sqlite3.Connection,
+        since: int = 0,
+        kinds: list[str] | None = None
+    ) -> pandas.DataFrame:
+        '''
+        Get changes logged after a sequence number.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        since : int, optional
+            Sequence number of the last change already 
+            seen. Pass the greatest seq returned by the 
+            previous call to get only newer changes. The 
+            default is 0.
+        kinds : list[str] | None, optional
+            If supplied, get only changes of these tables. 
+            The default is None.
+
+        Returns
+        -------
+        changes : pandas.DataFrame
+            Dataframe with the seq, kind, id, op ('insert', 
+            'update' or 'delete') & ts of each change, in 
+            the order the changes were made. Empty if the 
+            database has no changelog table.
+
+        '''
+        changelog_table: tuple[str, dict[str, str]] = Tabula.get_changelog_table()
+        changelog: str = changelog_table[0]
+        columns: list[str] = list(changelog_table[1].keys())
+        where: str = 'WHERE seq > ?'
+        params: list[Any] = [int(since)]
+        
+        if kinds is not None:
+            placeholders: str = ','.join('?' for _ in kinds)
+            where = f'{where} AND kind IN ({placeholders})'
+            params += list(kinds)
+        
+        select: str = Inquiry.select(changelog, columns, f'{where} ORDER BY seq')
+        
+        changes: pandas.DataFrame = self.get_df(
+            cnxn, select, expected_columns=columns, params=params
+        )
+        
+        return changes
+    
+    def compact_changelog(
+        self,
+        cnxn: sqlite3.Connection,
+        upto: int | None = None
+    ) -> int:
+        '''
+        Keep only the latest logged change of each being.
+        
+        After compaction, a reader of changes since any 
+        sequence number still learns the latest operation 
+        on every being changed since then, but not the 
+        operations before it. Readers should therefore 
+        treat an update of a being they have not seen as 
+        an insert.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        upto : int | None, optional
+            If supplied, compact only changes with a 
+            sequence number of at most upto. The default 
+            is None.
+
+        Returns
+        -------
+        rows_deleted : int
+            Count of changes removed from the log.
+
+        '''
+        changelog: str = Tabula.get_changelog_table()[0]
+        bound: str = '' if upto is None else 'AND seq <= ?'
+        params: list[Any] = [] if upto is None else [int(upto), int(upto)]
+        
+        delete: str = Inquiry.delete(changelog, ' '.join([
+            f'WHERE seq NOT IN (SELECT MAX(seq) FROM {changelog}',
+            f'WHERE 1 {bound} GROUP BY kind, id)',
+            bound
+        ]))
+        
+        with cnxn:
+            rows_deleted: int = self.execute(cnxn, delete, params).rowcount
+        
+        self.commit(cnxn)
+        
+        return rows_deleted
+    
+    ##########
+    # search #
+    ##########
+    
+    def install_search(
+        self,
+        cnxn: sqlite3.Connection,
+        kind: str
+    ) -> None:
+        '''
+        Create the full-text search tables if they do not 
+        exist, & the triggers keeping the trait expressions 
+        of a table in them.
+        
+        Beings already in the table are not indexed; see 
+        build_search.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kind : str
+            Name of the table.
+
+        Returns
+        -------
+        None.
+
+        '''
+        search_table: tuple[str, dict[str, str]] = Tabula.get_search_table()
+        search: str = search_table[0]
+        keys: str = Tabula.get_search_keys_table()[0]
+        trait: str
+        trait_type: str
+        trait, trait_type = self.describe_trait(cnxn, kind)
+        expression: str = f'NEW.{trait}'
+        
+        if trait_type == 'LEXICON':
+            lexicon: str = Tabula.get_lexicon_table(kind)[0]
+            expression = f'(SELECT expression FROM {lexicon} WHERE code = NEW.{trait})'
+        
+        self.execute(cnxn, Inquiry.create_virtual(search, 'fts5', search_table[1]))
+        self.execute(cnxn, Inquiry.create(*Tabula.get_search_keys_table()))
+        
+        def get_key(row: str) -> str:
+            return ' '.join([
+                f'(SELECT search_id FROM {keys}',
+                f"WHERE kind = '{kind}' AND id = {row}.id)"
+            ])
+        
+        insert: list[str] = [
+            f"INSERT INTO {keys} (kind, id) VALUES ('{kind}', NEW.id)",
+            ' '.join([
+                f'INSERT INTO {search} (rowid, expression)',
+                f"VALUES ({get_key('NEW')}, {expression})"
+            ])
+        ]
+        
+        delete: list[str] = [
+            f"DELETE FROM {search} WHERE rowid = {get_key('OLD')}",
+            f"DELETE FROM {keys} WHERE kind = '{kind}' AND id = OLD.id"
+        ]
+        
+        for op, statements in [
+            ('insert', insert), 
+            ('delete', delete), 
+            ('update', delete + insert)
+        ]:
+            event: str = f'UPDATE OF id, {trait}' if op == 'update' else op.upper()
             
-    
\ No newline at end of file
+            self.execute(cnxn, Inquiry.create_trigger(
+                f'{search}_{kind}_{op}', kind, event, statements
+            ))
+    
+    def build_search(
+        self,
+        cnxn: sqlite3.Connection,
+        kinds: list[str] | None = None
+    ) -> int:
+        '''
+        Install the full-text search triggers on tables & 
+        index the beings they already hold. Beings already 
+        indexed are indexed anew.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        kinds : list[str] | None, optional
+            Names of the tables to index. If None, index 
+            the tables listed in the fulltext attribute of 
+            the instance, or every table if it is not a 
+            list. The default is None.
+
+        Returns
+        -------
+        rows_inserted : int
+            Count of beings indexed.
+
+        '''
+        if kinds is None:
+            kinds = self.fulltext if isinstance(
+                self.fulltext, list
+            ) else self.get_all_tables(cnxn)
+        
+        search: str = Tabula.get_search_table()[0]
+        keys: str = Tabula.get_search_keys_table()[0]
+        rows_inserted: int = 0
+        
+        with cnxn:
+            for kind in kinds:
+                self.install_search(cnxn, kind)
+                trait: str = self.get_trait(cnxn, kind)
+                
+                self.execute(cnxn, ' '.join([
+                    f'DELETE FROM {search} WHERE rowid IN',
+                    f'(SELECT search_id FROM {keys} WHERE kind = ?)'
+                ]), [kind])
+                
+                self.execute(cnxn, f'DELETE FROM {keys} WHERE kind = ?', [kind])
+                
+                rows_inserted += self.execute(cnxn, ' '.join([
+                    f'INSERT INTO {keys} (kind, id)',
+                    f'SELECT ?, id FROM {kind} ORDER BY id'
+                ]), [kind]).rowcount
+                
+                self.execute(cnxn, ' '.join([
+                    f'INSERT INTO {search} (rowid, expression)',
+                    f'SELECT k.search_id, t.{trait}',
+                    f'FROM {keys} k JOIN {self.get_source(cnxn, kind)} t ON t.id = k.id',
+                    'WHERE k.kind = ?'
+                ]), [kind])
+        
+        self.commit(cnxn)
+        
+        return rows_inserted
+    
+    def search(
+        self,
+        cnxn: sqlite3.Connection,
+        query: str,
+        kinds: list[str] | None = None,
+        limit: int = 10
+    ) -> pandas.DataFrame:
+        '''
+        Find beings whose trait expressions match a 
+        full-text query, across all indexed tables.
+
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        query : str
+            An FTS5 query (e.g., 'reason', 'reason AND 
+            pure', '"pure reason"' or 'reas*').
+        kinds : list[str] | None, optional
+            If supplied, find only beings of these tables. 
+            The default is None.
+        limit : int, optional
+            Maximum count of beings returned. The default 
+            is 10.
+
+        Raises
+        ------
+        ValueError
+            If the database has no search table, raise a 
+            ValueError.
+
+        Returns
+        -------
+        hits : pandas.DataFrame
+            Dataframe with the kind, id, expression & score 
+            of each matching being, best matches first. 
+            Scores are bm25 ranks, which are lower for 
+            better matches.
+
+        '''
+        search: str = Tabula.get_search_table()[0]
+        keys: str = Tabula.get_search_keys_table()[0]
+        columns: list[str] = ['kind', 'id', 'expression', 'score']
+        
+        if not self.has_table(cnxn, search):
+            raise ValueError(' '.join([
+                'Found no search table.',
+                'Pass fulltext=True or call build_search.'
+            ]))
+        
+        where: str = f'WHERE {search} MATCH ?'
+        params: list[Any] = [query]
+        
+        if kinds is not None:
+            placeholders: str = ','.join('?' for _ in kinds)
+            where = f'{where} AND k.kind IN ({placeholders})'
+            params += list(kinds)
+        
+        select: str = ' '.join([
+            f'SELECT k.kind, k.id, s.expression, bm25({search}) AS score',
+            f'FROM {search} s JOIN {keys} k ON k.search_id = s.rowid',
+            f'{where} ORDER BY score LIMIT ?'
+        ])
+        
+        hits: pandas.DataFrame = self.get_df(
+            cnxn, select, expected_columns=columns, params=params + [int(limit)]
+        )
+        
+        return hits
@@ -2,6 +2,7 @@
 Generate SQL for indexia database oprerations.
 
 '''
+from datetime import datetime as dt, timezone
 from typing import Any
 
 class Inquiry:
@@ -41,6 +42,120 @@ class Inquiry:
         
         return create
     
+    @staticmethod
+    def create_virtual(
+        tablename: str,
+        module: str,
+        columns: dict[str, str]
+    ) -> str:
+        '''
+        Get a SQL CREATE VIRTUAL TABLE statement.
+
+        Parameters
+        ----------
+        tablename : str
+            Name of the table to create.
+        module : str
+            Name of the module implementing the table 
+            (e.g., fts5).
+        columns : dict[str, str]
+            Dict of columns to add to table. Keys are 
+            column names, values are options of the 
+            column (e.g., UNINDEXED) or ''.
+
+        Returns
+        -------
+        create : str
+            A formatted SQL CREATE VIRTUAL TABLE statement.
+
+        '''
+        column_list: list[str] = [
+            f'{col} {option}'.strip() for col, option in columns.items()
+        ]
+        
+        column_str: str = ','.join(column_list)
+        create: str = f'CREATE VIRTUAL TABLE IF NOT EXISTS {tablename}'
+        create = f'{create} USING {module}({column_str})'
+        
+        return create
+    
+    @staticmethod
+    def create_index(
+        indexname: str,
+        tablename: str,
+        columns: list[str],
+        unique: bool = False
+    ) -> str:
+        '''
+        Get a SQL CREATE INDEX statement.
+
+        Parameters
+        ----------
+        indexname : str
+            Name of the index to create.
+        tablename : str
+            Name of the indexed table.
+        columns : list[str]
+            List of indexed columns.
+        unique : bool, optional
+            Whether to create a UNIQUE index. The default 
+            is False.
+
+        Returns
+        -------
+        create : str
+            A formatted SQL CREATE INDEX statement.
+
+        '''
+        column_str: str = ','.join(columns)
+        create: str = 'CREATE UNIQUE INDEX' if unique else 'CREATE INDEX'
+        create = f'{create} IF NOT EXISTS {indexname}'
+        create = f'{create} ON {tablename} ({column_str})'
+        
+        return create
+    
+    @staticmethod
+    def create_trigger(
+        triggername: str,
+        tablename: str,
+        event: str,
+        statements: list[str],
+        when: str = ''
+    ) -> str:
+        '''
+        Get a SQL CREATE TRIGGER statement for a trigger 
+        fired after each affected row.
+
+        Parameters
+        ----------
+        triggername : str
+            Name of the trigger to create.
+        tablename : str
+            Name of the table on which the trigger fires.
+        event : str
+            Event firing the trigger (e.g., INSERT, DELETE, 
+            UPDATE OF column).
+        statements : list[str]
+            SQL statements run by the trigger. They may 
+            refer to the affected row as NEW or OLD.
+        when : str, optional
+            A SQL-formatted condition under which the 
+            trigger fires. The default is ''.
+
+        Returns
+        -------
+        create : str
+            A formatted SQL CREATE TRIGGER statement.
+
+        '''
+        statement_str: str = ' '.join(f'{s};' for s in statements)
+        create: str = f'CREATE TRIGGER IF NOT EXISTS {triggername}'
+        create = f'{create} AFTER {event} ON {tablename}'
+        create = f'{create} WHEN {when}' if when else create
+        create = f'{create} BEGIN {statement_str} END'
+        
+        return create
+    
     @staticmethod
     def insert(
         tablename: str,
@@ -77,6 +192,35 @@ class Inquiry:
         
         return insert
     
+    @staticmethod
+    def insert_many(
+        tablename: str,
+        columns: list[str]
+    ) -> str:
+        '''
+        Get a SQL INSERT statement with one placeholder 
+        per column, for use with executemany.
+
+        Parameters
+        ----------
+        tablename : str
+            Name of table into which values will be inserted.
+        columns : list[str]
+            List of column names.
+
+        Returns
+        -------
+        insert : str
+            A formatted SQL INSERT statement.
+
+        '''
+        column_str: str = ','.join(columns)
+        placeholder_str: str = ','.join('?' for _ in columns)
+        insert: str = f'INSERT INTO {tablename} ({column_str})'
+        insert = f'{insert} VALUES ({placeholder_str})'
+        
+        return insert
+    
     @staticmethod
     def select(
         tablename: str,
@@ -106,6 +250,66 @@ class Inquiry:
         
         return select
     
+    @staticmethod
+    def select_lineage(
+        lineage: list[str],
+        traits: list[str] | None = None,
+        conditions: str = '',
+        sources: list[str] | None = None
+    ) -> str:
+        '''
+        Get a SQL SELECT statement joining a creature table 
+        to each of its ancestor tables along their foreign 
+        keys. Tables are aliased t0 (the creature table), 
+        t1 (its creator table) & so on.
+
+        Parameters
+        ----------
+        lineage : list[str]
+            Names of the creature table & of each of its 
+            ancestor tables, from the creature's creator 
+            upward.
+        traits : list[str] | None, optional
+            Names of the trait columns of the tables in 
+            lineage. If supplied, the trait of each table 
+            is selected after its id. The default is None.
+        conditions : str, optional
+            A SQL-formatted string of conditions. The default is ''.
+        sources : list[str] | None, optional
+            Tables or subqueries read in place of the tables 
+            in lineage, which still name the selected columns. 
+            If None, read the tables in lineage. The default 
+            is None.
+
+        Returns
+        -------
+        select : str
+            A formatted SQL SELECT statement selecting one 
+            column {table}_id (& {table}_{trait}) per table 
+            in lineage.
+
+        '''
+        columns: list[str] = []
+        
+        for i, kind in enumerate(lineage):
+            columns += [f't{i}.id AS {kind}_id']
+            
+            if traits:
+                columns += [f't{i}.{traits[i]} AS {kind}_{traits[i]}']
+        
+        sources = sources if sources else lineage
+        
+        joins: list[str] = [f'{sources[0]} t0'] + [
+            ' '.join([
+                f'JOIN {sources[i]} t{i}',
+                f'ON t{i}.id = t{i - 1}.{lineage[i]}_id'
+            ]) for i in range(1, len(lineage))
+        ]
+        
+        select: str = Inquiry.select(' '.join(joins), columns, conditions)
+        
+        return select
+    
     @staticmethod
     def delete(
         tablename: str,
@@ -168,6 +372,34 @@ class Inquiry:
         
         return update
     
+    @staticmethod
+    def pragma(
+        name: str,
+        value: Any = None
+    ) -> str:
+        '''
+        Get a SQL PRAGMA statement.
+
+        Parameters
+        ----------
+        name : str
+            Name of the pragma.
+        value : Any, optional
+            Value to assign to the pragma. If None, the 
+            statement queries the current value. The 
+            default is None.
+
+        Returns
+        -------
+        pragma : str
+            A formatted SQL PRAGMA statement.
+
+        '''
+        pragma: str = f'PRAGMA {name}'
+        pragma = f'{pragma} = {value}' if value is not None else pragma
+        
+        return pragma
+    
     @staticmethod
     def where(
         cols: list[str],
@@ -209,10 +441,117 @@ class Tabula:
     Defines columns & data types of indexia tables.
     
     '''
+    trait_types: list[str] = ['TEXT', 'INTEGER', 'REAL', 'TIMESTAMP', 'LEXICON']
+    
+    @staticmethod
+    def get_trait_dtype(
+        trait_type: str
+    ) -> str:
+        '''
+        Get the declared data type of a trait column.
+
+        Parameters
+        ----------
+        trait_type : str
+            Type of the trait: 'TEXT', 'INTEGER', 'REAL', 
+            'TIMESTAMP' or 'LEXICON'. Timestamps are stored 
+            as integer seconds since the epoch. Lexicon 
+            traits are text stored as integer codes of the 
+            table's lexicon (see get_lexicon_table).
+
+        Raises
+        ------
+        ValueError
+            If trait_type is not a known trait type, raise a 
+            ValueError.
+
+        Returns
+        -------
+        dtype : str
+            The trait type, upper-cased.
+
+        '''
+        dtype: str = trait_type.upper()
+        
+        if dtype not in Tabula.trait_types:
+            raise ValueError(' '.join([
+                f'Found no trait type {trait_type}.',
+                f'Expected one of {Tabula.trait_types}.'
+            ]))
+        
+        return dtype
+    
+    @staticmethod
+    def encode_trait(
+        expr: Any,
+        trait_type: str
+    ) -> Any:
+        '''
+        Convert a trait expression to the value stored for 
+        a trait type.
+        
+        Timestamps may be given as seconds since the epoch, 
+        as datetime objects, as ISO 8601 strings, or as 
+        strings formatted YYYY-MM-DD-HH-MM. Timestamps 
+        without a time zone are read as UTC.
+
+        Parameters
+        ----------
+        expr : Any
+            The trait expression.
+        trait_type : str
+            Type of the trait. See get_trait_dtype.
+
+        Raises
+        ------
+        ValueError
+            If expr cannot be converted to trait_type, 
+            raise a ValueError.
+
+        Returns
+        -------
+        value : Any
+            The stored value: an int for INTEGER & TIMESTAMP 
+            traits, a float for REAL traits, & expr itself 
+            for traits of any other type.
+
+        '''
+        dtype: str = trait_type.upper()
+        
+        if dtype not in ['INTEGER', 'REAL', 'TIMESTAMP']:
+            return expr
+        
+        if dtype == 'INTEGER':
+            return int(expr)
+        
+        if dtype == 'REAL':
+            return float(expr)
+        
+        if not isinstance(expr, (dt, str)):
+            return int(expr)
+        
+        stamp: dt
+        
+        if isinstance(expr, dt):
+            stamp = expr
+        else:
+            try:
+                stamp = dt.strptime(expr, '%Y-%m-%d-%H-%M')
+            except ValueError:
+                stamp = dt.fromisoformat(expr)
+        
+        if stamp.tzinfo is None:
+            stamp = stamp.replace(tzinfo=timezone.utc)
+        
+        value: int = int(stamp.timestamp())
+        
+        return value
+    
     @staticmethod
     def get_creator_table(
         genus: str,
-        trait: str
+        trait: str,
+        trait_type: str = 'TEXT'
     ) -> tuple[str, dict[str, str]]:
         '''
         Get name & columns of a creator (parent) table.
@@ -222,7 +561,10 @@ class Tabula:
         genus : str
             Name of the creator (parent) table.
         trait : str
-            Name of the creator's text attribute.
+            Name of the creator's attribute.
+        trait_type : str, optional
+            Type of the attribute. See get_trait_dtype. The 
+            default is 'TEXT'.
 
         Returns
         -------
@@ -233,7 +575,7 @@ class Tabula:
         '''
         creator_table: tuple[str, dict[str, str]] = (genus, {
             'id': 'INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL',
-            trait: 'TEXT UNIQUE NOT NULL'
+            trait: f'{Tabula.get_trait_dtype(trait_type)} UNIQUE NOT NULL'
         })
         
         return creator_table
@@ -242,7 +584,8 @@ class Tabula:
     def get_creature_table(
         creator: str,
         species: str,
-        trait: str
+        trait: str,
+        trait_type: str = 'TEXT'
     ) -> tuple[str, dict[str, str]]:
         '''
         Get name & columns of a creature (child) table.
@@ -254,7 +597,10 @@ class Tabula:
         species : str
             Name of the creature table.
         trait : str
-            Name of the creature's text attribute.
+            Name of the creature's attribute.
+        trait_type : str, optional
+            Type of the attribute. See get_trait_dtype. The 
+            default is 'TEXT'.
 
         Returns
         -------
@@ -265,13 +611,147 @@ class Tabula:
         '''
         creature_table: tuple[str, dict[str, str]] = (species, {
             'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
-            trait: 'TEXT NOT NULL',
+            trait: f'{Tabula.get_trait_dtype(trait_type)} NOT NULL',
             f'{creator}_id': 'INTEGER NOT NULL',
             f'FOREIGN KEY ({creator}_id)': Tabula.references(creator, 'id')
         })
         
         return creature_table
     
+    @staticmethod
+    def get_closure_table(
+    ) -> tuple[str, dict[str, str]]:
+        '''
+        Get name & columns of the closure table, which 
+        holds one row for each pair of a being & one of 
+        its ancestors (or itself, at depth 0).
+
+        Returns
+        -------
+        closure_table : tuple[str, dict[str, str]]
+            A tuple whose first entry is the name of the closure 
+            table, & whose second is a dict of table columns & 
+            data types.
+
+        '''
+        closure_table: tuple[str, dict[str, str]] = ('indexia_closure', {
+            'ancestor_kind': 'TEXT NOT NULL',
+            'ancestor_id': 'INTEGER NOT NULL',
+            'descendant_kind': 'TEXT NOT NULL',
+            'descendant_id': 'INTEGER NOT NULL',
+            'depth': 'INTEGER NOT NULL',
+            'PRIMARY KEY': ' '.join([
+                '(ancestor_kind, ancestor_id,',
+                'descendant_kind, descendant_id)'
+            ])
+        })
+        
+        return closure_table
+    
+    @staticmethod
+    def get_changelog_table(
+    ) -> tuple[str, dict[str, str]]:
+        '''
+        Get name & columns of the changelog table, which 
+        holds one row for each insert, update or delete of 
+        a being, numbered in the order of the changes.
+
+        Returns
+        -------
+        changelog_table : tuple[str, dict[str, str]]
+            A tuple whose first entry is the name of the changelog 
+            table, & whose second is a dict of table columns & 
+            data types.
+
+        '''
+        changelog_table: tuple[str, dict[str, str]] = ('indexia_changelog', {
+            'seq': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+            'kind': 'TEXT NOT NULL',
+            'id': 'INTEGER NOT NULL',
+            'op': 'TEXT NOT NULL',
+            'ts': 'REAL NOT NULL'
+        })
+        
+        return changelog_table
+    
+    @staticmethod
+    def get_search_table(
+    ) -> tuple[str, dict[str, str]]:
+        '''
+        Get name & columns of the full-text search table, 
+        an FTS5 table holding the trait expression of each 
+        indexed being. Its rowid is the search_id of the 
+        being in the search keys table.
+
+        Returns
+        -------
+        search_table : tuple[str, dict[str, str]]
+            A tuple whose first entry is the name of the search 
+            table, & whose second is a dict of table columns & 
+            column options.
+
+        '''
+        search_table: tuple[str, dict[str, str]] = ('indexia_search', {
+            'expression': ''
+        })
+        
+        return search_table
+    
+    @staticmethod
+    def get_search_keys_table(
+    ) -> tuple[str, dict[str, str]]:
+        '''
+        Get name & columns of the search keys table, which 
+        holds the kind & id of each being in the full-text 
+        search table.
+
+        Returns
+        -------
+        search_keys_table : tuple[str, dict[str, str]]
+            A tuple whose first entry is the name of the search 
+            keys table, & whose second is a dict of table columns 
+            & data types.
+
+        '''
+        search_keys_table: tuple[str, dict[str, str]] = ('indexia_search_keys', {
+            'search_id': 'INTEGER PRIMARY KEY',
+            'kind': 'TEXT NOT NULL',
+            'id': 'INTEGER NOT NULL',
+            'UNIQUE': '(kind, id)'
+        })
+        
+        return search_keys_table
+    
+    @staticmethod
+    def get_lexicon_table(
+        kind: str
+    ) -> tuple[str, dict[str, str]]:
+        '''
+        Get name & columns of the lexicon of a table whose 
+        trait is of type LEXICON. The lexicon holds each 
+        distinct expression of the trait once, & the table 
+        holds the expression's code.
+
+        Parameters
+        ----------
+        kind : str
+            Name of the table.
+
+        Returns
+        -------
+        lexicon_table : tuple[str, dict[str, str]]
+            A tuple whose first entry is the name of the lexicon 
+            table, & whose second is a dict of table columns & 
+            data types.
+
+        '''
+        lexicon_table: tuple[str, dict[str, str]] = (f'indexia_lexicon_{kind}', {
+            'code': 'INTEGER PRIMARY KEY',
+            'expression': 'TEXT UNIQUE NOT NULL'
+        })
+        
+        return lexicon_table
+    
     @staticmethod
     def references(
         tablename: str, 
@@ -0,0 +1,386 @@
+'''
+Measure SQL statements executed by indexia.
+
+'''
+from __future__ import annotations
+from datetime import datetime as dt
+from typing import Any, TYPE_CHECKING
+import json
+import re
+import sqlite3
+import time
+
+if TYPE_CHECKING:
+    import pandas
+
+
+class Mensura:
+    '''
+    Record & summarize SQL statements executed on
+    indexia connections.
+    
+    '''
+    literals: list[tuple[re.Pattern[str], str]] = [
+        (re.compile(r"'(?:[^']|'')*'"), '?'),
+        (re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])'), '?'),
+    ]
+    
+    lists: list[tuple[re.Pattern[str], str]] = [
+        (re.compile(r'\?(?:\s*,\s*\?)+'), '?'),
+        (re.compile(r'\(\?\)(?:\s*,\s*\(\?\))+'), '(?)'),
+    ]
+    
+    def __init__(
+        self,
+        slow_threshold: float | None = None,
+        slow_log: str | None = None
+    ) -> None:
+        '''
+        Create a Mensura instance.
+        
+        Pass the instance to indexia.indexia.Indexia to
+        record the statements executed by its connections.
+        
+        Parameters
+        ----------
+        slow_threshold : float | None, optional
+            Duration in seconds at or above which a timed 
+            statement is treated as slow. Slow statements 
+            are explained with EXPLAIN QUERY PLAN & kept in 
+            the slow attribute. If None, no statement is 
+            treated as slow. The default is None.
+        slow_log : str | None, optional
+            Path to a JSONL file to which slow statements 
+            are appended. The default is None.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.slow_threshold: float | None = slow_threshold
+        self.slow_log: str | None = slow_log
+        self.records: list[dict[str, Any]] = []
+        self.slow: list[dict[str, Any]] = []
+        self.depth: int = 0
+    
+    @classmethod
+    def normalize(
+        cls,
+        sql: str
+    ) -> tuple[str, int]:
+        '''
+        Reduce a SQL statement to its shape.
+        
+        String & numeric literals are replaced with ?,
+        lists of placeholders are collapsed to a single
+        placeholder, & whitespace is collapsed.
+        
+        Parameters
+        ----------
+        sql : str
+            A SQL statement.
+        
+        Returns
+        -------
+        shape : str
+            The normalized statement.
+        num_literals : int
+            Count of literals replaced in the statement.
+        
+        '''
+        shape: str = sql
+        num_literals: int = 0
+        
+        for pattern, placeholder in cls.literals:
+            shape, count = pattern.subn(placeholder, shape)
+            num_literals += count
+        
+        for pattern, placeholder in cls.lists:
+            shape = pattern.sub(placeholder, shape)
+        
+        shape = ' '.join(shape.split()).rstrip(';').strip()
+        
+        return shape, num_literals
+    
+    def record(
+        self,
+        sql: str,
+        params: tuple[Any, ...] | list[Any],
+        duration: float | None,
+        rows: int | None
+    ) -> None:
+        '''
+        Record an executed statement.
+        
+        Parameters
+        ----------
+        sql : str
+            The executed SQL statement.
+        params : tuple[Any, ...] | list[Any]
+            Values bound to the statement.
+        duration : float | None
+            Seconds spent executing the statement, or None
+            if the statement was not timed.
+        rows : int | None
+            Count of rows returned or affected, or None if
+            unknown.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        shape: str
+        num_literals: int
+        shape, num_literals = self.normalize(sql)
+        
+        self.records += [{
+            'statement': shape,
+            'params': len(params) + num_literals,
+            'duration': duration,
+            'rows': rows
+        }]
+    
+    def trace(
+        self,
+        statement: str
+    ) -> None:
+        '''
+        Record a statement reported by SQLite.
+        
+        Used as the trace callback of indexia connections.
+        Statements executed while a timed call is in progress
+        are recorded by that call & ignored here, so each
+        statement is recorded once.
+        
+        Parameters
+        ----------
+        statement : str
+            The SQL statement reported by SQLite.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if not self.depth:
+            self.record(statement, (), None, None)
+    
+    def measure(
+        self,
+        sql: str,
+        params: tuple[Any, ...] | list[Any],
+        run: Any,
+        cnxn: sqlite3.Connection | None = None
+    ) -> tuple[Any, float]:
+        '''
+        Time a call that executes a SQL statement &
+        record the statement.
+        
+        Parameters
+        ----------
+        sql : str
+            The SQL statement executed by run.
+        params : tuple[Any, ...] | list[Any]
+            Values bound to the statement.
+        run : Any
+            A callable taking no arguments that executes
+            the statement & returns a cursor or dataframe.
+        cnxn : sqlite3.Connection | None, optional
+            Connection on which the statement is executed,
+            used to explain slow statements. The default
+            is None.
+        
+        Returns
+        -------
+        result : Any
+            The value returned by run.
+        duration : float
+            Seconds spent in run.
+        
+        '''
+        self.depth += 1
+        start: float = time.perf_counter()
+        
+        try:
+            result: Any = run()
+        finally:
+            self.depth -= 1
+        
+        duration: float = time.perf_counter() - start
+        
+        if hasattr(result, 'shape'):
+            rows: int | None = result.shape[0]
+        else:
+            rowcount: int = getattr(result, 'rowcount', -1)
+            rows = rowcount if rowcount >= 0 else None
+        
+        self.record(sql, params, duration, rows)
+        
+        if (
+            cnxn is not None and 
+            self.slow_threshold is not None and 
+            duration >= self.slow_threshold
+        ):
+            self.log_slow(cnxn, sql, params, duration)
+        
+        return result, duration
+    
+    def explain(
+        self,
+        cnxn: sqlite3.Connection,
+        sql: str,
+        params: tuple[Any, ...] | list[Any] = ()
+    ) -> list[str]:
+        '''
+        Get the query plan of a SQL statement.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            A database connection.
+        sql : str
+            The SQL statement to explain.
+        params : tuple[Any, ...] | list[Any], optional
+            Values bound to the statement. The default is ().
+        
+        Returns
+        -------
+        plan : list[str]
+            Details of each step of the query plan. Empty 
+            if the statement cannot be explained.
+        
+        '''
+        self.depth += 1
+        
+        try:
+            plan: list[str] = [
+                str(step[-1]) for step in cnxn.execute(
+                    f'EXPLAIN QUERY PLAN {sql}', params
+                ).fetchall()
+            ]
+        except sqlite3.Error:
+            plan = []
+        finally:
+            self.depth -= 1
+        
+        return plan
+    
+    def log_slow(
+        self,
+        cnxn: sqlite3.Connection,
+        sql: str,
+        params: tuple[Any, ...] | list[Any],
+        duration: float
+    ) -> dict[str, Any]:
+        '''
+        Explain a slow statement & log it.
+        
+        Steps of the query plan that scan a table or index 
+        are flagged in the scans entry. The full_scan entry 
+        is True if any table is scanned without an index.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            Connection on which the statement was executed.
+        sql : str
+            The slow SQL statement.
+        params : tuple[Any, ...] | list[Any]
+            Values bound to the statement.
+        duration : float
+            Seconds spent executing the statement.
+        
+        Returns
+        -------
+        entry : dict[str, Any]
+            The logged entry.
+        
+        '''
+        plan: list[str] = self.explain(cnxn, sql, params)
+        scans: list[str] = [p for p in plan if p.startswith('SCAN')]
+        
+        entry: dict[str, Any] = {
+            'ts': dt.now().isoformat(),
+            'statement': sql,
+            'shape': self.normalize(sql)[0],
+            'params': list(params),
+            'duration': duration,
+            'plan': plan,
+            'scans': scans,
+            'full_scan': any('USING' not in s for s in scans)
+        }
+        
+        self.slow += [entry]
+        
+        if self.slow_log:
+            with open(self.slow_log, 'a') as log:
+                log.write(json.dumps(entry, default=str) + '\n')
+        
+        return entry
+    
+    def get_stats(
+        self,
+        as_frame: bool = True
+    ) -> pandas.DataFrame | dict[str, dict[str, Any]]:
+        '''
+        Aggregate recorded statements by shape.
+        
+        Parameters
+        ----------
+        as_frame : bool, optional
+            If True, return a dataframe. Otherwise return a
+            dict keyed by statement shape. The default is True.
+        
+        Returns
+        -------
+        stats : pandas.DataFrame | dict[str, dict[str, Any]]
+            Count, total, mean & 50th, 95th & 99th percentile
+            duration (in seconds), & total rows of each
+            statement shape, sorted by descending total
+            duration.
+        
+        '''
+        import pandas
+        
+        columns: list[str] = ['statement', 'params', 'duration', 'rows']
+        
+        records = pandas.DataFrame(
+            data=self.records, columns=columns
+        ).astype({'duration': 'float64', 'rows': 'float64'})
+        
+        grouped = records.groupby('statement', sort=False)
+        
+        stats: pandas.DataFrame = pandas.DataFrame({
+            'count': grouped.size(),
+            'params': grouped.params.max(),
+            'total': grouped.duration.sum(),
+            'mean': grouped.duration.mean(),
+            'p50': grouped.duration.quantile(0.5),
+            'p95': grouped.duration.quantile(0.95),
+            'p99': grouped.duration.quantile(0.99),
+            'rows': grouped.rows.sum()
+        }).sort_values(
+            by=['total', 'count'], ascending=False
+        ).reset_index()
+        
+        if not as_frame:
+            return stats.set_index('statement').to_dict(orient='index')
+        
+        return stats
+    
+    def reset(
+        self
+    ) -> None:
+        '''
+        Discard all recorded statements. The slow-query 
+        log file is left as is.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.records = []
+        self.slow = []
@@ -0,0 +1,245 @@
+'''
+Remember beings fetched by indexia.
+
+'''
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, TYPE_CHECKING
+import sqlite3
+
+if TYPE_CHECKING:
+    import pandas
+
+
+class Mneme:
+    '''
+    Least-recently-used identity map of beings fetched
+    by id or by trait, keyed by database.
+    
+    '''
+    def __init__(
+        self,
+        size: int = 1024,
+        check_data_version: bool = False
+    ) -> None:
+        '''
+        Create a Mneme instance.
+        
+        Pass the instance to indexia.indexia.Indexia to
+        serve repeated get_by_id & get_by_trait lookups from
+        memory. Writes made through indexia.indexia.Indexia
+        invalidate the entries they affect.
+        
+        Parameters
+        ----------
+        size : int, optional
+            Maximum count of lookups remembered. When full,
+            the least recently used lookup is forgotten. The
+            default is 1024.
+        check_data_version : bool, optional
+            Whether to check PRAGMA data_version before each
+            lookup, forgetting all lookups if another
+            connection has committed to the database. The
+            version of a connection cannot be compared with
+            that of another, so lookups are also forgotten
+            whenever a different connection is checked; use a
+            long-lived connection with this option. The
+            default is False.
+        
+        Raises
+        ------
+        ValueError
+            If size is less than 1, raise a ValueError.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if size < 1:
+            raise ValueError(f'Mneme size must be at least 1. Found {size}.')
+        
+        self.size: int = size
+        self.check_data_version: bool = check_data_version
+        self.entries: OrderedDict[tuple[str, str, str, Any], pandas.DataFrame] = OrderedDict()
+        self.keys: dict[tuple[str, str], set[tuple[str, str, str, Any]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.cnxn: sqlite3.Connection | None = None
+        self.data_version: int | None = None
+    
+    def check(
+        self,
+        cnxn: sqlite3.Connection
+    ) -> None:
+        '''
+        Forget all lookups if the database may have been
+        changed by another connection. Does nothing unless
+        check_data_version is True.
+        
+        Parameters
+        ----------
+        cnxn : sqlite3.Connection
+            Connection used for the next lookup.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if not self.check_data_version:
+            return
+        
+        data_version: int = cnxn.execute('PRAGMA data_version').fetchone()[0]
+        
+        if cnxn is not self.cnxn or data_version != self.data_version:
+            self.clear()
+        
+        self.cnxn = cnxn
+        self.data_version = data_version
+    
+    def get(
+        self,
+        key: tuple[str, str, str, Any]
+    ) -> pandas.DataFrame | None:
+        '''
+        Recall a lookup.
+        
+        Parameters
+        ----------
+        key : tuple[str, str, str, Any]
+            Key of the lookup, of the form (db, 'id', kind,
+            id) or (db, 'trait', kind, expr), where db
+            identifies the database, so that lookups of
+            instances on different databases sharing a
+            Mneme are kept apart.
+        
+        Returns
+        -------
+        being : pandas.DataFrame | None
+            A copy of the remembered dataframe, or None if
+            the lookup is not remembered.
+        
+        '''
+        being: pandas.DataFrame | None = self.entries.get(key)
+        
+        if being is None:
+            self.misses += 1
+            
+            return None
+        
+        self.hits += 1
+        self.entries.move_to_end(key)
+        
+        return being.copy()
+    
+    def put(
+        self,
+        key: tuple[str, str, str, Any],
+        being: pandas.DataFrame
+    ) -> None:
+        '''
+        Remember a lookup. Empty results are not remembered,
+        so that inserted beings are found by later lookups.
+        
+        Parameters
+        ----------
+        key : tuple[str, str, str, Any]
+            Key of the lookup. See get.
+        being : pandas.DataFrame
+            Result of the lookup.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if being.empty:
+            return
+        
+        self.entries[key] = being.copy()
+        self.entries.move_to_end(key)
+        self.keys.setdefault((key[0], key[2]), set()).add(key)
+        
+        while len(self.entries) > self.size:
+            self.discard(next(iter(self.entries)))
+    
+    def discard(
+        self,
+        key: tuple[str, str, str, Any]
+    ) -> None:
+        '''
+        Forget a lookup.
+        
+        Parameters
+        ----------
+        key : tuple[str, str, str, Any]
+            Key of the lookup.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.entries.pop(key, None)
+        self.keys.get((key[0], key[2]), set()).discard(key)
+    
+    def forget(
+        self,
+        db: str,
+        kind: str,
+        ids: list[int] | None = None,
+        lookups: list[str] = ['id', 'trait']
+    ) -> int:
+        '''
+        Forget lookups of a kind in a database.
+        
+        Parameters
+        ----------
+        db : str
+            The database, as identified in lookup keys.
+        kind : str
+            Name of the table.
+        ids : list[int] | None, optional
+            If supplied, forget only lookups whose result
+            includes one of these ids. The default is None.
+        lookups : list[str], optional
+            Types of lookup to forget ('id' and/or 'trait').
+            The default is ['id', 'trait'].
+        
+        Returns
+        -------
+        forgotten : int
+            Count of lookups forgotten.
+        
+        '''
+        id_set: set[int] = {int(i) for i in ids} if ids is not None else set()
+        forgotten: int = 0
+        
+        for key in list(self.keys.get((db, kind), set())):
+            if key[1] not in lookups:
+                continue
+            
+            if ids is not None and id_set.isdisjoint(
+                int(i) for i in self.entries[key].id
+            ):
+                continue
+            
+            self.discard(key)
+            forgotten += 1
+        
+        return forgotten
+    
+    def clear(
+        self
+    ) -> None:
+        '''
+        Forget all lookups. Hit & miss counts are kept.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.entries = OrderedDict()
+        self.keys = {}
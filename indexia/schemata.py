@@ -2,17 +2,22 @@
 Defines tree & graph representations of indexia data.
 
 '''
+from __future__ import annotations
 from indexia.indexia import Indexia
-from pyvis.network import Network # type: ignore
+from indexia.inquiry import Tabula
 from sqlite3 import Connection
-from typing import Any
+from collections import Counter
+from typing import Any, TYPE_CHECKING
 import itertools
-import networkx as nx
 import os
-import pandas as pd
 import time
-import webbrowser
-import xml.etree.ElementTree as et
+
+if TYPE_CHECKING:
+    from indexia.archeion import Archeion
+    from pyvis.network import Network # type: ignore
+    import networkx as nx
+    import pandas as pd
+    import xml.etree.ElementTree as et
 
 
 class ScalaNaturae:
@@ -22,7 +27,8 @@ class ScalaNaturae:
     '''
     def __init__(
         self,
-        db: str
+        db: str,
+        **options: Any
     ) -> None:
         '''
         Creates a ScalaNaturae instance.
@@ -31,6 +37,10 @@ class ScalaNaturae:
         ----------
         db : str
             Path to the indexia database file.
+        **options : Any
+            Keyword arguments passed to each 
+            indexia.indexia.Indexia instance created 
+            (e.g., profile or mensura).
 
         Returns
         -------
@@ -38,6 +48,7 @@ class ScalaNaturae:
 
         '''
         self.db: str = db
+        self.options: dict[str, Any] = options
     
     def upward(
         self,
@@ -52,19 +63,20 @@ class ScalaNaturae:
         species : str
             Name of the starting creature table.
         creature : pandas.DataFrame
-            A single-row dataframe of creature entity data.
+            A dataframe of one or more creatures.
 
         Returns
         -------
         next_rung : list[tuple[str, pd.DataFrame]]
             list containing one tuple of the form (genus, creator),
             where genus is the name of the creator table & creator 
-            is a single-row dataframe of creator entity data.
+            is a dataframe of the creator of each creature, with 
+            the index of creature.
 
         '''
-        with Indexia(self.db) as ix:
+        with Indexia(self.db, **self.options) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
-            next_rung: list[tuple[str, pd.DataFrame]] = ix.get_creator(cnxn, species, creature)
+            next_rung: list[tuple[str, pd.DataFrame]] = ix.get_creators(cnxn, species, creature)
              
         return next_rung
      
@@ -91,7 +103,7 @@ class ScalaNaturae:
             & creature is a dataframe of creature entity data.
 
         '''
-        with Indexia(self.db) as ix:
+        with Indexia(self.db, **self.options) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
             next_rung: list[tuple[str, pd.DataFrame]] = ix.get_creatures(cnxn, genus, creator)
             
@@ -111,9 +123,11 @@ class ScalaNaturae:
         kind : str
             Name of the starting table.
         being : pandas.DataFrame
-            Dataframe of creator or creature entities. If the 
-            dataframe contains more than one row, only results 
-            for the first row will be returned.
+            Dataframe of creator or creature entities. When 
+            climbing up, the creator of each row is returned. 
+            When climbing down, if the dataframe contains more 
+            than one row, only results for the first row will 
+            be returned.
         direction : str
             Direction to climb. Must be either 'up' or 'down'.
 
@@ -144,6 +158,43 @@ class ScalaNaturae:
             raise ValueError('climb direction must be "up" or "down".')
             
         return next_rung
+    
+    def ascend_all(
+        self,
+        species: str,
+        creature_ids: list[int],
+        expressions: bool = False
+    ) -> pd.DataFrame:
+        '''
+        Climb from many creatures to the top of the 
+        hierarchy at once.
+
+        Parameters
+        ----------
+        species : str
+            Name of the starting creature table.
+        creature_ids : list[int]
+            IDs of the starting creatures.
+        expressions : bool, optional
+            Whether to also get the trait value of each 
+            creature & ancestor. The default is False.
+
+        Returns
+        -------
+        lineages : pandas.DataFrame
+            Dataframe with one row per creature id & one 
+            column per rung. See 
+            indexia.indexia.Indexia.ascend_all.
+
+        '''
+        with Indexia(self.db, **self.options) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            lineages: pd.DataFrame = ix.ascend_all(
+                cnxn, species, creature_ids, expressions=expressions
+            )
+        
+        return lineages
 
 
 class Dendron:
@@ -151,7 +202,7 @@ class Dendron:
     Represent indexia data as an XML tree.
     
     '''
-    def __init__(self, db: str) -> None:
+    def __init__(self, db: str, **options: Any) -> None:
         '''
         Creates a Dendron instance.
         
@@ -163,6 +214,9 @@ class Dendron:
         ----------
         db : str
             Path to the indexia database.
+        **options : Any
+            Keyword arguments passed to each 
+            indexia.indexia.Indexia instance created.
 
         Returns
         -------
@@ -170,13 +224,14 @@ class Dendron:
 
         '''
         self.db: str = db
-        self.trunk: ScalaNaturae = ScalaNaturae(self.db)
+        self.options: dict[str, Any] = options
+        self.trunk: ScalaNaturae = ScalaNaturae(self.db, **self.options)
         
     def render_image(
         self,
         genus: str,
         creators: pd.DataFrame,
-        root: et.Element = et.Element('root')
+        root: et.Element | None = None
     ) -> et.ElementTree:
         '''
         Render the XML tree.
@@ -188,11 +243,12 @@ class Dendron:
         creators : pandas.DataFrame
             One or more rows of the top-level table to 
             render as XML.
-        root : xml.etree.ElementTree.Element, optional
+        root : xml.etree.ElementTree.Element | None, optional
             Root element of the XML tree, used in iterative 
             calls to this method. It is not typically 
-            necessary to supply this argument. The default 
-            is xml.etree.ElementTree.Element('root').
+            necessary to supply this argument. If None, a 
+            new element named 'root' is used. The default 
+            is None.
 
         Returns
         -------
@@ -200,6 +256,11 @@ class Dendron:
             An XML element tree of indexia data.
 
         '''
+        import pandas as pd
+        import xml.etree.ElementTree as et
+        
+        root = root if root is not None else et.Element('root')
+        
         for _, creator in creators.iterrows():
             attrs: dict[str, Any] = {c: creator[c] for c in creators.columns}
             
@@ -249,6 +310,8 @@ class Dendron:
             Absolute path to the XML image file.
 
         '''
+        import webbrowser
+        
         file_path = file_path if file_path else 'dendron.xml'
         
         if os.path.isfile(file_path):
@@ -273,7 +336,12 @@ class Corpus:
         db: str,
         genus: str,
         creators: pd.DataFrame,
-        max_depth: int = 10
+        max_depth: int = 10,
+        archeion: Archeion | None = None,
+        compact: bool = False,
+        string_storage: str | None = None,
+        ids_only: bool = False,
+        **options: Any
     ) -> None:
         '''
         Creates a Corpus instance for the given creator data.
@@ -292,6 +360,26 @@ class Corpus:
         max_depth : int, optional
             Maximum number of levels to descend when assembling 
             the corpus. The default is 10.
+        archeion : indexia.archeion.Archeion | None, optional
+            If supplied, assembled corpora are kept on disk 
+            by archeion, keyed by the fingerprint of the 
+            database & the parameters of the instance, & 
+            reused while the database is unchanged. The 
+            default is None.
+        compact : bool, optional
+            If True, corpora are returned with compact dtypes. 
+            See make_compact. The default is False.
+        string_storage : str | None, optional
+            If supplied with compact, expressions are stored 
+            as pandas strings backed by this storage ('python' 
+            or 'pyarrow'). The default is None.
+        ids_only : bool, optional
+            If True, corpora hold only the genus, creator_id, 
+            species & creature_id columns, & traits are not 
+            read. See hydrate. The default is False.
+        **options : Any
+            Keyword arguments passed to each 
+            indexia.indexia.Indexia instance created.
 
         Returns
         -------
@@ -302,7 +390,31 @@ class Corpus:
         self.genus: str = genus
         self.creators: pd.DataFrame = creators
         self.max_depth: int = max_depth
-        self.spine = ScalaNaturae(self.db)
+        self.archeion: Archeion | None = archeion
+        self.compact: bool = compact
+        self.string_storage: str | None = string_storage
+        self.ids_only: bool = ids_only
+        self.options: dict[str, Any] = options
+        self.spine = ScalaNaturae(self.db, **self.options)
+    
+    def get_columns(
+        self
+    ) -> list[str]:
+        '''
+        Get the columns of the instance's corpora.
+
+        Returns
+        -------
+        columns : list[str]
+            Names of the corpus columns.
+
+        '''
+        columns: list[str] = ['genus', 'creator_id', 'species', 'creature_id']
+        
+        if not self.ids_only:
+            columns += ['trait', 'expression']
+        
+        return columns
     
     def get_trait(
         self,
@@ -323,7 +435,7 @@ class Corpus:
             Name of the trait column.
 
         '''
-        with Indexia(self.db) as ix:
+        with Indexia(self.db, **self.options) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
             trait: str = ix.get_trait(cnxn, species)
         
@@ -357,11 +469,13 @@ class Corpus:
             creator information.
 
         '''
+        import pandas as pd
+        
         creator_id: None | int = None if creator.empty else int(
             list(creator.id)[0]
         )
         
-        trait: str = self.get_trait(species)
+        trait: str | None = None if self.ids_only else self.get_trait(species)
         member = pd.DataFrame()
         
         for _, creature in creatures.iterrows():
@@ -371,8 +485,8 @@ class Corpus:
                 'species': [species],
                 'creature_id': [creature['id']],
                 'trait': [trait],
-                'expression': [creature[trait]]
-            })], axis=0)
+                'expression': [None if trait is None else creature[trait]]
+            })[self.get_columns()]], axis=0)
             
         return member
     
@@ -423,11 +537,91 @@ class Corpus:
         
         return limbs
     
+    def make_body(
+        self
+    ) -> pd.DataFrame | None:
+        '''
+        Creates a dataframe of the creatures of the 
+        instance's creator entities, up to the distance 
+        specified by max_depth, from the closure table.
+        
+        Members are ordered by creator, then by distance 
+        from the creator, species & creature id.
+
+        Returns
+        -------
+        body : pandas.DataFrame | None
+            Dataframe describing creature entities, 
+            including creator information, or None if 
+            the database has no closure table, or if 
+            some of its tables have no closure triggers.
+
+        '''
+        import pandas as pd
+        
+        columns: list[str] = self.get_columns()
+        
+        with Indexia(self.db, **self.options) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            if not ix.has_closure(cnxn):
+                return None
+            
+            subtrees: list[tuple[str, pd.DataFrame]] = ix.get_subtrees(
+                cnxn, self.genus, list(self.creators.id), self.max_depth, 
+                traits=not self.ids_only
+            )
+            
+            members: list[pd.DataFrame] = []
+            
+            for species, creatures in subtrees:
+                genus: str | None = ix.get_creator_genus(cnxn, species)
+                
+                member: pd.DataFrame = pd.DataFrame(data={
+                    'root_id': creatures.root_id,
+                    'depth': creatures.depth,
+                    'genus': genus,
+                    'creator_id': creatures[f'{genus}_id'],
+                    'species': species,
+                    'creature_id': creatures.id
+                })
+                
+                if not self.ids_only:
+                    trait: str = ix.get_trait(cnxn, species)
+                    member['trait'] = trait
+                    member['expression'] = creatures[trait]
+                
+                members += [member]
+        
+        if not members:
+            return pd.DataFrame(columns=columns)
+        
+        roots: dict[int, int] = {}
+        
+        for i, creator_id in enumerate(self.creators.id):
+            roots.setdefault(int(creator_id), i)
+        
+        body: pd.DataFrame = pd.concat(members, axis=0)
+        body['root'] = body.root_id.map(roots)
+        
+        body = body.sort_values(
+            by=['root', 'depth', 'species', 'creature_id'], kind='stable'
+        )[columns]
+        
+        return body
+    
     def assemble(
         self
     ) -> pd.DataFrame:
         '''
         Assemble the corpus of each of the creator entities.
+        
+        If the database has a closure table maintained on 
+        every table (see indexia.indexia.Indexia.build_closure 
+        & has_closure), creatures are read with one query 
+        per species, & ordered as described in make_body. Otherwise the hierarchy 
+        is descended one creature at a time, & each 
+        creature is followed by its own creatures.
 
         Returns
         -------
@@ -437,25 +631,485 @@ class Corpus:
             specified by max_depth.
 
         '''
+        import pandas as pd
+        
+        if self.archeion:
+            params: dict[str, Any] = {
+                'fingerprint': self.archeion.fingerprint(
+                    self.db, self.options.get('in_memory', False)
+                ),
+                'options': {
+                    k: v for k, v in self.options.items() 
+                    if isinstance(v, (bool, int, float, str, list))
+                },
+                'genus': self.genus,
+                'creators': self.archeion.hash_frame(self.creators),
+                'max_depth': self.max_depth,
+                'compact': self.compact,
+                'string_storage': self.string_storage,
+                'ids_only': self.ids_only
+            }
+            
+            cached: pd.DataFrame | None = self.archeion.load('corpus', params)
+            
+            if cached is not None:
+                return cached
+        
         head: pd.DataFrame = self.make_member(
             None, pd.DataFrame(), self.genus, self.creators
         )
         
-        limbs: list[pd.DataFrame] = []
+        body: pd.DataFrame | None = self.make_body()
         
-        for i in range(self.creators.shape[0]):
-            creator = self.creators.iloc[[i]]
+        if body is None:
+            limbs: list[pd.DataFrame] = []
             
-            limbs += [pd.concat(self.make_limbs(
-                self.genus, creator, 0
-            ), axis=0)]
+            for i in range(self.creators.shape[0]):
+                creator = self.creators.iloc[[i]]
+                
+                limbs += [pd.concat(self.make_limbs(
+                    self.genus, creator, 0
+                ), axis=0)]
             
-        body: pd.DataFrame = pd.concat(limbs, axis=0)
+            body = pd.concat(limbs, axis=0)
+        
         corpus: pd.DataFrame = pd.concat([head, body], axis=0)
         corpus.index = pd.Index([i for i in range(corpus.shape[0])])
         
+        if self.compact:
+            corpus = self.make_compact(corpus)
+        
+        if self.archeion:
+            self.archeion.store('corpus', params, corpus)
+        
         return corpus
     
+    def make_compact(
+        self,
+        corpus: pd.DataFrame
+    ) -> pd.DataFrame:
+        '''
+        Convert a corpus to compact dtypes.
+        
+        The genus, species & trait columns, which repeat a 
+        few names on every row, become categorical. The 
+        creator_id & creature_id columns become nullable 
+        integers, so that the missing creator of head rows 
+        no longer turns ids into floats. If string_storage 
+        is set, expressions become pandas strings with that 
+        storage (expressions of typed traits are converted 
+        to text).
+
+        Parameters
+        ----------
+        corpus : pandas.DataFrame
+            A corpus returned by assemble or refresh.
+
+        Returns
+        -------
+        compact : pandas.DataFrame
+            The corpus with compact dtypes.
+
+        '''
+        dtypes: dict[str, Any] = {
+            'genus': 'category',
+            'creator_id': 'Int64',
+            'species': 'category',
+            'creature_id': 'Int64',
+            'trait': 'category'
+        }
+        
+        if self.string_storage:
+            import pandas as pd
+            
+            dtypes['expression'] = pd.StringDtype(self.string_storage)
+        
+        compact: pd.DataFrame = corpus.astype({
+            c: t for c, t in dtypes.items() if c in corpus.columns
+        })
+        
+        return compact
+    
+    def get_changed_ids(
+        self,
+        ix: Indexia,
+        cnxn: Connection,
+        body: pd.DataFrame,
+        since: int | None
+    ) -> tuple[dict[str, list[int]], dict[str, list[int]], set[tuple[str, int]], int | None]:
+        '''
+        Get the ids of beings changed since a corpus was 
+        assembled.
+
+        Parameters
+        ----------
+        ix : indexia.indexia.Indexia
+            An Indexia instance.
+        cnxn : sqlite3.Connection
+            A connection opened by ix.
+        body : pandas.DataFrame
+            Members of the previous corpus below its 
+            creators.
+        since : int | None
+            Sequence number of the last change reflected in 
+            the previous corpus, or None to compare ids with 
+            the greatest id of each species in body.
+
+        Raises
+        ------
+        ValueError
+            If since is supplied & the database has no 
+            changelog table, raise a ValueError.
+
+        Returns
+        -------
+        upserts : dict[str, list[int]]
+            Ids of inserted or updated beings, by table.
+        deletes : dict[str, list[int]]
+            Ids of deleted beings, by table.
+        inserted : set[tuple[str, int]]
+            Table & id of each being inserted since the 
+            previous corpus.
+        seq : int | None
+            Sequence number of the last change read, or 
+            None if since is None.
+
+        '''
+        upserts: dict[str, list[int]] = {}
+        deletes: dict[str, list[int]] = {}
+        inserted: set[tuple[str, int]] = set()
+        
+        if since is None:
+            for species in ix.get_all_tables(cnxn):
+                lineage: list[str] = ix.get_lineage(cnxn, species)
+                
+                if self.genus not in lineage[1:self.max_depth + 1]:
+                    continue
+                
+                members: pd.DataFrame = body[body.species == species]
+                watermark: int = int(members.creature_id.max()) if not members.empty else 0
+                select: str = f'SELECT id FROM {species} WHERE id > ?'
+                ids: list[int] = [int(i) for i in ix.get_df(cnxn, select, params=[watermark]).id]
+                upserts[species] = ids
+                inserted |= {(species, i) for i in ids}
+            
+            return upserts, deletes, inserted, None
+        
+        changelog: str = Tabula.get_changelog_table()[0]
+        
+        if not ix.has_table(cnxn, changelog):
+            raise ValueError(' '.join([
+                'Found no changelog table.',
+                'Pass changelog=True or refresh with since=None.'
+            ]))
+        
+        changes: pd.DataFrame = ix.get_changes(cnxn, since=since)
+        seq: int = int(changes.seq.max()) if not changes.empty else since
+        
+        inserted = {
+            (str(k), int(i)) for k, i in 
+            changes[changes.op == 'insert'][['kind', 'id']].values
+        }
+        
+        latest: pd.DataFrame = changes.drop_duplicates(
+            subset=['kind', 'id'], keep='last'
+        )
+        
+        for kind, op, i in latest[['kind', 'op', 'id']].values:
+            changed: dict[str, list[int]] = deletes if op == 'delete' else upserts
+            changed.setdefault(str(kind), []).append(int(i))
+        
+        return upserts, deletes, inserted, seq
+    
+    def get_subtree_keys(
+        self,
+        body: pd.DataFrame,
+        keys: set[tuple[str, int]]
+    ) -> set[tuple[str, int]]:
+        '''
+        Get the members of a corpus below some of its 
+        members.
+
+        Parameters
+        ----------
+        body : pandas.DataFrame
+            Members of a corpus below its creators.
+        keys : set[tuple[str, int]]
+            Species & creature id of the starting members.
+
+        Returns
+        -------
+        subtree : set[tuple[str, int]]
+            Species & creature id of each member below the 
+            starting members.
+
+        '''
+        subtree: set[tuple[str, int]] = set()
+        frontier: set[tuple[str, int]] = set(keys)
+        
+        parents: list[tuple[str, int]] = [
+            (str(g), int(c)) for g, c in body[['genus', 'creator_id']].values
+        ]
+        
+        children: list[tuple[str, int]] = [
+            (str(s), int(c)) for s, c in body[['species', 'creature_id']].values
+        ]
+        
+        while frontier:
+            frontier = {
+                child for parent, child in zip(parents, children) 
+                if parent in frontier and child not in subtree
+            }
+            
+            subtree |= frontier
+        
+        return subtree
+    
+    def refresh(
+        self,
+        previous: pd.DataFrame,
+        since: int | None = None
+    ) -> pd.DataFrame:
+        '''
+        Update a corpus assembled earlier by the instance 
+        with the changes made to the database since.
+        
+        If since is supplied, changes are read from the 
+        changelog (see indexia.indexia.Indexia.get_changes): 
+        members of deleted beings are dropped, members of 
+        inserted & updated beings are added or rebuilt, & 
+        members below beings moved to another creator are 
+        moved with them. Otherwise, only beings whose id is 
+        greater than the greatest id of their species in 
+        previous are added, so deletes & updates are missed.
+        
+        Only the changed beings are read, so refreshing 
+        costs little more than the count of changes.
+
+        Parameters
+        ----------
+        previous : pandas.DataFrame
+            A corpus returned by assemble or refresh for the 
+            instance's creators & max_depth.
+        since : int | None, optional
+            Sequence number of the last change reflected in 
+            previous. A refreshed corpus holds the sequence 
+            number of its last change in attrs['seq']. The 
+            default is None.
+
+        Raises
+        ------
+        ValueError
+            If since is supplied & the database has no 
+            changelog table, raise a ValueError.
+
+        Returns
+        -------
+        corpus : pandas.DataFrame
+            Dataframe holding the same members as a corpus 
+            assembled anew, though not necessarily in the 
+            same order. Previous members keep their order, & 
+            new members follow them.
+
+        '''
+        import pandas as pd
+        
+        columns: list[str] = self.get_columns()
+        
+        head: pd.DataFrame = previous[previous.genus.isna()]
+        body: pd.DataFrame = previous[previous.genus.notna()]
+        root_ids: set[int] = {int(i) for i in self.creators.id}
+        
+        body_keys: list[tuple[str, int]] = [
+            (str(s), int(c)) for s, c in body[['species', 'creature_id']].values
+        ]
+        
+        body_creators: dict[tuple[str, int], int] = {
+            k: int(c) for k, c in zip(body_keys, body.creator_id)
+        }
+        
+        members: list[pd.DataFrame] = []
+        current: dict[tuple[str, int], int] = {}
+        moved_in: list[tuple[str, int, int]] = []
+        removed: set[tuple[str, int]] = set()
+        
+        with Indexia(self.db, **self.options) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            upserts: dict[str, list[int]]
+            deletes: dict[str, list[int]]
+            inserted: set[tuple[str, int]]
+            seq: int | None
+            upserts, deletes, inserted, seq = self.get_changed_ids(
+                ix, cnxn, body, since
+            )
+            
+            for kind, ids in deletes.items():
+                removed |= {(kind, i) for i in ids}
+            
+            for kind, ids in upserts.items():
+                removed |= {(kind, i) for i in ids}
+                
+                if kind == self.genus or not ix.has_table(cnxn, kind):
+                    continue
+                
+                lineage: list[str] = ix.get_lineage(cnxn, kind)
+                
+                if self.genus not in lineage[1:self.max_depth + 1]:
+                    continue
+                
+                depth: int = lineage.index(self.genus)
+                
+                rows: pd.DataFrame = ix.ascend_all(
+                    cnxn, kind, ids, expressions=not self.ids_only
+                )
+                
+                rows = rows[rows[f'{self.genus}_id'].isin(root_ids)]
+                
+                member: pd.DataFrame = pd.DataFrame(data={
+                    'genus': lineage[1],
+                    'creator_id': rows[f'{lineage[1]}_id'].astype(int),
+                    'species': kind,
+                    'creature_id': rows[f'{kind}_id'].astype(int)
+                })
+                
+                if not self.ids_only:
+                    trait: str = ix.get_trait(cnxn, kind)
+                    member['trait'] = trait
+                    member['expression'] = rows[f'{kind}_{trait}']
+                
+                members += [member[columns]]
+                
+                for i, creator_id in zip(
+                    rows[f'{kind}_id'].astype(int), rows[f'{lineage[1]}_id'].astype(int)
+                ):
+                    current[(kind, i)] = creator_id
+                    previous_id: int | None = body_creators.get((kind, i))
+                    
+                    if previous_id is None and (kind, i) in inserted:
+                        continue
+                    
+                    if previous_id != creator_id:
+                        moved_in += [(kind, i, depth)]
+        
+        removed |= self.get_subtree_keys(body, {
+            (kind, i) for kind, ids in deletes.items() for i in ids
+        } | {
+            k for k in removed if 
+            k in body_creators and current.get(k) != body_creators[k]
+        })
+        
+        for kind, i, depth in moved_in:
+            limbs: list[pd.DataFrame] = self.make_limbs(
+                kind, pd.DataFrame(data={'id': [i]}), depth
+            )
+            
+            members += limbs
+        
+        kept: pd.DataFrame = body[[k not in removed for k in body_keys]]
+        frames: list[pd.DataFrame] = [head, kept] + [m for m in members if not m.empty]
+        corpus: pd.DataFrame = pd.concat(frames, axis=0)[columns]
+        
+        corpus = corpus.drop_duplicates(
+            subset=['genus', 'species', 'creature_id'], keep='last'
+        )
+        
+        corpus.index = pd.Index([i for i in range(corpus.shape[0])])
+        
+        if self.compact:
+            corpus = self.make_compact(corpus)
+        
+        corpus.attrs['seq'] = seq
+        
+        return corpus
+    
+    def hydrate(
+        self,
+        corpus: pd.DataFrame,
+        columns: list[str] = ['expression']
+    ) -> pd.DataFrame:
+        '''
+        Add trait columns to a corpus assembled with 
+        ids_only.
+        
+        Expressions are read in bulk, with one query per 
+        species per chunk of ids (see 
+        indexia.indexia.Indexia.get_by_ids), & only for the 
+        creatures in corpus. Filter the corpus first to 
+        read fewer expressions.
+
+        Parameters
+        ----------
+        corpus : pandas.DataFrame
+            A corpus returned by assemble or refresh, or a 
+            subset of its rows.
+        columns : list[str], optional
+            Columns to add ('trait' and/or 'expression'). 
+            The default is ['expression'].
+
+        Raises
+        ------
+        ValueError
+            If columns includes any other column, raise a 
+            ValueError.
+
+        Returns
+        -------
+        hydrated : pandas.DataFrame
+            A copy of corpus with the requested columns. 
+            Creatures no longer in the database have no 
+            expression.
+
+        '''
+        import pandas as pd
+        
+        unknown: list[str] = [c for c in columns if c not in ['trait', 'expression']]
+        
+        if unknown:
+            raise ValueError(' '.join([
+                "Only 'trait' & 'expression' can be hydrated.",
+                f'Found {unknown}.'
+            ]))
+        
+        hydrated: pd.DataFrame = corpus.copy()
+        traits = pd.Series(None, index=corpus.index, dtype=object)
+        expressions = pd.Series(None, index=corpus.index, dtype=object)
+        
+        with Indexia(self.db, **self.options) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for species in corpus.species.dropna().unique():
+                rows: pd.Series = corpus.species == species
+                trait: str = ix.get_trait(cnxn, str(species))
+                traits[rows] = trait
+                
+                if 'expression' not in columns:
+                    continue
+                
+                creature_ids: pd.Series = corpus.creature_id[rows].astype(int)
+                
+                found: pd.DataFrame = ix.get_by_ids(
+                    cnxn, str(species), list(creature_ids), ['id', trait]
+                )
+                
+                expressions[rows] = creature_ids.map(
+                    dict(zip(found.id, found[trait]))
+                ).values
+        
+        for column, values in [('trait', traits), ('expression', expressions)]:
+            if column in columns:
+                hydrated[column] = values
+        
+        hydrated = hydrated[[c for c in [
+            'genus', 'creator_id', 'species', 
+            'creature_id', 'trait', 'expression'
+        ] if c in hydrated.columns]]
+        
+        if self.compact:
+            hydrated = self.make_compact(hydrated)
+        
+        return hydrated
+    
     def to_csv(
         self,
         corpus: pd.DataFrame,
@@ -495,7 +1149,8 @@ class Diktua:
         corpus: pd.DataFrame,
         as_nodes: str,
         as_edges: str,
-        self_edges: bool = False
+        self_edges: bool = False,
+        archeion: Archeion | None = None
     ) -> None:
         '''
         Creates an Indexinet instance.
@@ -514,6 +1169,11 @@ class Diktua:
         self_edges : bool, optional
             Whether to allow self-edges in the graph. 
             The default is False.
+        archeion : indexia.archeion.Archeion | None, optional
+            If supplied, graphs are kept on disk by archeion, 
+            keyed by a hash of the node & edge columns of 
+            corpus & the parameters of the instance, & reused 
+            for equal corpora. The default is None.
 
         Returns
         -------
@@ -524,7 +1184,33 @@ class Diktua:
         self.as_nodes: str = as_nodes
         self.as_edges: str = as_edges
         self.self_edges: bool = self_edges
-        self.make_undirected_graph()
+        self.archeion: Archeion | None = archeion
+        self.groups: dict[Any, Counter[Any]] | None = None
+        self.support: dict[tuple[Any, ...], int] | None = None
+        self.node_edges: dict[Any, int] | None = None
+        self.node_style: tuple[int, int] | None = None
+        
+        if not self.archeion:
+            self.make_undirected_graph()
+            
+            return None
+        
+        params: dict[str, Any] = {
+            'corpus': self.archeion.hash_frame(
+                self.corpus[[self.as_nodes, self.as_edges]]
+            ),
+            'as_nodes': self.as_nodes,
+            'as_edges': self.as_edges,
+            'self_edges': self.self_edges
+        }
+        
+        G: nx.Graph | None = self.archeion.load('diktua', params)
+        
+        if G is None:
+            self.make_undirected_graph()
+            self.archeion.store('diktua', params, self.G)
+        else:
+            self.G: nx.Graph = G
         
     def get_graph_elements(
         self
@@ -580,6 +1266,8 @@ class Diktua:
             instance data.
 
         '''
+        import networkx as nx
+        
         elements: tuple[list[Any], list[tuple[Any, Any]]] = self.get_graph_elements()
         nodes: list[Any] = elements[0]
         edges: list[tuple[Any, Any]] = elements[1]
@@ -590,6 +1278,203 @@ class Diktua:
         
         return None
     
+    def index_groups(
+        self
+    ) -> None:
+        '''
+        Count the nodes of each as_edges group & the groups 
+        supporting each edge of the corpus attribute of the 
+        instance, so that add_rows & remove_rows can update 
+        the graph one group at a time.
+
+        Returns
+        -------
+        None.
+
+        '''
+        self.groups = {}
+        self.support = {}
+        
+        for group, nodes in self.corpus.groupby(by=self.as_edges)[self.as_nodes]:
+            counts: Counter[Any] = Counter(nodes)
+            self.groups[group] = counts
+            
+            for edge in self.get_group_edges(counts):
+                self.support[edge] = self.support.get(edge, 0) + 1
+        
+        return None
+    
+    def get_group_edges(
+        self,
+        counts: Counter[Any]
+    ) -> set[tuple[Any, ...]]:
+        '''
+        Get the edges between the nodes of an as_edges group.
+
+        Parameters
+        ----------
+        counts : collections.Counter[Any]
+            Count of rows of each node in the group.
+
+        Returns
+        -------
+        edges : set[tuple[Any, ...]]
+            Sorted tuples representing graph edges.
+
+        '''
+        edges: set[tuple[Any, ...]] = {
+            tuple(sorted(c)) for c in itertools.combinations(counts, 2)
+        }
+        
+        if self.self_edges:
+            edges |= {(n, n) for n, count in counts.items() if count > 1}
+        
+        return edges
+    
+    def update_graph(
+        self,
+        rows: pd.DataFrame,
+        step: int
+    ) -> set[Any]:
+        '''
+        Add or remove the edges of corpus rows, updating 
+        only the as_edges groups of those rows.
+        
+        An edge is kept while at least one group supports 
+        it, & a node is kept while it has at least one edge.
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            Corpus rows to add or remove.
+        step : int
+            1 to add the rows, -1 to remove them.
+
+        Returns
+        -------
+        touched : set[Any]
+            Nodes whose edges changed.
+
+        '''
+        import pandas as pd
+        
+        if self.groups is None or self.support is None:
+            self.index_groups()
+        
+        groups: dict[Any, Counter[Any]] = self.groups # type: ignore
+        support: dict[tuple[Any, ...], int] = self.support # type: ignore
+        touched: set[Any] = set()
+        
+        for node, group in rows[[self.as_nodes, self.as_edges]].values:
+            if pd.isna(group):
+                continue
+            
+            counts: Counter[Any] = groups.setdefault(group, Counter())
+            edges: set[tuple[Any, ...]] = set()
+            
+            if counts[node] == (0 if step > 0 else 1):
+                edges |= {tuple(sorted((node, n))) for n in counts if n != node}
+            
+            if self.self_edges and counts[node] == (1 if step > 0 else 2):
+                edges |= {(node, node)}
+            
+            counts[node] += step
+            
+            if counts[node] <= 0:
+                del counts[node]
+            
+            if not counts:
+                del groups[group]
+            
+            for edge in edges:
+                support[edge] = support.get(edge, 0) + step
+                
+                if step > 0 and support[edge] == 1:
+                    self.G.add_edge(*edge) # type: ignore
+                    touched |= set(edge)
+                elif step < 0 and support[edge] == 0:
+                    del support[edge]
+                    self.G.remove_edge(*edge) # type: ignore
+                    touched |= set(edge)
+        
+        for node in touched:
+            if node in self.G and not len(self.G.adj[node]): # type: ignore
+                self.G.remove_node(node) # type: ignore
+        
+        return touched
+    
+    def add_rows(
+        self,
+        rows: pd.DataFrame
+    ) -> None:
+        '''
+        Add rows to the corpus attribute of the instance & 
+        their nodes & edges to its graph.
+        
+        Only the as_edges groups of the rows are visited, 
+        & if the graph has been styled, only the nodes whose 
+        edges changed are restyled (all nodes are restyled 
+        if the greatest edge count changes).
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            Rows with the columns of the corpus. They are 
+            relabelled to follow the greatest label of the 
+            corpus index.
+
+        Returns
+        -------
+        None.
+
+        '''
+        import pandas as pd
+        
+        start: int = int(self.corpus.index.max()) + 1 if not self.corpus.empty else 0
+        rows = rows.set_axis(pd.RangeIndex(start, start + rows.shape[0]), axis=0)
+        touched: set[Any] = self.update_graph(rows, 1)
+        self.corpus = pd.concat([self.corpus, rows], axis=0)
+        self.restyle_nodes(touched)
+        
+        return None
+    
+    def remove_rows(
+        self,
+        rows: pd.DataFrame
+    ) -> None:
+        '''
+        Remove rows from the corpus attribute of the instance 
+        & drop the edges they alone supported from its graph.
+        
+        Groups & nodes are updated as in add_rows.
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            Rows of the corpus, matched by index label.
+
+        Raises
+        ------
+        ValueError
+            If a label of rows is not in the corpus index, 
+            raise a ValueError.
+
+        Returns
+        -------
+        None.
+
+        '''
+        missing: list[Any] = [i for i in rows.index if i not in self.corpus.index]
+        
+        if missing:
+            raise ValueError(f'Rows not in corpus: {missing}.')
+        
+        touched: set[Any] = self.update_graph(self.corpus.loc[rows.index], -1)
+        self.corpus = self.corpus.drop(index=rows.index)
+        self.restyle_nodes(touched)
+        
+        return None
+    
     def get_node_info(
         self
     ) -> tuple[dict[Any, int], dict[Any, str]]:
@@ -626,7 +1511,8 @@ class Diktua:
         self,
         node_edges: dict[Any, int],
         min_size: int,
-        max_size: int
+        max_size: int,
+        max_edges: int | None = None
     ) -> dict[Any, int]:
         '''
         Calculate node size based on number of edges.
@@ -641,6 +1527,9 @@ class Diktua:
             Minimum node size.
         max_size : int
             Maximum node size.
+        max_edges : int | None, optional
+            Edge count scaled to max_size. If None, the 
+            greatest count of node_edges. The default is None.
 
         Returns
         -------
@@ -648,7 +1537,9 @@ class Diktua:
             Keys are graph nodes; values are node sizes.
 
         '''
-        max_edges: int = max(node_edges.values())
+        if max_edges is None:
+            max_edges = max(node_edges.values())
+        
         offset: int = max_size - min_size
         node_sizes: dict[Any, int] = {}
             
@@ -682,9 +1573,13 @@ class Diktua:
             Network graph with node attributes set.
 
         '''
+        import networkx as nx
+        
         node_info: tuple[dict[Any, int], dict[Any, str]] = self.get_node_info()
         node_edges: dict[Any, int]  = node_info[0]
         node_titles: dict[Any, str] = node_info[1]
+        self.node_edges = dict(node_edges)
+        self.node_style = (min_size, max_size)
 
         node_sizes: dict[Any, int] = self.get_node_sizes(
             node_edges, min_size, max_size
@@ -693,6 +1588,70 @@ class Diktua:
         nx.set_node_attributes(self.G, node_titles, 'title') # type: ignore
         
         return None
+    
+    def restyle_nodes(
+        self,
+        touched: set[Any]
+    ) -> None:
+        '''
+        Update size & title attributes of the nodes whose 
+        edges changed, if style_nodes has been called. All 
+        nodes are restyled if the greatest edge count has 
+        changed, since sizes are scaled to it.
+
+        Parameters
+        ----------
+        touched : set[Any]
+            Nodes whose edges changed.
+
+        Returns
+        -------
+        None.
+
+        '''
+        import networkx as nx
+        
+        if self.node_style is None or self.node_edges is None or not touched:
+            return None
+        
+        max_edges: int = max(self.node_edges.values(), default=0)
+        shrunk: bool = False
+        
+        for node in touched:
+            if self.node_edges.get(node) == max_edges:
+                shrunk = True
+            
+            if node in self.G:
+                self.node_edges[node] = len(self.G.adj[node]) # type: ignore
+            else:
+                self.node_edges.pop(node, None)
+        
+        if not self.node_edges:
+            return None
+        
+        touched_edges: dict[Any, int] = {
+            n: self.node_edges[n] for n in touched if n in self.node_edges
+        }
+        
+        new_max: int = max(touched_edges.values(), default=0)
+        
+        if new_max > max_edges or (shrunk and new_max < max_edges):
+            self.style_nodes(*self.node_style)
+            
+            return None
+        
+        node_sizes: dict[Any, int] = self.get_node_sizes(
+            touched_edges, *self.node_style, max_edges=max_edges
+        )
+        
+        node_titles: dict[Any, str] = {
+            n: f'({count})' for n, count in touched_edges.items()
+        }
+        
+        nx.set_node_attributes(self.G, node_sizes, 'size') # type: ignore
+        nx.set_node_attributes(self.G, node_titles, 'title') # type: ignore
+        
+        return None
 
     def plot(
         self,
@@ -721,6 +1680,8 @@ class Diktua:
             the output HTML file. Otherwise None.
 
         """
+        from pyvis.network import Network # type: ignore
+        
         plot: Network = Network(select_menu=True, filter_menu=True)
         plot.from_nx(self.G) # type: ignore
         plot.show_buttons() # type: ignore
@@ -752,6 +1713,8 @@ class Diktua:
             Path to the output CSV file.
 
         """
+        import pandas as pd
+        
         edges = pd.DataFrame(data={
             'source': [i[0] for i in self.G.edges], # type: ignore
             'target': [i[1] for i in self.G.edges] # type: ignore
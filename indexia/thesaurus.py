@@ -0,0 +1,278 @@
+'''
+Cache results of queries read by indexia.
+
+'''
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, TYPE_CHECKING
+import hashlib
+import os
+import pickle
+import sqlite3
+import uuid
+
+if TYPE_CHECKING:
+    import pandas
+
+
+class Thesaurus:
+    '''
+    Least-recently-used cache of query results, kept
+    until the database changes.
+    
+    '''
+    version: str = ' '.join([
+        'SELECT d.data_version, s.schema_version',
+        'FROM pragma_data_version d, pragma_schema_version s'
+    ])
+    
+    def __init__(
+        self,
+        size: int = 256,
+        spill_dir: str | None = None
+    ) -> None:
+        '''
+        Create a Thesaurus instance.
+        
+        Pass the instance to indexia.indexia.Indexia to
+        serve repeated get_df queries from memory.
+        
+        The thesaurus keeps its own connection to each
+        database it caches. Before each lookup, it reads
+        PRAGMA data_version & PRAGMA schema_version on
+        that connection. The data version changes whenever
+        any other connection (including those of indexia)
+        commits, so every result of a database is forgotten
+        as soon as the database changes.
+        
+        Parameters
+        ----------
+        size : int, optional
+            Maximum count of results kept in memory. The
+            default is 256.
+        spill_dir : str | None, optional
+            Directory to which results evicted from memory
+            are pickled instead of being forgotten. Spilled
+            results are valid for the life of the instance
+            only. If None, evicted results are forgotten.
+            The default is None.
+        
+        Raises
+        ------
+        ValueError
+            If size is less than 1, raise a ValueError.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        if size < 1:
+            raise ValueError(f'Thesaurus size must be at least 1. Found {size}.')
+        
+        self.size: int = size
+        self.spill_dir: str | None = spill_dir
+        self.entries: OrderedDict[tuple[str, str, tuple[Any, ...]], pandas.DataFrame] = OrderedDict()
+        self.spilled: dict[tuple[str, str, tuple[Any, ...]], str] = {}
+        self.tokens: dict[str, tuple[int, int]] = {}
+        self.watchers: dict[str, sqlite3.Connection] = {}
+        self.nonce: str = uuid.uuid4().hex
+        self.hits: int = 0
+        self.misses: int = 0
+        self.spills: int = 0
+        
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+    
+    def validate(
+        self,
+        db: str
+    ) -> tuple[int, int]:
+        '''
+        Forget all results of a database if it has changed
+        since they were cached.
+        
+        Parameters
+        ----------
+        db : str
+            Path to the database file.
+        
+        Returns
+        -------
+        token : tuple[int, int]
+            The data version & schema version of the
+            database.
+        
+        '''
+        if db not in self.watchers:
+            self.watchers[db] = sqlite3.connect(db)
+        
+        token: tuple[int, int] = tuple(
+            self.watchers[db].execute(self.version).fetchone()
+        )
+        
+        if self.tokens.get(db) != token:
+            self.forget(db)
+            self.tokens[db] = token
+        
+        return token
+    
+    def get(
+        self,
+        db: str,
+        sql: str,
+        params: tuple[Any, ...] | list[Any] = ()
+    ) -> pandas.DataFrame | None:
+        '''
+        Get the cached result of a query.
+        
+        Parameters
+        ----------
+        db : str
+            Path to the database file.
+        sql : str
+            The SQL query.
+        params : tuple[Any, ...] | list[Any], optional
+            Values bound to the query. The default is ().
+        
+        Returns
+        -------
+        df : pandas.DataFrame | None
+            A copy of the cached result, or None if the
+            result is not cached or the database has changed.
+        
+        '''
+        self.validate(db)
+        key: tuple[str, str, tuple[Any, ...]] = (db, sql, tuple(params))
+        df: pandas.DataFrame | None = self.entries.get(key)
+        
+        if df is None and key in self.spilled:
+            file_path: str = self.spilled.pop(key)
+            
+            with open(file_path, 'rb') as spill:
+                df = pickle.load(spill)
+            
+            os.remove(file_path)
+            self.put(db, sql, params, df)
+        
+        if df is None:
+            self.misses += 1
+            
+            return None
+        
+        self.hits += 1
+        self.entries.move_to_end(key)
+        
+        return df.copy()
+    
+    def put(
+        self,
+        db: str,
+        sql: str,
+        params: tuple[Any, ...] | list[Any],
+        df: pandas.DataFrame
+    ) -> None:
+        '''
+        Cache the result of a query.
+        
+        Parameters
+        ----------
+        db : str
+            Path to the database file.
+        sql : str
+            The SQL query.
+        params : tuple[Any, ...] | list[Any]
+            Values bound to the query.
+        df : pandas.DataFrame
+            Result of the query.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        key: tuple[str, str, tuple[Any, ...]] = (db, sql, tuple(params))
+        self.entries[key] = df.copy()
+        self.entries.move_to_end(key)
+        
+        while len(self.entries) > self.size:
+            self.evict()
+    
+    def evict(
+        self
+    ) -> None:
+        '''
+        Remove the least recently used result from memory,
+        spilling it to disk if spill_dir is set.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        key: tuple[str, str, tuple[Any, ...]]
+        df: pandas.DataFrame
+        key, df = self.entries.popitem(last=False)
+        
+        if not self.spill_dir:
+            return
+        
+        digest: str = hashlib.sha256(repr(key).encode()).hexdigest()
+        
+        file_path: str = os.path.join(
+            self.spill_dir, f'thesaurus_{self.nonce}_{digest}.pkl'
+        )
+        
+        with open(file_path, 'wb') as spill:
+            pickle.dump(df, spill)
+        
+        self.spilled[key] = file_path
+        self.spills += 1
+    
+    def forget(
+        self,
+        db: str | None = None
+    ) -> None:
+        '''
+        Forget cached results.
+        
+        Parameters
+        ----------
+        db : str | None, optional
+            Path to the database whose results are
+            forgotten. If None, forget all results. The
+            default is None.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        for key in [k for k in self.entries if db is None or k[0] == db]:
+            del self.entries[key]
+        
+        for key in [k for k in self.spilled if db is None or k[0] == db]:
+            file_path: str = self.spilled.pop(key)
+            
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+    
+    def close(
+        self
+    ) -> None:
+        '''
+        Forget all results & close the connections used
+        to watch databases.
+        
+        Returns
+        -------
+        None.
+        
+        '''
+        self.forget()
+        
+        for watcher in self.watchers.values():
+            watcher.close()
+        
+        self.watchers = {}
+        self.tokens = {}
@@ -0,0 +1,112 @@
+from indexia.apographon import Apographon
+from indexia.eidola import Maker
+from indexia.indexia import Indexia
+from indexia.schemata import Corpus, ScalaNaturae
+from sqlite3 import Connection
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import unittest as ut
+
+
+class TestApographon(ut.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_db: str = 'tests/data/test_apographon.db'
+        cls.snapshot_dir: str = 'tests/data/apographon'
+        cls.genus: str = 'creators'
+        
+        Maker(cls.test_db, 2, 20, 'name', bulk=True, fanout='zipf').make()
+        
+        with Indexia(cls.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i, word in enumerate(['logic', 'ethics', 'logic']):
+                ix.add_creature(
+                    cnxn, cls.genus, ix.get_by_id(cnxn, cls.genus, i + 1),
+                    'keywords', 'word', word, 'LEXICON'
+                )
+            
+            ix.add_creature(
+                cnxn, cls.genus, ix.get_by_id(cnxn, cls.genus, 1), 'dates',
+                'created', '2024-02-14-12-30', trait_type='TIMESTAMP'
+            )
+            
+            ix.build_closure(cnxn)
+            
+            cls.creators: pd.DataFrame = ix.get_df(cnxn, 'SELECT * FROM creators')
+        
+        cls.snapshot: Apographon = Apographon.freeze(cls.test_db, cls.snapshot_dir)
+    
+    def testOpen(self) -> None:
+        snapshot = Apographon(self.snapshot_dir)
+        self.assertEqual(snapshot.codes, self.snapshot.codes)
+        self.assertIsInstance(snapshot.get_array(self.genus, 'id'), np.memmap)
+        self.assertEqual(snapshot.get_species('keywords')['trait_type'], 'LEXICON')
+        
+        with self.assertRaises(ValueError):
+            Apographon('tests/data')
+        
+        with self.assertRaises(ValueError):
+            snapshot.get_species('strangers')
+    
+    def testLocate(self) -> None:
+        self.assertListEqual(
+            list(self.snapshot.locate(self.genus, [3, 1, 99])), [2, 0, -1]
+        )
+        
+        self.assertListEqual(
+            self.snapshot.get_expressions('keywords', [0, 1, 2]),
+            ['logic', 'ethics', 'logic']
+        )
+        
+        self.assertIsInstance(self.snapshot.get_expressions('dates', [0])[0], int)
+    
+    def testUpwardDownward(self) -> None:
+        ladder = ScalaNaturae(self.test_db)
+        creator: pd.DataFrame = self.creators.iloc[[0]]
+        
+        for (kind, beings), (exp_kind, expected) in zip(
+            self.snapshot.downward(self.genus, creator),
+            ladder.downward(self.genus, creator)
+        ):
+            self.assertEqual(kind, exp_kind)
+            
+            pd.testing.assert_frame_equal(
+                beings.sort_values(by='id').reset_index(drop=True),
+                expected.sort_values(by='id').reset_index(drop=True),
+                check_dtype=False
+            )
+        
+        creatures: pd.DataFrame = ladder.downward(self.genus, creator)[0][1]
+        genus, creators = self.snapshot.upward('creatures_0', creatures)[0]
+        exp_genus, expected = ladder.upward('creatures_0', creatures)[0]
+        self.assertEqual(genus, exp_genus)
+        pd.testing.assert_frame_equal(creators, expected, check_dtype=False)
+        self.assertListEqual(self.snapshot.upward(self.genus, creator), [])
+    
+    def testAssemble(self) -> None:
+        creators: pd.DataFrame = self.creators.iloc[[2, 0, 1]]
+        
+        for max_depth in [1, 2, 5]:
+            corpus: pd.DataFrame = Corpus(
+                self.test_db, self.genus, creators, max_depth=max_depth
+            ).assemble()
+            
+            pd.testing.assert_frame_equal(
+                self.snapshot.assemble(
+                    self.genus, list(creators.id), max_depth
+                ).fillna(-1),
+                corpus.fillna(-1),
+                check_dtype=False
+            )
+    
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.test_db)
+        shutil.rmtree(cls.snapshot_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,85 @@
+from indexia.archeion import Archeion
+from indexia.indexia import Indexia
+from sqlite3 import Connection
+import os
+import pandas as pd
+import shutil
+import unittest as ut
+
+
+class TestArcheion(ut.TestCase):
+    def setUp(self) -> None:
+        self.test_db: str = 'tests/data/test_archeion.db'
+        self.cache_dir: str = 'tests/data/archeion'
+        self.archeion = Archeion(self.cache_dir)
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.add_creator(cnxn, 'creators', 'name', 'father')
+        
+    def testFingerprint(self) -> None:
+        fingerprint: str = self.archeion.fingerprint(self.test_db)
+        self.assertEqual(fingerprint, self.archeion.fingerprint(self.test_db))
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.add_creator(cnxn, 'creators', 'name', 'mother')
+            changed: str = self.archeion.fingerprint(self.test_db)
+            self.assertNotEqual(fingerprint, changed)
+            
+            ix.execute(cnxn, 'CREATE INDEX creators_name_idx ON creators (name)')
+            
+            self.assertNotEqual(changed, self.archeion.fingerprint(self.test_db))
+        
+    def testFingerprintInMemory(self) -> None:
+        fingerprint: str = self.archeion.fingerprint(self.test_db, in_memory=True)
+        self.assertNotEqual(fingerprint, self.archeion.fingerprint(self.test_db))
+        
+        with Indexia(self.test_db, in_memory=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            self.assertEqual(
+                fingerprint, self.archeion.fingerprint(self.test_db, in_memory=True)
+            )
+            
+            ix.update(cnxn, 'creators', ['name'], ['mother'], ['id'], [1])
+            changed: str = self.archeion.fingerprint(self.test_db, in_memory=True)
+            self.assertNotEqual(fingerprint, changed)
+            
+            self.assertEqual(
+                changed, self.archeion.fingerprint(self.test_db, in_memory=True)
+            )
+        
+        self.assertDictEqual(Indexia.copies, {})
+        
+        self.assertEqual(
+            fingerprint, self.archeion.fingerprint(self.test_db, in_memory=True)
+        )
+        
+    def testHashFrame(self) -> None:
+        df = pd.DataFrame(data={'id': [1, 2], 'name': ['father', None]})
+        digest: str = self.archeion.hash_frame(df)
+        self.assertEqual(digest, self.archeion.hash_frame(df.copy()))
+        self.assertNotEqual(digest, self.archeion.hash_frame(df.iloc[[0]]))
+        
+        self.assertNotEqual(
+            digest, self.archeion.hash_frame(df.rename(columns={'id': 'ID'}))
+        )
+        
+    def testLoadStore(self) -> None:
+        params: dict[str, int] = {'max_depth': 1}
+        self.assertIsNone(self.archeion.load('corpus', params))
+        file_path: str = self.archeion.store('corpus', params, [1, 2])
+        self.assertTrue(os.path.isfile(file_path))
+        self.assertEqual(self.archeion.load('corpus', params), [1, 2])
+        self.assertIsNone(self.archeion.load('corpus', {'max_depth': 2}))
+        self.assertIsNone(self.archeion.load('diktua', params))
+        self.assertEqual((self.archeion.hits, self.archeion.misses), (1, 3))
+        
+    def tearDown(self) -> None:
+        os.remove(self.test_db)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,91 @@
+from benchmarks import suite
+from indexia.eidola import Maker
+from indexia.indexia import Indexia
+from sqlite3 import Connection
+from typing import Any
+import os
+import pandas as pd
+import shutil
+import unittest as ut
+
+
+class TestSuite(ut.TestCase):
+    def setUp(self) -> None:
+        self.bench_dir: str = 'tests/data/benchmarks'
+        
+        self.baseline: dict[str, Any] = {'meta': {}, 'results': [
+            {'name': 'get_by_trait', 'scale': 100, 'min': 1.0, 'median': 1.0, 'mean': 1.0},
+            {'name': 'get_by_trait', 'scale': 1000, 'min': 2.0, 'median': 2.0, 'mean': 2.0},
+            {'name': 'corpus_assemble', 'scale': 100, 'min': 4.0, 'median': 4.0, 'mean': 4.0},
+            {'name': 'diktua_init', 'scale': 100, 'min': 1.0, 'median': 1.0, 'mean': 1.0}
+        ]}
+        
+        self.results: dict[str, Any] = {'meta': {}, 'results': [
+            {'name': 'get_by_trait', 'scale': 100, 'min': 1.2, 'median': 1.2, 'mean': 1.2},
+            {'name': 'get_by_trait', 'scale': 1000, 'min': 2.4, 'median': 2.6, 'mean': 2.6},
+            {'name': 'corpus_assemble', 'scale': 100, 'min': 2.0, 'median': 2.0, 'mean': 9.0},
+            {'name': 'dendron_render_image', 'scale': 100, 'min': 1.0, 'median': 1.0, 'mean': 1.0}
+        ]}
+    
+    def testCompare(self) -> None:
+        comparison: pd.DataFrame = suite.compare(self.results, self.baseline)
+        
+        self.assertListEqual(list(comparison.columns), [
+            'name', 'scale', 'median_baseline', 'median_current', 'ratio', 'regression'
+        ])
+        
+        self.assertListEqual(
+            list(zip(comparison.name, comparison.scale)),
+            [('get_by_trait', 100), ('get_by_trait', 1000), ('corpus_assemble', 100)]
+        )
+        
+        self.assertListEqual(list(comparison.ratio), [1.2, 1.3, 0.5])
+        self.assertListEqual(list(comparison.regression), [False, True, False])
+        
+        loose: pd.DataFrame = suite.compare(self.results, self.baseline, tolerance=0.5)
+        self.assertFalse(loose.regression.any())
+        
+        strict: pd.DataFrame = suite.compare(self.results, self.baseline, tolerance=0.1)
+        self.assertListEqual(list(strict.regression), [True, True, False])
+        
+        means: pd.DataFrame = suite.compare(self.results, self.baseline, statistic='mean')
+        self.assertListEqual(list(means.regression), [False, True, True])
+    
+    def testMakeDatabase(self) -> None:
+        partial_path: str = os.path.join(self.bench_dir, f'bench.{os.getpid()}.partial')
+        os.makedirs(self.bench_dir, exist_ok=True)
+        
+        with open(partial_path, 'w') as partial:
+            partial.write('interrupted')
+        
+        db: str = suite.make_database(self.bench_dir, 10, 2)
+        key: str = Maker(partial_path, 2, 10, 'name', bulk=True).get_cache_key()
+        self.assertEqual(os.path.basename(db), f'bench_{key}.db')
+        self.assertFalse(os.path.isfile(partial_path))
+        
+        with Indexia(db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            self.assertEqual(ix.get_df(cnxn, 'SELECT * FROM creators').shape[0], 10)
+        
+        modified: int = os.stat(db).st_mtime_ns
+        self.assertEqual(suite.make_database(self.bench_dir, 10, 2), db)
+        self.assertEqual(os.stat(db).st_mtime_ns, modified)
+        self.assertNotEqual(suite.make_database(self.bench_dir, 10, 2, 'zipf'), db)
+    
+    def testRun(self) -> None:
+        results: dict[str, Any] = suite.run(
+            [10], self.bench_dir, samples=5, repeat=1, names=['get_by_trait']
+        )
+        
+        self.assertListEqual(
+            [(r['name'], r['scale']) for r in results['results']], [('get_by_trait', 10)]
+        )
+        
+        self.assertFalse(suite.compare(results, results).regression.any())
+    
+    def tearDown(self) -> None:
+        shutil.rmtree(self.bench_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    ut.main()
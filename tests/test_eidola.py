@@ -2,6 +2,8 @@ from indexia.eidola import Maker, Templates
 from indexia.indexia import Indexia
 from sqlite3 import Connection
 import os
+import shutil
+import sqlite3
 import pandas as pd
 import unittest as ut
 
@@ -21,6 +23,43 @@ class TestEidola(ut.TestCase):
             self.trait
         )
         
+    def testAssignCreators(self) -> None:
+        creator_ids: list[int] = list(range(1, 101))
+        
+        fixed: list[int] = self.maker.assign_creators(creator_ids, 150, 1)
+        self.assertEqual(fixed[:100], creator_ids)
+        self.assertEqual(fixed[100:], creator_ids[:50])
+        
+        maker = Maker(
+            self.test_db, self.species_per_genus, self.num_beings, 
+            self.trait, fanout=['uniform', ('zipf', 1.5), 'zipf'], seed=7
+        )
+        
+        uniform: list[int] = maker.assign_creators(creator_ids, 1000, 1)
+        self.assertTrue(set(uniform).issubset(set(creator_ids)))
+        zipf: list[int] = maker.assign_creators(creator_ids, 1000, 2)
+        self.assertGreater(zipf.count(1), 300)
+        self.assertGreater(zipf.count(1), uniform.count(1))
+        
+        maker.rng.seed(7)
+        self.assertEqual(maker.assign_creators(creator_ids, 1000, 1), uniform)
+        
+        self.assertRaises(
+            ValueError, Maker, self.test_db, self.species_per_genus, 
+            self.num_beings, self.trait, fanout='lognormal'
+        )
+        
+        self.assertRaises(
+            ValueError, Maker, self.test_db, self.species_per_genus, 
+            self.num_beings, self.trait, depth=2, fanout=['zipf']
+        )
+        
+    def testGetSpeciesNames(self) -> None:
+        self.assertEqual(self.maker.get_species_names(0), ['creators'])
+        names: list[str] = self.maker.get_species_names(2)
+        self.assertEqual(len(names), self.species_per_genus**2)
+        self.assertEqual(names[:2], ['creatures_0_0', 'creatures_0_1'])
+        
     def testMakeCreators(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -74,6 +113,107 @@ class TestEidola(ut.TestCase):
         self.assertEqual(len(grandsons), self.species_per_genus**2)
         self.assertEqual(len(great_grandsons), self.species_per_genus**3)
         
+    def testMakeBulk(self) -> None:
+        bulk_db: str = 'tests/data/test_eidola_bulk.db'
+        
+        maker = Maker(
+            bulk_db, 
+            self.species_per_genus, 
+            self.num_beings, 
+            self.trait,
+            bulk=True
+        )
+        
+        fathers: list[pd.DataFrame]
+        sons: list[pd.DataFrame]
+        grandsons: list[pd.DataFrame]
+        great_grandsons: list[pd.DataFrame]
+        fathers, sons, grandsons, great_grandsons = maker.make()
+        self.assertEqual(len(sons), self.species_per_genus)
+        self.assertEqual(len(great_grandsons), self.species_per_genus**3)
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            creators: pd.DataFrame = self.maker.make_creators(ix, cnxn, self.genus)
+            
+            creatures: pd.DataFrame = self.maker.make_creatures(
+                ix, cnxn, self.genus, 'creatures_0'
+            )
+        
+        pd.testing.assert_frame_equal(fathers[0], creators)
+        pd.testing.assert_frame_equal(sons[0], creatures)
+        
+        for suffix in ['', '-wal', '-shm']:
+            if os.path.isfile(f'{bulk_db}{suffix}'):
+                os.remove(f'{bulk_db}{suffix}')
+        
+    def testMakeTopology(self) -> None:
+        maker = Maker(
+            self.test_db, 2, 20, self.trait, bulk=True, depth=4, 
+            fanout='zipf', species_sizes={'creators': 5, 'creatures_0': 40}
+        )
+        
+        generations: tuple[list[pd.DataFrame], ...] = maker.make()
+        self.assertEqual(len(generations), 5)
+        self.assertEqual(len(generations[4]), 2**4)
+        self.assertEqual(generations[0][0].shape[0], 5)
+        self.assertEqual(generations[1][0].shape[0], 40)
+        self.assertEqual(generations[1][1].shape[0], 20)
+        
+        creator_counts: pd.Series = generations[1][0].creators_id.value_counts()
+        self.assertEqual(set(creator_counts.index), set(range(1, 6)))
+        self.assertEqual(creator_counts.idxmax(), 1)
+        
+        for generation, kinds in zip(maker.get(), generations):
+            for kind, exp_kind in zip(generation, kinds):
+                pd.testing.assert_frame_equal(kind, exp_kind)
+        
+        for suffix in ['-wal', '-shm']:
+            if os.path.isfile(f'{self.test_db}{suffix}'):
+                os.remove(f'{self.test_db}{suffix}')
+        
+    def testMakeCached(self) -> None:
+        cache_dir: str = 'tests/data/test_eidola_cache'
+        
+        maker = Maker(
+            self.test_db, 2, 5, self.trait, 
+            fanout='uniform', cache_dir=cache_dir
+        )
+        
+        key: str = maker.get_cache_key()
+        self.assertEqual(key, maker.get_cache_key())
+        
+        self.assertNotEqual(key, Maker(
+            self.test_db, 2, 5, self.trait, 
+            fanout='uniform', seed=1, cache_dir=cache_dir
+        ).get_cache_key())
+        
+        made: tuple[list[pd.DataFrame], ...] = maker.make()
+        self.assertTrue(os.path.isfile(str(maker.get_cache_path())))
+        os.remove(self.test_db)
+        restored: tuple[list[pd.DataFrame], ...] = maker.make()
+        
+        for generation, exp_generation in zip(restored, made):
+            for kind, exp_kind in zip(generation, exp_generation):
+                pd.testing.assert_frame_equal(kind, exp_kind)
+        
+        cnxn: sqlite3.Connection = maker.load(sqlite3.connect(':memory:'))
+        
+        in_memory: pd.DataFrame = pd.read_sql(
+            'SELECT * FROM creatures_1_1_1', cnxn
+        )
+        
+        pd.testing.assert_frame_equal(in_memory, made[3][-1])
+        cnxn.close()
+        
+        self.assertRaises(ValueError, self.maker.store)
+        
+        self.assertRaises(
+            ValueError, self.maker.load, sqlite3.connect(':memory:')
+        )
+        
+        shutil.rmtree(cache_dir)
+        
     def testGet(self) -> None:
         fathers: list[pd.DataFrame]
         sons: list[pd.DataFrame]
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+import unittest as ut
+
+
+class TestImports(ut.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.heavy_modules: list[str] = [
+            'networkx', 'numpy', 'pandas', 'pyvis', 
+            'webbrowser', 'xml.etree.ElementTree'
+        ]
+        
+    def getLoadedModules(self, module: str) -> list[str]:
+        code: str = '; '.join([
+            'import sys',
+            f'import {module}',
+            f'print(",".join(m for m in {self.heavy_modules} if m in sys.modules))'
+        ])
+        
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, '-c', code], 
+            capture_output=True, text=True, check=True
+        )
+        
+        loaded: list[str] = [m for m in result.stdout.strip().split(',') if m]
+        
+        return loaded
+        
+    def testLazyImports(self) -> None:
+        for module in [
+            'indexia.apographon', 'indexia.archeion', 'indexia.eidola', 
+            'indexia.indexia', 'indexia.inquiry', 
+            'indexia.mensura', 'indexia.mneme', 
+            'indexia.schemata', 'indexia.thesaurus'
+        ]:
+            self.assertEqual(self.getLoadedModules(module), [], module)
+
+
+if __name__ == '__main__':
+    ut.main()
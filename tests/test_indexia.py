@@ -1,6 +1,10 @@
 from indexia.indexia import Indexia
 from indexia.inquiry import Tabula
+from indexia.mensura import Mensura
+from indexia.mneme import Mneme
+from indexia.thesaurus import Thesaurus
 from sqlite3 import Connection
+from typing import Any
 import os
 import pandas
 import sqlite3
@@ -66,6 +70,27 @@ class TestIndexia(ut.TestCase):
             self.assertIsInstance(cnxn_1, sqlite3.Connection)
             self.assertIsInstance(cnxn_2, sqlite3.Connection)
     
+    def testProfile(self) -> None:
+        self.assertRaises(ValueError, Indexia, self.test_db, 'fake_profile')
+        
+        with Indexia(self.test_db, profile='read_heavy') as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            journal_mode: str = cnxn.execute('PRAGMA journal_mode').fetchone()[0]
+            busy_timeout: int = cnxn.execute('PRAGMA busy_timeout').fetchone()[0]
+            foreign_keys: int = cnxn.execute('PRAGMA foreign_keys').fetchone()[0]
+            self.assertEqual(journal_mode, 'wal')
+            
+            self.assertEqual(
+                busy_timeout, ix.profiles['read_heavy']['busy_timeout']
+            )
+            
+            self.assertEqual(foreign_keys, 1)
+            
+        with Indexia(self.test_db, profile='bulk_load') as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            synchronous: int = cnxn.execute('PRAGMA synchronous').fetchone()[0]
+            self.assertEqual(synchronous, 0)
+    
     def testCloseCnxn(self) -> None:
         with Indexia(self.test_db) as ix:
             ix.open_cnxn(ix.db)
@@ -82,6 +107,74 @@ class TestIndexia(ut.TestCase):
             for db in ix.cnxns:
                 self.assertEqual(len(ix.cnxns[db]), 0)
                 
+    def testInMemory(self) -> None:
+        def getNames() -> list[str]:
+            with sqlite3.connect(self.test_db) as disk:
+                names: list[str] = [
+                    n for (n,) in disk.execute(f'SELECT name FROM {self.creator_table}')
+                ]
+            
+            return names
+        
+        with self.assertRaises(ValueError):
+            Indexia(self.test_db).flush()
+        
+        with Indexia(self.test_db, in_memory=True, backup_pages=1) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            self.assertFalse(ix.get_by_id(cnxn, self.creator_table, self.creator_id).empty)
+            ix.add_creator(cnxn, self.creator_table, self.trait, 'mother')
+            self.assertIsNone(ix.get_db(cnxn))
+            
+            self.assertEqual(ix.get_by_trait(
+                ix.open_cnxn(ix.db), self.creator_table, 'mother'
+            ).shape[0], 1)
+            
+            self.assertListEqual(getNames(), [self.creator_expr])
+            
+            with Indexia(self.test_db, in_memory=True) as shared:
+                self.assertEqual(shared.get_by_trait(
+                    shared.open_cnxn(shared.db), self.creator_table, 'mother'
+                ).shape[0], 1)
+        
+        self.assertListEqual(getNames(), [self.creator_expr])
+        
+        with Indexia(self.test_db, in_memory=True, write_back=True) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            ix.add_creator(cnxn, self.creator_table, self.trait, 'mother')
+            self.assertListEqual(getNames(), [self.creator_expr])
+        
+        self.assertListEqual(getNames(), [self.creator_expr, 'mother'])
+        
+        for interval in [0, -1.0]:
+            with self.assertRaises(ValueError):
+                Indexia(self.test_db, in_memory=True, write_back=interval)
+        
+        with Indexia(self.test_db, in_memory=True, write_back=1e-9) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            ix.add_creator(cnxn, self.creator_table, self.trait, 'grandmother')
+            self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'grandmother'])
+            ix.update(cnxn, self.creator_table, [self.trait], ['crone'], ['id'], [3])
+            self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'crone'])
+            
+            ix.bulk_insert(
+                cnxn, self.creator_table, {'id': 'INTEGER', self.trait: 'TEXT'}, 
+                [self.trait], [('aunt',), ('niece',)]
+            )
+            
+            self.assertListEqual(getNames()[-2:], ['aunt', 'niece'])
+            ix.delete(cnxn, self.creator_table, 5)
+            self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'crone', 'aunt'])
+            ix.delete(cnxn, self.creator_table, 4)
+        
+        self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'crone'])
+        
+        with Indexia(self.test_db, in_memory=True, write_back=3600.0) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            ix.update(cnxn, self.creator_table, [self.trait], ['hag'], ['id'], [3])
+            self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'crone'])
+        
+        self.assertListEqual(getNames(), [self.creator_expr, 'mother', 'hag'])
+    
     def testGetDF(self) -> None:
         creator_cols: list[str] = ['id', 'name']
         valid_sql: str = f'SELECT * FROM {self.creator_table};'
@@ -134,6 +227,103 @@ class TestIndexia(ut.TestCase):
             self.assertEqual(list(df.columns), creator_cols)
             self.assertGreaterEqual(df.shape[0], 1)   
                 
+    def testGetDFThesaurus(self) -> None:
+        thesaurus = Thesaurus()
+        sql: str = f'SELECT * FROM {self.creator_table}'
+        
+        with Indexia(self.test_db, thesaurus=thesaurus) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.get_df(cnxn, sql)
+            ix.get_df(cnxn, sql)
+            self.assertEqual((thesaurus.hits, thesaurus.misses), (1, 1))
+            
+            ix.add_creator(cnxn, self.creator_table, self.trait, 'mother')
+            self.assertEqual(ix.get_df(cnxn, sql).shape[0], 2)
+            
+            cnxn.execute(
+                f"INSERT INTO {self.creator_table} (name) VALUES ('child')"
+            )
+            
+            self.assertTrue(cnxn.in_transaction)
+            self.assertEqual(ix.get_df(cnxn, sql).shape[0], 3)
+            cnxn.rollback()
+            self.assertEqual(ix.get_df(cnxn, sql).shape[0], 2)
+            self.assertEqual(thesaurus.hits, 2)
+        
+        thesaurus.close()
+        
+    def testReadSQL(self) -> None:
+        sql: str = f'SELECT * FROM {self.creator_table} WHERE id = ?'
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            df: pandas.DataFrame = ix.read_sql(cnxn, sql, (int(self.creator_id),))
+            pandas.testing.assert_frame_equal(df, self.creator_data)
+    
+    def testExecute(self) -> None:
+        sql: str = f'UPDATE {self.creator_table} SET name = ? WHERE id = ?'
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            cursor: sqlite3.Cursor = ix.execute(cnxn, sql, ('pater', int(self.creator_id)))
+            self.assertEqual(cursor.rowcount, 1)
+    
+    def testGetQueryStats(self) -> None:
+        with Indexia(self.test_db) as ix:
+            ix.open_cnxn(ix.db)
+            self.assertRaises(ValueError, ix.get_query_stats)
+        
+        mensura = Mensura()
+        
+        with Indexia(self.test_db, mensura=mensura) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i in range(3):
+                ix.add_creator(cnxn, self.creator_table, self.trait, f'neonymos_{i}')
+            
+            stats: pandas.DataFrame = ix.get_query_stats()
+            statements: list[str] = list(stats.statement)
+            select: str = f'SELECT * FROM {self.creator_table} WHERE name = ?'
+            insert: str = f'INSERT INTO {self.creator_table} (name) VALUES (?)'
+            self.assertIn(select, statements)
+            self.assertIn(insert, statements)
+            self.assertIn('COMMIT', statements)
+            
+            select_stats: pandas.Series = stats.set_index('statement').loc[select]
+            self.assertEqual(select_stats['count'], 6)
+            self.assertEqual(select_stats['rows'], 3)
+            self.assertGreater(select_stats['total'], 0)
+            
+            stats_dict = ix.get_query_stats(as_frame=False)
+            self.assertEqual(stats_dict[insert]['count'], 3)
+            
+    def testSlowQueries(self) -> None:
+        mensura = Mensura(slow_threshold=0)
+        
+        with Indexia(self.test_db, mensura=mensura) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.get_creatures(cnxn, self.creator_table, self.creator_data)
+            
+            scans: list[str] = [
+                s for entry in mensura.slow for s in entry['scans']
+            ]
+            
+            self.assertIn('SCAN sqlite_schema', scans)
+            self.assertIn(f'SCAN {self.creature_table}', scans)
+            
+            ix.bulk_insert(
+                cnxn, self.creator_table, self.creator_dtype, 
+                [self.trait], [('mother',), ('grandmother',)]
+            )
+            
+            self.assertTrue(
+                mensura.slow[-1]['statement'].startswith(f'INSERT INTO {self.creator_table}')
+            )
+            
+            self.assertListEqual(mensura.slow[-1]['params'], ['mother'])
+            ix.bulk_insert(cnxn, self.creator_table, self.creator_dtype, [self.trait], [])
+            self.assertListEqual(mensura.slow[-1]['params'], [])
+                
     def testGetOrCreate(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -153,6 +343,25 @@ class TestIndexia(ut.TestCase):
             self.assertIsInstance(creator_data, pandas.DataFrame)
             self.assertEqual(creator_data.shape[0], 1)
      
+    def testBulkInsert(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            rows_inserted: int = ix.bulk_insert(
+                cnxn, self.creature_table, self.creature_dtype, 
+                [self.trait, 'creator_id'], 
+                [(f'son_{i}', int(self.creator_id)) for i in range(10)]
+            )
+            
+            self.assertEqual(rows_inserted, 10)
+            
+            creatures: pandas.DataFrame = ix.get_creatures(
+                cnxn, self.creator_table, self.creator_data
+            )[0][1]
+            
+            self.assertEqual(creatures.shape[0], 11)
+            self.assertIn('son_9', list(creatures[self.trait]))
+     
     def testDelete(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -165,6 +374,33 @@ class TestIndexia(ut.TestCase):
                 [self.trait], [self.creator_expr], retry=False
             )
             
+    def testCreateTable(self) -> None:
+        mensura = Mensura()
+        
+        with Indexia(
+            self.test_db, mensura=mensura, closure=True, 
+            changelog=True, fulltext=True
+        ) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            elders: tuple[str, dict[str, str]] = Tabula.get_creator_table('elders', 'name')
+            self.assertTrue(ix.create_table(cnxn, *elders))
+            self.assertFalse(ix.create_table(cnxn, *elders))
+            elder: pandas.DataFrame = ix.add_creator(cnxn, 'elders', 'name', 'nestor')
+            ix.add_creature(cnxn, 'elders', elder, 'youths', 'name', 'telemachus')
+            ix.add_creature(cnxn, 'elders', elder, 'keywords', 'word', 'guest', 'LEXICON')
+            indexes: list[str] = [r[1] for r in cnxn.execute('PRAGMA index_list(keywords)')]
+            self.assertIn('keywords_word', indexes)
+            mensura.reset()
+            
+            for name in ['pisistratus', 'peiraeus']:
+                ix.add_creature(cnxn, 'elders', elder, 'youths', 'name', name)
+                ix.add_creature(cnxn, 'elders', elder, 'keywords', 'word', name, 'LEXICON')
+            
+            statements: list[str] = [r['statement'] for r in mensura.records]
+            self.assertFalse([s for s in statements if s.startswith(('CREATE', 'PRAGMA'))])
+            self.assertEqual(ix.get_changes(cnxn, kinds=['youths']).shape[0], 3)
+            self.assertEqual(ix.search(cnxn, 'peiraeus').shape[0], 2)
+    
     def testUpdate(self) -> None:        
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -279,6 +515,158 @@ class TestIndexia(ut.TestCase):
             
             self.assertTrue(expect_empty.empty)
                 
+    def testGetByTraitRange(self) -> None:
+        created: list[str] = [
+            '2024-01-31-23-59', '2024-02-01-00-00', '2024-02-14-12-30',
+            '2024-02-29-08-00', '2024-03-01-00-00'
+        ]
+        
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for expr in reversed(created):
+                ix.add_creature(
+                    cnxn, self.creator_table, self.creator_data, 
+                    self.creature_table, self.trait, expr
+                )
+            
+            indexname: str = ix.index_trait(cnxn, self.creature_table)
+            self.assertEqual(indexname, f'{self.creature_table}_{self.trait}')
+            
+            february: pandas.DataFrame = ix.get_by_trait_range(
+                cnxn, self.creature_table, '2024-02', '2024-03'
+            )
+            
+            self.assertListEqual(list(february[self.trait]), created[1:4])
+            
+            self.assertListEqual(list(ix.get_by_trait_range(
+                cnxn, self.creature_table, hi='2024-02-01-00-00'
+            )[self.trait]), created[:1])
+            
+            self.assertListEqual(list(ix.get_by_trait_range(
+                cnxn, self.creature_table, lo='2024-02-29-08-00'
+            )[self.trait]), created[3:] + [self.creature_expr])
+            
+            self.assertListEqual(list(ix.get_by_trait_prefix(
+                cnxn, self.creature_table, '2024-02', limit=2, offset=1
+            )[self.trait]), created[2:4])
+            
+            self.assertListEqual(list(ix.get_by_trait_prefix(
+                cnxn, self.creator_table, self.creator_expr[:3]
+            )[self.trait]), [self.creator_expr])
+            
+            self.assertEqual(
+                ix.get_by_trait_prefix(cnxn, self.creature_table, '').shape[0], 
+                len(created) + 1
+            )
+            
+            plan: list[Any] = cnxn.execute(' '.join([
+                f'EXPLAIN QUERY PLAN SELECT * FROM {self.creature_table}',
+                f'WHERE {self.trait} >= ? AND {self.trait} < ?',
+                f'ORDER BY {self.trait}, id LIMIT ? OFFSET ?'
+            ]), ['2024-02', '2024-03', -1, 0]).fetchall()
+            
+            self.assertIn(f'USING INDEX {indexname}', plan[0][-1])
+    
+    def testTypedTraits(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            self.assertEqual(ix.get_trait_type(cnxn, self.creature_table), 'TEXT')
+            deck: pandas.DataFrame = ix.add_creator(cnxn, 'decks', 'year', '2024', 'INTEGER')
+            self.assertEqual(deck.year.iloc[0], 2024)
+            self.assertEqual(ix.describe_trait(cnxn, 'decks'), ('year', 'INTEGER'))
+            
+            for created in ['2024-02-01-09-30', '2024-02-14T12:00:00', 1709251200]:
+                ix.add_creature(cnxn, 'decks', deck, 'cards', 'created', created, 'TIMESTAMP')
+            
+            self.assertEqual(ix.get_trait_type(cnxn, 'cards'), 'TIMESTAMP')
+            
+            self.assertListEqual(
+                [t for (t,) in cnxn.execute('SELECT typeof(created) FROM cards')], 
+                ['integer'] * 3
+            )
+            
+            card: pandas.DataFrame = ix.get_by_trait(cnxn, 'cards', '2024-02-01T09:30')
+            self.assertEqual(card.created.iloc[0], 1706779800)
+            ix.index_trait(cnxn, 'cards')
+            
+            february: pandas.DataFrame = ix.get_by_trait_range(
+                cnxn, 'cards', '2024-02-01', '2024-03-01'
+            )
+            
+            self.assertListEqual(list(february.created), [1706779800, 1707912000])
+            self.assertEqual(ix.get_by_trait(cnxn, 'decks', 2024).id.iloc[0], deck.id.iloc[0])
+            
+            with self.assertRaises(ValueError):
+                ix.get_by_trait_prefix(cnxn, 'cards', '2024')
+    
+    def testLexicon(self) -> None:
+        words: list[str] = ['civics', 'logic', 'reason', 'logic', 'civics']
+        
+        with Indexia(self.test_db, fulltext=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            topics: list[pandas.DataFrame] = []
+            
+            for i, word in enumerate(words):
+                topic: pandas.DataFrame = ix.add_creator(cnxn, 'topics', 'name', f'topic_{i}')
+                topics += [topic]
+                
+                keyword: pandas.DataFrame = ix.add_creature(
+                    cnxn, 'topics', topic, 'keywords', 'word', word, 'LEXICON'
+                )
+                
+                self.assertEqual(keyword.word.iloc[0], word)
+            
+            self.assertEqual(ix.get_trait_type(cnxn, 'keywords'), 'LEXICON')
+            self.assertListEqual(ix.get_all_tables(cnxn)[-2:], ['topics', 'keywords'])
+            
+            self.assertListEqual(
+                [c for (c,) in cnxn.execute('SELECT word FROM keywords ORDER BY id')], 
+                [1, 2, 3, 2, 1]
+            )
+            
+            self.assertListEqual(list(ix.get_by_trait(cnxn, 'keywords', 'logic').id), [2, 4])
+            self.assertEqual(ix.get_by_id(cnxn, 'keywords', 3).word.iloc[0], 'reason')
+            
+            self.assertListEqual(
+                list(ix.get_by_ids(cnxn, 'keywords', [3, 1]).sort_values(by='id').word), 
+                ['civics', 'reason']
+            )
+            
+            self.assertTrue(ix.get_by_trait(cnxn, 'keywords', 'rhetoric').empty)
+            
+            self.assertEqual(
+                ix.get_creatures(cnxn, 'topics', topics[4])[0][1].word.iloc[0], 'civics'
+            )
+            
+            self.assertListEqual(
+                list(ix.get_by_trait_prefix(cnxn, 'keywords', 'c').id), [1, 5]
+            )
+            
+            self.assertListEqual(list(ix.ascend_all(
+                cnxn, 'keywords', [3, 1], expressions=True
+            ).keywords_word), ['reason', 'civics'])
+            
+            self.assertEqual(
+                ix.update(cnxn, 'keywords', ['word'], ['ethics'], ['word'], ['civics']), 2
+            )
+            
+            self.assertListEqual(list(ix.get_by_trait(cnxn, 'keywords', 'ethics').id), [1, 5])
+            
+            keywords: tuple[str, dict[str, str]] = Tabula.get_creature_table(
+                'topics', 'keywords', 'word', 'LEXICON'
+            )
+            
+            self.assertEqual(ix.bulk_insert(
+                cnxn, *keywords, ['word', 'topics_id'], [('civics', 2), ('logic', 2)]
+            ), 2)
+            
+            self.assertListEqual(
+                list(ix.get_creatures(cnxn, 'topics', topics[1])[0][1].word), 
+                ['logic', 'civics', 'logic']
+            )
+            self.assertListEqual(sorted(ix.search(cnxn, 'ethics', kinds=['keywords']).id), [1, 5])
+    
     def testGetByID(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -295,6 +683,97 @@ class TestIndexia(ut.TestCase):
             
             self.assertTrue(expect_empty.empty)
     
+    def testGetByIDs(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for i in range(4):
+                ix.add_creator(cnxn, self.creator_table, self.trait, f'mother_{i}')
+            
+            ix.max_params = 2
+            
+            beings: pandas.DataFrame = ix.get_by_ids(
+                cnxn, self.creator_table, [5, 2, 2, 3, 9], ['id', self.trait]
+            )
+            
+            self.assertListEqual(list(beings.columns), ['id', self.trait])
+            self.assertListEqual(sorted(beings.id), [2, 3, 5])
+            self.assertTrue(ix.get_by_ids(cnxn, self.creator_table, []).empty)
+    
+    def testMneme(self) -> None:
+        mneme = Mneme()
+        
+        with Indexia(self.test_db, mneme=mneme) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            for _ in range(3):
+                ix.get_by_id(cnxn, self.creator_table, self.creator_id)
+                ix.get_by_trait(cnxn, self.creature_table, self.creature_expr)
+            
+            self.assertEqual((mneme.hits, mneme.misses), (4, 2))
+            
+            ix.add_creature(
+                cnxn, self.creator_table, self.creator_data, 
+                self.creature_table, self.trait, self.creature_expr
+            )
+            
+            self.assertEqual(ix.get_by_trait(
+                cnxn, self.creature_table, self.creature_expr
+            ).shape[0], 1)
+            
+            ix.bulk_insert(
+                cnxn, self.creature_table, self.creature_dtype, 
+                [self.trait, 'creator_id'], 
+                [(self.creature_expr, int(self.creator_id))]
+            )
+            
+            self.assertEqual(ix.get_by_trait(
+                cnxn, self.creature_table, self.creature_expr
+            ).shape[0], 2)
+            
+            ix.update(
+                cnxn, self.creator_table, [self.trait], ['pater'], 
+                ['id'], [self.creator_id]
+            )
+            
+            self.assertEqual(ix.get_by_id(
+                cnxn, self.creator_table, self.creator_id
+            )[self.trait].iloc[0], 'pater')
+            
+            self.assertTrue(ix.get_by_trait(
+                cnxn, self.creator_table, self.creator_expr
+            ).empty)
+            
+            ix.delete(cnxn, self.creator_table, self.creator_id)
+            self.assertEqual(len(mneme.entries), 0)
+            
+            self.assertTrue(
+                ix.get_by_id(cnxn, self.creator_table, self.creator_id).empty
+            )
+            
+            self.assertTrue(ix.get_by_trait(
+                cnxn, self.creature_table, self.creature_expr
+            ).empty)
+        
+        other_db: str = 'tests/data/test_mneme_other.db'
+        
+        try:
+            with Indexia(self.test_db, mneme=mneme) as ix:
+                cnxn = ix.open_cnxn(ix.db)
+                ix.add_creator(cnxn, self.creator_table, self.trait, 'father')
+                ix.get_by_id(cnxn, self.creator_table, 2)
+            
+            with Indexia(other_db, mneme=mneme) as other:
+                cnxn = other.open_cnxn(other.db)
+                other.add_creator(cnxn, self.creator_table, self.trait, 'mother')
+                other.add_creator(cnxn, self.creator_table, self.trait, 'daughter')
+                
+                self.assertEqual(other.get_by_id(
+                    cnxn, self.creator_table, 2
+                )[self.trait].iloc[0], 'daughter')
+        finally:
+            os.remove(other_db)
+    
     def testGetCreatorGenus(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)
@@ -335,6 +814,44 @@ class TestIndexia(ut.TestCase):
             
             self.assertEqual(len(expect_empty), 0)
             
+    def testGetCreators(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.max_params = 1
+            
+            mother: pandas.DataFrame = ix.add_creator(
+                cnxn, self.creator_table, self.trait, 'mother'
+            )
+            
+            daughter: pandas.DataFrame = ix.add_creature(
+                cnxn, self.creator_table, mother, 
+                self.creature_table, self.trait, 'daughter'
+            )
+            
+            creatures: pandas.DataFrame = pandas.concat(
+                [self.creature_data, daughter, self.creature_data]
+            )
+            
+            creatures.index = pandas.Index([10, 20, 30])
+            
+            creators: list[tuple[str, pandas.DataFrame]] = ix.get_creators(
+                cnxn, self.creature_table, creatures
+            )
+            
+            genus: str
+            creator_data: pandas.DataFrame
+            genus, creator_data = creators[0]
+            self.assertEqual(genus, self.creator_table)
+            self.assertListEqual(list(creator_data.index), [10, 20, 30])
+            
+            self.assertListEqual(
+                list(creator_data[self.trait]), ['father', 'mother', 'father']
+            )
+            
+            self.assertListEqual(
+                ix.get_creators(cnxn, self.creator_table, creator_data), []
+            )
+    
     def testGetCreatures(self) -> None:
         with Indexia(self.test_db) as ix:
             cnxn: Connection = ix.open_cnxn(ix.db)  
@@ -364,6 +881,219 @@ class TestIndexia(ut.TestCase):
             
             self.assertEqual(len(exp_empty), 0)
     
+    def testGetLineage(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            self.assertListEqual(
+                ix.get_lineage(cnxn, self.creature_table), 
+                [self.creature_table, self.creator_table]
+            )
+            
+            self.assertListEqual(
+                ix.get_lineage(cnxn, self.creator_table), [self.creator_table]
+            )
+    
+    def testAscendAll(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.max_params = 1
+            
+            lineages: pandas.DataFrame = ix.ascend_all(
+                cnxn, self.creature_table, [self.creature_id, 99]
+            )
+            
+            self.assertListEqual(
+                list(lineages.columns), ['creature_id', 'creator_id']
+            )
+            
+            self.assertListEqual(
+                list(lineages.creature_id), [self.creature_id, 99]
+            )
+            
+            self.assertEqual(lineages.creator_id[0], self.creator_id)
+            self.assertTrue(pandas.isna(lineages.creator_id[1]))
+            
+            lineages = ix.ascend_all(
+                cnxn, self.creature_table, [], expressions=True
+            )
+            
+            self.assertListEqual(list(lineages.columns), [
+                'creature_id', 'creature_name', 'creator_id', 'creator_name'
+            ])
+    
+    def testBuildClosure(self) -> None:
+        with Indexia(self.test_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            self.assertFalse(ix.has_closure(cnxn))
+            
+            self.assertRaises(
+                ValueError, ix.descendants, 
+                cnxn, self.creator_table, self.creator_id
+            )
+            
+            self.assertEqual(ix.build_closure(cnxn), 3)
+            self.assertTrue(ix.has_closure(cnxn))
+            
+            self.assertListEqual(
+                ix.get_all_tables(cnxn), [self.creator_table, self.creature_table]
+            )
+            
+            descendants: pandas.DataFrame = ix.descendants(
+                cnxn, self.creator_table, self.creator_id
+            )
+            
+            self.assertListEqual(
+                descendants.values.tolist(), 
+                [[self.creature_table, int(self.creature_id), 1]]
+            )
+    
+    def testClosure(self) -> None:
+        with Indexia(self.test_db, closure=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.build_closure(cnxn)
+            
+            grandson: pandas.DataFrame = ix.add_creature(
+                cnxn, self.creature_table, self.creature_data, 
+                'grandson', self.trait, 'grandson'
+            )
+            
+            grandson_id: int = int(grandson.id.values[0])
+            
+            ancestors: pandas.DataFrame = ix.ancestors(
+                cnxn, 'grandson', grandson_id
+            )
+            
+            self.assertListEqual(ancestors.values.tolist(), [
+                [self.creature_table, int(self.creature_id), 1],
+                [self.creator_table, int(self.creator_id), 2]
+            ])
+            
+            descendants: pandas.DataFrame = ix.descendants(
+                cnxn, self.creator_table, self.creator_id
+            )
+            
+            self.assertListEqual(descendants.values.tolist(), [
+                [self.creature_table, int(self.creature_id), 1],
+                ['grandson', grandson_id, 2]
+            ])
+            
+            self.assertEqual(ix.descendants(
+                cnxn, self.creator_table, self.creator_id, max_depth=1
+            ).shape[0], 1)
+            
+            mother: pandas.DataFrame = ix.add_creator(
+                cnxn, self.creator_table, self.trait, 'mother'
+            )
+            
+            mother_id: int = int(mother.id.values[0])
+            
+            ix.update(
+                cnxn, self.creature_table, ['creator_id'], [mother_id], 
+                ['id'], [self.creature_id]
+            )
+            
+            self.assertListEqual(
+                ix.ancestors(cnxn, 'grandson', grandson_id).values.tolist(), [
+                    [self.creature_table, int(self.creature_id), 1],
+                    [self.creator_table, mother_id, 2]
+                ]
+            )
+            
+            self.assertTrue(ix.descendants(
+                cnxn, self.creator_table, self.creator_id
+            ).empty)
+            
+            ix.delete(cnxn, self.creator_table, mother_id)
+            
+            self.assertTrue(
+                ix.ancestors(cnxn, 'grandson', grandson_id).empty
+            )
+            
+            self.assertListEqual(
+                ix.get_df(cnxn, 'SELECT * FROM indexia_closure').values.tolist(), 
+                [[self.creator_table, int(self.creator_id), 
+                  self.creator_table, int(self.creator_id), 0]]
+            )
+    
+    def testChangelog(self) -> None:
+        with Indexia(self.test_db, changelog=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            self.assertTrue(ix.get_changes(cnxn).empty)
+            ix.install_all_triggers(cnxn)
+            
+            ix.update(
+                cnxn, self.creature_table, [self.trait], ['filius'], 
+                ['id'], [self.creature_id]
+            )
+            
+            mother: pandas.DataFrame = ix.add_creator(
+                cnxn, self.creator_table, self.trait, 'mother'
+            )
+            
+            ix.delete(cnxn, self.creator_table, self.creator_id)
+            changes: pandas.DataFrame = ix.get_changes(cnxn)
+            
+            self.assertListEqual(changes[['kind', 'id', 'op']].values.tolist(), [
+                [self.creature_table, int(self.creature_id), 'update'],
+                [self.creator_table, int(mother.id.iloc[0]), 'insert'],
+                [self.creature_table, int(self.creature_id), 'delete'],
+                [self.creator_table, int(self.creator_id), 'delete']
+            ])
+            
+            self.assertListEqual(list(changes.seq), [1, 2, 3, 4])
+            self.assertTrue(changes.ts.is_monotonic_increasing)
+            
+            self.assertListEqual(
+                list(ix.get_changes(cnxn, since=1, kinds=[self.creature_table]).seq), 
+                [3]
+            )
+            
+            self.assertEqual(ix.compact_changelog(cnxn, upto=2), 0)
+            self.assertEqual(ix.compact_changelog(cnxn), 1)
+            self.assertListEqual(list(ix.get_changes(cnxn).seq), [2, 3, 4])
+            
+            self.assertListEqual(
+                ix.get_all_tables(cnxn), [self.creator_table, self.creature_table]
+            )
+    
+    def testSearch(self) -> None:
+        with Indexia(self.test_db, fulltext=[self.creature_table]) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            with self.assertRaises(ValueError):
+                ix.search(cnxn, self.creature_expr)
+            
+            self.assertEqual(ix.build_search(cnxn), 1)
+            
+            for expr in ['grandson of the father', 'son of a son']:
+                ix.add_creature(
+                    cnxn, self.creator_table, self.creator_data, 
+                    self.creature_table, self.trait, expr
+                )
+            
+            hits: pandas.DataFrame = ix.search(cnxn, self.creature_expr)
+            self.assertListEqual(list(hits.columns), ['kind', 'id', 'expression', 'score'])
+            self.assertListEqual(list(hits.expression), [self.creature_expr, 'son of a son'])
+            self.assertTrue(hits.score.is_monotonic_increasing)
+            self.assertEqual(ix.search(cnxn, 'father').shape[0], 1)
+            self.assertEqual(ix.search(cnxn, 'son', limit=1).shape[0], 1)
+            self.assertTrue(ix.search(cnxn, 'son', kinds=[self.creator_table]).empty)
+            
+            ix.update(
+                cnxn, self.creature_table, [self.trait], ['daughter'], 
+                ['id'], [self.creature_id]
+            )
+            
+            self.assertListEqual(list(ix.search(cnxn, 'son').expression), ['son of a son'])
+            self.assertEqual(ix.search(cnxn, 'daughter').id.iloc[0], self.creature_id)
+            ix.delete(cnxn, self.creator_table, self.creator_id)
+            self.assertTrue(ix.search(cnxn, 'son OR daughter OR father').empty)
+            
+            self.assertListEqual(
+                ix.get_all_tables(cnxn), [self.creator_table, self.creature_table]
+            )
+    
     def tearDown(self) -> None:
         try:
             os.remove(self.test_db)
@@ -23,6 +23,46 @@ class TestInquiry(ut.TestCase):
         
         self.assertEqual(statement, expected)
         
+    def testCreateIndex(self) -> None:
+        statement: str = Inquiry.create_index(
+            'users_username', self.tablename, ['username'], unique=True
+        )
+        
+        expected: str = ' '.join([
+            'CREATE UNIQUE INDEX IF NOT EXISTS users_username',
+            'ON users (username)'
+        ])
+        
+        self.assertEqual(statement, expected)
+        
+    def testCreateTrigger(self) -> None:
+        statement: str = Inquiry.create_trigger(
+            'users_log', self.tablename, 'UPDATE OF username',
+            ['INSERT INTO log VALUES (OLD.uid)'],
+            when='OLD.username IS NOT NEW.username'
+        )
+        
+        expected: str = ' '.join([
+            'CREATE TRIGGER IF NOT EXISTS users_log',
+            'AFTER UPDATE OF username ON users',
+            'WHEN OLD.username IS NOT NEW.username',
+            'BEGIN INSERT INTO log VALUES (OLD.uid); END'
+        ])
+        
+        self.assertEqual(statement, expected)
+        
+    def testCreateVirtual(self) -> None:
+        statement: str = Inquiry.create_virtual(
+            'users_search', 'fts5', {'username': '', 'uid': 'UNINDEXED'}
+        )
+        
+        expected: str = ' '.join([
+            'CREATE VIRTUAL TABLE IF NOT EXISTS users_search',
+            'USING fts5(username,uid UNINDEXED)'
+        ])
+        
+        self.assertEqual(statement, expected)
+        
     def testInsert(self) -> None:        
         statement: str = Inquiry.insert(
             self.tablename, 
@@ -36,6 +76,11 @@ class TestInquiry(ut.TestCase):
         
         self.assertEqual(statement, expected)
         
+    def testInsertMany(self) -> None:
+        statement: str = Inquiry.insert_many(self.tablename, ['uid', 'username'])
+        expected: str = 'INSERT INTO users (uid,username) VALUES (?,?)'
+        self.assertEqual(statement, expected)
+        
     def testSelect(self) -> None:
         statement: str = Inquiry.select(
             self.tablename, 
@@ -46,6 +91,34 @@ class TestInquiry(ut.TestCase):
         expected: str = 'SELECT uid FROM users WHERE uid > 1'
         self.assertEqual(statement, expected)
     
+    def testSelectLineage(self) -> None:
+        statement: str = Inquiry.select_lineage(
+            ['works', 'philosophers', 'schools'], 
+            traits=['title', 'name', 'name'], 
+            conditions='WHERE t0.id IN (?)'
+        )
+        
+        expected: str = ' '.join([
+            'SELECT t0.id AS works_id,t0.title AS works_title,',
+            't1.id AS philosophers_id,t1.name AS philosophers_name,',
+            't2.id AS schools_id,t2.name AS schools_name',
+            'FROM works t0 JOIN philosophers t1 ON t1.id = t0.philosophers_id',
+            'JOIN schools t2 ON t2.id = t1.schools_id WHERE t0.id IN (?)'
+        ]).replace(', ', ',')
+        
+        self.assertEqual(statement, expected)
+        
+        statement = Inquiry.select_lineage(
+            ['works', 'philosophers'], 
+            sources=['(SELECT * FROM works)', 'philosophers']
+        )
+        
+        self.assertEqual(statement, ' '.join([
+            'SELECT t0.id AS works_id,t1.id AS philosophers_id',
+            'FROM (SELECT * FROM works) t0',
+            'JOIN philosophers t1 ON t1.id = t0.philosophers_id '
+        ]))
+    
     def testDelete(self) -> None:
         statement: str = Inquiry.delete(self.tablename)
         expected: str = 'DELETE FROM users '
@@ -74,6 +147,13 @@ class TestInquiry(ut.TestCase):
         
         self.assertEqual(statement, expected)
     
+    def testPragma(self) -> None:
+        statement: str = Inquiry.pragma('journal_mode')
+        self.assertEqual(statement, 'PRAGMA journal_mode')
+        
+        statement = Inquiry.pragma('journal_mode', 'WAL')
+        self.assertEqual(statement, 'PRAGMA journal_mode = WAL')
+    
     def testWhere(self) -> None:
         statement: str = Inquiry.where(
             ['username', 'username'], 
@@ -102,6 +182,40 @@ class TestTabula(ut.TestCase):
         
         self.assertEqual(self.genus, genus)
         self.assertEqual({'id', self.genus_trait}, set(cols.keys()))
+        self.assertEqual(cols[self.genus_trait], 'TEXT UNIQUE NOT NULL')
+        
+        typed_cols: dict[str, str] = Tabula.get_creator_table(
+            self.genus, self.genus_trait, 'real'
+        )[1]
+        
+        self.assertEqual(typed_cols[self.genus_trait], 'REAL UNIQUE NOT NULL')
+        
+        with self.assertRaises(ValueError):
+            Tabula.get_creature_table(
+                self.genus, self.species, self.species_trait, 'DATE'
+            )
+        
+    def testEncodeTrait(self) -> None:
+        self.assertEqual(Tabula.encode_trait('7', 'TEXT'), '7')
+        self.assertEqual(Tabula.encode_trait('7', 'VARCHAR(28)'), '7')
+        self.assertEqual(Tabula.encode_trait('7', 'INTEGER'), 7)
+        self.assertEqual(Tabula.encode_trait('7.5', 'REAL'), 7.5)
+        
+        for stamp in [
+            86400, '1970-01-02', '1970-01-02T00:00:00+00:00', 
+            '1970-01-02T01:00:00+01:00', '1970-01-02-00-00'
+        ]:
+            self.assertEqual(Tabula.encode_trait(stamp, 'timestamp'), 86400)
+        
+        for stamp, seconds in [
+            ('1970-01-02-12-05', 86400 + 12 * 3600 + 5 * 60),
+            ('1970-01-02-09-10', 86400 + 9 * 3600 + 10 * 60),
+            ('1970-01-02-00-23', 86400 + 23 * 60)
+        ]:
+            self.assertEqual(Tabula.encode_trait(stamp, 'TIMESTAMP'), seconds)
+        
+        with self.assertRaises(ValueError):
+            Tabula.encode_trait('tomorrow', 'TIMESTAMP')
         
     def testGetCreatureTable(self) -> None:
         creature_info: tuple[str, dict[str, str]] = Tabula.get_creature_table(
@@ -120,6 +234,27 @@ class TestTabula(ut.TestCase):
             f'FOREIGN KEY ({self.genus}_id)'
         }, set(cols.keys()))
     
+    def testGetChangelogTable(self) -> None:
+        changelog_info: tuple[str, dict[str, str]] = Tabula.get_changelog_table()
+        changelog: str = changelog_info[0]
+        cols: dict[str, str] = changelog_info[1]
+        self.assertEqual(changelog, 'indexia_changelog')
+        self.assertEqual(['seq', 'kind', 'id', 'op', 'ts'], list(cols.keys()))
+    
+    def testGetSearchTables(self) -> None:
+        search, search_cols = Tabula.get_search_table()
+        keys, keys_cols = Tabula.get_search_keys_table()
+        self.assertEqual(search, 'indexia_search')
+        self.assertEqual(keys, 'indexia_search_keys')
+        self.assertEqual(['expression'], list(search_cols.keys()))
+        self.assertEqual(['search_id', 'kind', 'id', 'UNIQUE'], list(keys_cols.keys()))
+    
+    def testGetLexiconTable(self) -> None:
+        lexicon, cols = Tabula.get_lexicon_table(self.species)
+        self.assertEqual(lexicon, f'indexia_lexicon_{self.species}')
+        self.assertEqual(['code', 'expression'], list(cols.keys()))
+        self.assertEqual(Tabula.get_trait_dtype('lexicon'), 'LEXICON')
+    
     def testReferences(self) -> None:
         references: str = Tabula.references(
             self.genus, 
@@ -0,0 +1,173 @@
+from indexia.mensura import Mensura
+from typing import Any
+import json
+import os
+import pandas as pd
+import sqlite3
+import unittest as ut
+
+
+class TestMensura(ut.TestCase):
+    def setUp(self) -> None:
+        self.mensura = Mensura()
+        self.cnxn: sqlite3.Connection = sqlite3.connect(':memory:')
+        self.cnxn.execute('CREATE TABLE creators (id INTEGER, name TEXT)')
+        
+    def testNormalize(self) -> None:
+        shape: str
+        num_literals: int
+        
+        shape, num_literals = Mensura.normalize(
+            "SELECT * FROM creatures_0  WHERE name = 'it''s' AND creators_id = 12;"
+        )
+        
+        self.assertEqual(
+            shape, 'SELECT * FROM creatures_0 WHERE name = ? AND creators_id = ?'
+        )
+        
+        self.assertEqual(num_literals, 2)
+        
+        shape, num_literals = Mensura.normalize(
+            "INSERT INTO creators (name) VALUES ('a'),('b'),('c')"
+        )
+        
+        self.assertEqual(shape, 'INSERT INTO creators (name) VALUES (?)')
+        self.assertEqual(num_literals, 3)
+        
+    def testRecord(self) -> None:
+        self.mensura.record('SELECT * FROM creators WHERE id = ?', (1,), 0.5, 1)
+        record: dict[str, Any] = self.mensura.records[0]
+        self.assertEqual(record['statement'], 'SELECT * FROM creators WHERE id = ?')
+        self.assertEqual(record['params'], 1)
+        self.assertEqual(record['duration'], 0.5)
+        self.assertEqual(record['rows'], 1)
+        
+    def testTrace(self) -> None:
+        self.cnxn.set_trace_callback(self.mensura.trace)
+        self.cnxn.execute("INSERT INTO creators VALUES (1, 'a')")
+        statements: list[str] = [r['statement'] for r in self.mensura.records]
+        self.assertIn('INSERT INTO creators VALUES (?)', statements)
+        self.assertIsNone(self.mensura.records[-1]['duration'])
+        num_records: int = len(self.mensura.records)
+        
+        self.mensura.measure(
+            'SELECT * FROM creators', (), 
+            lambda: self.cnxn.execute('SELECT * FROM creators')
+        )
+        
+        self.assertEqual(len(self.mensura.records), num_records + 1)
+        self.assertEqual(self.mensura.depth, 0)
+        
+    def testMeasure(self) -> None:
+        self.cnxn.execute("INSERT INTO creators VALUES (1, 'a'), (2, 'b')")
+        sql: str = 'SELECT * FROM creators'
+        
+        result: pd.DataFrame
+        duration: float
+        
+        result, duration = self.mensura.measure(
+            sql, (), lambda: pd.read_sql(sql, self.cnxn)
+        )
+        
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertGreaterEqual(duration, 0)
+        self.assertEqual(self.mensura.records[0]['rows'], 2)
+        
+        self.mensura.measure(
+            'DELETE FROM creators', (), 
+            lambda: self.cnxn.execute('DELETE FROM creators')
+        )
+        
+        self.assertEqual(self.mensura.records[1]['rows'], 2)
+        
+        self.assertRaises(
+            sqlite3.OperationalError, self.mensura.measure, 
+            'SELECT * FROM nonexistent_table', (), 
+            lambda: self.cnxn.execute('SELECT * FROM nonexistent_table')
+        )
+        
+        self.assertEqual(self.mensura.depth, 0)
+        
+    def testExplain(self) -> None:
+        plan: list[str] = self.mensura.explain(
+            self.cnxn, 'SELECT * FROM creators WHERE name = ?', ('a',)
+        )
+        
+        self.assertEqual(plan, ['SCAN creators'])
+        self.assertEqual(self.mensura.explain(self.cnxn, 'not sql'), [])
+        
+    def testLogSlow(self) -> None:
+        slow_log: str = 'tests/data/test_slow.jsonl'
+        mensura = Mensura(slow_threshold=0, slow_log=slow_log)
+        self.cnxn.execute('CREATE INDEX creators_id_idx ON creators (id)')
+        
+        for sql in [
+            'SELECT * FROM creators WHERE name = ?', 
+            'SELECT * FROM creators WHERE id = ?'
+        ]:
+            mensura.measure(
+                sql, ('a',), lambda: self.cnxn.execute(sql, ('a',)), 
+                cnxn=self.cnxn
+            )
+        
+        self.assertEqual(len(mensura.slow), 2)
+        
+        with open(slow_log) as log:
+            entries: list[dict[str, Any]] = [json.loads(l) for l in log]
+        
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]['params'], ['a'])
+        self.assertEqual(entries[0]['scans'], ['SCAN creators'])
+        self.assertTrue(entries[0]['full_scan'])
+        self.assertEqual(entries[1]['scans'], [])
+        self.assertFalse(entries[1]['full_scan'])
+        
+        mensura = Mensura(slow_threshold=60)
+        
+        mensura.measure(
+            'SELECT * FROM creators', (), 
+            lambda: self.cnxn.execute('SELECT * FROM creators'), 
+            cnxn=self.cnxn
+        )
+        
+        self.assertEqual(mensura.slow, [])
+        os.remove(slow_log)
+        
+    def testGetStats(self) -> None:
+        for i in range(10):
+            self.mensura.record(
+                f'SELECT * FROM creators WHERE id = {i}', (), 0.1 * (i + 1), 1
+            )
+        
+        self.mensura.record('DELETE FROM creators', (), 0.01, 10)
+        stats: pd.DataFrame = self.mensura.get_stats()
+        
+        exp_columns: list[str] = [
+            'statement', 'count', 'params', 'total', 
+            'mean', 'p50', 'p95', 'p99', 'rows'
+        ]
+        
+        self.assertEqual(list(stats.columns), exp_columns)
+        self.assertEqual(stats.shape[0], 2)
+        top: pd.Series = stats.iloc[0]
+        self.assertEqual(top['statement'], 'SELECT * FROM creators WHERE id = ?')
+        self.assertEqual(top['count'], 10)
+        self.assertAlmostEqual(top['total'], 5.5)
+        self.assertAlmostEqual(top['p50'], 0.55)
+        self.assertGreater(top['p99'], top['p95'])
+        
+        stats_dict = self.mensura.get_stats(as_frame=False)
+        self.assertIsInstance(stats_dict, dict)
+        self.assertEqual(stats_dict['DELETE FROM creators']['rows'], 10)
+        
+    def testReset(self) -> None:
+        self.mensura.record('DELETE FROM creators', (), 0.01, 0)
+        self.mensura.reset()
+        self.assertEqual(self.mensura.records, [])
+        
+    def tearDown(self) -> None:
+        self.cnxn.close()
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,101 @@
+from indexia.mneme import Mneme
+import os
+import pandas as pd
+import sqlite3
+import unittest as ut
+
+
+class TestMneme(ut.TestCase):
+    def setUp(self) -> None:
+        self.mneme = Mneme(size=2)
+        self.db: str = 'tests/data/test_mneme.db'
+        self.father = pd.DataFrame(data={'id': [1], 'name': ['father']})
+        self.sons = pd.DataFrame(data={'id': [1, 2], 'name': ['son', 'son']})
+        
+    def testInit(self) -> None:
+        self.assertRaises(ValueError, Mneme, 0)
+        
+    def testGetPut(self) -> None:
+        self.assertIsNone(self.mneme.get((self.db, 'id', 'creators', 1)))
+        self.mneme.put((self.db, 'id', 'creators', 1), self.father)
+        being: pd.DataFrame | None = self.mneme.get((self.db, 'id', 'creators', 1))
+        self.assertIsNotNone(being)
+        pd.testing.assert_frame_equal(being, self.father)
+        self.assertIsNot(being, self.mneme.entries[(self.db, 'id', 'creators', 1)])
+        self.assertEqual((self.mneme.hits, self.mneme.misses), (1, 1))
+        
+        self.mneme.put((self.db, 'id', 'creators', 2), pd.DataFrame(columns=['id']))
+        self.assertEqual(len(self.mneme.entries), 1)
+        
+    def testEviction(self) -> None:
+        self.mneme.put((self.db, 'id', 'creators', 1), self.father)
+        self.mneme.put((self.db, 'trait', 'creatures', 'son'), self.sons)
+        self.mneme.get((self.db, 'id', 'creators', 1))
+        self.mneme.put((self.db, 'id', 'creatures', 1), self.sons.iloc[[0]])
+        
+        self.assertListEqual(list(self.mneme.entries), [
+            (self.db, 'id', 'creators', 1), (self.db, 'id', 'creatures', 1)
+        ])
+        
+        self.assertSetEqual(
+            self.mneme.keys[(self.db, 'creatures')], {(self.db, 'id', 'creatures', 1)}
+        )
+        
+    def testForget(self) -> None:
+        self.mneme.size = 10
+        self.mneme.put((self.db, 'id', 'creatures', 1), self.sons.iloc[[0]])
+        self.mneme.put((self.db, 'id', 'creatures', 2), self.sons.iloc[[1]])
+        self.mneme.put((self.db, 'trait', 'creatures', 'son'), self.sons)
+        self.mneme.put((self.db, 'id', 'creators', 1), self.father)
+        self.mneme.put(('tests/data/other.db', 'id', 'creatures', 2), self.sons.iloc[[1]])
+        
+        self.assertEqual(self.mneme.forget(self.db, 'creatures', ids=[2]), 2)
+        
+        self.assertListEqual(list(self.mneme.entries), [
+            (self.db, 'id', 'creatures', 1), (self.db, 'id', 'creators', 1), 
+            ('tests/data/other.db', 'id', 'creatures', 2)
+        ])
+        
+        self.assertEqual(self.mneme.forget('tests/data/other.db', 'creatures'), 1)
+        
+        self.assertListEqual(list(self.mneme.entries), [
+            (self.db, 'id', 'creatures', 1), (self.db, 'id', 'creators', 1)
+        ])
+        
+        self.assertEqual(self.mneme.forget(self.db, 'creatures', lookups=['trait']), 0)
+        self.assertEqual(self.mneme.forget(self.db, 'creatures'), 1)
+        self.assertListEqual(list(self.mneme.entries), [(self.db, 'id', 'creators', 1)])
+        
+        self.mneme.clear()
+        self.assertEqual(len(self.mneme.entries), 0)
+        
+    def testCheck(self) -> None:
+        db: str = self.db
+        self.mneme.check_data_version = True
+        reader: sqlite3.Connection = sqlite3.connect(db)
+        writer: sqlite3.Connection = sqlite3.connect(db)
+        
+        try:
+            writer.execute('CREATE TABLE creators (id INTEGER, name TEXT)')
+            writer.commit()
+            self.mneme.check(reader)
+            self.mneme.put((self.db, 'id', 'creators', 1), self.father)
+            self.mneme.check(reader)
+            self.assertEqual(len(self.mneme.entries), 1)
+            
+            writer.execute("INSERT INTO creators VALUES (1, 'mother')")
+            writer.commit()
+            self.mneme.check(reader)
+            self.assertEqual(len(self.mneme.entries), 0)
+            
+            self.mneme.put((self.db, 'id', 'creators', 1), self.father)
+            self.mneme.check(writer)
+            self.assertEqual(len(self.mneme.entries), 0)
+        finally:
+            reader.close()
+            writer.close()
+            os.remove(db)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -1,5 +1,7 @@
+from indexia.archeion import Archeion
 from indexia.eidola import Maker
 from indexia.indexia import Indexia
+from indexia.mensura import Mensura
 from indexia.schemata import Corpus, Dendron, Diktua, ScalaNaturae
 from networkx.classes.reportviews import NodeDataView
 from pyvis.network import Network # type: ignore
@@ -7,6 +9,7 @@ from sqlite3 import Connection
 from typing import Any
 import itertools
 import os
+import shutil
 import pandas as pd
 import unittest as ut
 import xml.etree.ElementTree as et
@@ -18,6 +21,10 @@ class TestSchemata(ut.TestCase):
         cls.test_db: str = 'tests/data/test_schemata.db'
         cls.xml_file: str = 'tests/data/dendron.xml'
         cls.csv_path: str = 'tests/data/test_corpus.csv'
+        cls.closure_db: str = 'tests/data/test_closure.db'
+        cls.archeion_dir: str = 'tests/data/archeion'
+        cls.refresh_db: str = 'tests/data/test_refresh.db'
+        cls.memory_db: str = 'tests/data/test_memory.db'
         cls.ladder: ScalaNaturae = ScalaNaturae(cls.test_db)
         cls.species_per_genus: int = 3
         cls.num_beings: int = 5
@@ -31,7 +38,8 @@ class TestSchemata(ut.TestCase):
             cls.test_db,
             cls.species_per_genus, 
             cls.num_beings,
-            cls.trait
+            cls.trait,
+            cache_dir='tests/data/cache'
         )
         
         (
@@ -39,27 +47,11 @@ class TestSchemata(ut.TestCase):
             cls.sons, 
             cls.grandsons,
             cls.great_grandsons
-        ) = cls.maker.get() if cls.checkEidolaExist() else cls.maker.make()
+        ) = cls.maker.make()
 
         cls.genus: str = 'creators'
         cls.creators: pd.DataFrame = cls.fathers[0]
         cls.corpus = Corpus(cls.test_db, cls.genus, cls.creators, max_depth=1)
-        
-    @classmethod
-    def checkEidolaExist(cls) -> bool:
-        exp_creator: str = 'creators'
-        right: int = cls.species_per_genus - 1
-        exp_creature: str = f'creatures_{right}_{right}_{right}'
-        
-        with Indexia(cls.test_db) as ix:
-            cnxn: Connection = ix.open_cnxn(ix.db)
-            tables: list[str] = ix.get_all_tables(cnxn)
-
-            eidola_exist: bool = (
-                exp_creator in tables and exp_creature in tables
-            )
-            
-        return eidola_exist
 
 class TestScalaNaturae(TestSchemata):
     def testUpward(self) -> None:
@@ -157,6 +149,55 @@ class TestScalaNaturae(TestSchemata):
             genus, creator, 'sideways'
         )
         
+        creatures: pd.DataFrame = self.great_grandsons[0].sample(3) # type: ignore
+        up = self.ladder.climb('creatures_0_0_0', creatures, 'up')
+        creators: pd.DataFrame = up[0][1]
+        self.assertEqual(list(creators.index), list(creatures.index))
+        
+        self.assertEqual(
+            list(creators.id), list(creatures[f'{up[0][0]}_id'])
+        )
+        
+    def testAscendAll(self) -> None:
+        species: str = 'creatures_0_0_0'
+        creatures: pd.DataFrame = self.great_grandsons[0].sample(3) # type: ignore
+        creature_ids: list[int] = [int(i) for i in creatures.id]
+        
+        lineages: pd.DataFrame = self.ladder.ascend_all(
+            species, creature_ids, expressions=True
+        )
+        
+        self.assertEqual(list(lineages[f'{species}_id']), creature_ids)
+        
+        self.assertEqual(list(lineages.columns), [
+            f'{species}_id', f'{species}_name',
+            'creatures_0_0_id', 'creatures_0_0_name',
+            'creatures_0_id', 'creatures_0_name',
+            'creators_id', 'creators_name'
+        ])
+        
+        for i in range(creatures.shape[0]):
+            creature: pd.DataFrame = creatures.iloc[[i]]
+            kind: str = species
+            
+            while True:
+                next_rung: list[tuple[str, pd.DataFrame]] = self.ladder.upward(
+                    kind, creature
+                )
+                
+                if not next_rung:
+                    break
+                
+                kind, creature = next_rung[0]
+                
+                self.assertEqual(
+                    lineages[f'{kind}_id'].iloc[i], creature.id.iloc[0]
+                )
+                
+                self.assertEqual(
+                    lineages[f'{kind}_name'].iloc[i], creature.name.iloc[0]
+                )
+        
         
 class TestDendron(TestSchemata):
     def testRenderImage(self) -> None:
@@ -326,6 +367,253 @@ class TestCorpus(TestSchemata):
                     
         self.assertEqual(set(corpus.species), exp_species)
         
+    def testAssembleMensura(self) -> None:
+        mensura = Mensura()
+        
+        corpus = Corpus(
+            self.test_db, self.genus, self.creators, 
+            max_depth=1, mensura=mensura
+        )
+        
+        corpus.assemble()
+        statements: set[str] = {r['statement'] for r in mensura.records}
+        self.assertIn('PRAGMA FOREIGN_KEY_LIST(creators)', statements)
+        
+        self.assertIn(
+            'SELECT * FROM creatures_0 WHERE creators_id = ?', statements
+        )
+        
+    def testAssembleClosure(self) -> None:
+        shutil.copyfile(self.test_db, self.closure_db)
+        
+        with Indexia(self.closure_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.build_closure(cnxn)
+        
+        columns: list[str] = list(self.corpus.assemble().columns)
+        
+        for max_depth in [1, 2, 5]:
+            self.corpus.max_depth = max_depth
+            
+            closure_corpus: Corpus = Corpus(
+                self.closure_db, self.genus, self.creators, max_depth=max_depth
+            )
+            
+            corpus: pd.DataFrame = self.corpus.assemble().fillna(-1)
+            closure: pd.DataFrame = closure_corpus.assemble().fillna(-1)
+            self.assertEqual(list(closure.index), list(corpus.index))
+            
+            pd.testing.assert_frame_equal(
+                closure.sort_values(by=columns).reset_index(drop=True),
+                corpus.sort_values(by=columns).reset_index(drop=True),
+                check_dtype=False
+            )
+        
+        with Indexia(self.closure_db) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            
+            ix.add_creature(
+                cnxn, self.genus, self.creators.iloc[[0]], 
+                'strangers', self.trait, 'newcomer'
+            )
+            
+            self.assertFalse(ix.has_closure(cnxn))
+        
+        closure_corpus = Corpus(self.closure_db, self.genus, self.creators, max_depth=1)
+        self.assertIn('newcomer', list(closure_corpus.assemble().expression))
+        
+        with Indexia(self.closure_db) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            ix.build_closure(cnxn)
+            self.assertTrue(ix.has_closure(cnxn))
+        
+        self.assertIn('newcomer', list(closure_corpus.assemble().expression))
+        
+    def testAssembleArcheion(self) -> None:
+        archeion = Archeion(self.archeion_dir)
+        
+        corpus = Corpus(
+            self.test_db, self.genus, self.creators, 
+            max_depth=2, archeion=archeion
+        )
+        
+        assembled: pd.DataFrame = corpus.assemble()
+        self.assertEqual((archeion.hits, archeion.misses), (0, 1))
+        pd.testing.assert_frame_equal(corpus.assemble(), assembled)
+        self.assertEqual((archeion.hits, archeion.misses), (1, 1))
+        
+        corpus.max_depth = 1
+        self.assertLess(corpus.assemble().shape[0], assembled.shape[0])
+        corpus.creators = self.creators.iloc[[0]]
+        corpus.assemble()
+        self.assertEqual((archeion.hits, archeion.misses), (1, 3))
+        shutil.rmtree(self.archeion_dir)
+        
+    def testAssembleArcheionInMemory(self) -> None:
+        shutil.copyfile(self.test_db, self.memory_db)
+        archeion = Archeion(self.archeion_dir)
+        
+        with Indexia(self.memory_db, in_memory=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            
+            corpus = Corpus(
+                self.memory_db, self.genus, self.creators, 
+                max_depth=1, archeion=archeion, in_memory=True
+            )
+            
+            assembled: pd.DataFrame = corpus.assemble()
+            
+            ix.add_creature(
+                cnxn, self.genus, self.creators, 
+                'creatures_0', self.trait, 'newborn'
+            )
+            
+            changed: pd.DataFrame = corpus.assemble()
+            self.assertEqual(changed.shape[0], assembled.shape[0] + 1)
+            self.assertEqual((archeion.hits, archeion.misses), (0, 2))
+            
+            ix.update(cnxn, 'creatures_0', [self.trait], ['renamed'], [self.trait], ['newborn'])
+            self.assertIn('renamed', corpus.assemble().values)
+            self.assertEqual((archeion.hits, archeion.misses), (0, 3))
+            pd.testing.assert_frame_equal(corpus.assemble(), corpus.assemble())
+            self.assertEqual((archeion.hits, archeion.misses), (2, 3))
+        
+        on_disk = Corpus(
+            self.memory_db, self.genus, self.creators, 
+            max_depth=1, archeion=archeion
+        )
+        
+        pd.testing.assert_frame_equal(on_disk.assemble(), assembled)
+        self.assertEqual(archeion.misses, 4)
+        shutil.rmtree(self.archeion_dir)
+        
+    def testRefresh(self) -> None:
+        shutil.copyfile(self.test_db, self.refresh_db)
+        creators: pd.DataFrame = self.creators[self.creators.id.isin([1, 2])]
+        corpus = Corpus(self.refresh_db, self.genus, creators, max_depth=3)
+        columns: list[str] = list(corpus.assemble().columns)
+        
+        def assertRefreshed(refreshed: pd.DataFrame) -> None:
+            pd.testing.assert_frame_equal(
+                refreshed.fillna(-1).sort_values(by=columns).reset_index(drop=True),
+                corpus.assemble().fillna(-1).sort_values(by=columns).reset_index(drop=True),
+                check_dtype=False
+            )
+        
+        with Indexia(self.refresh_db, changelog=True) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.install_all_triggers(cnxn)
+            previous: pd.DataFrame = corpus.assemble()
+            
+            ix.update(cnxn, 'creatures_1', [self.trait], ['renamed'], ['id'], [1])
+            
+            ix.add_creature(
+                cnxn, self.genus, creators.iloc[[0]], 
+                'creatures_0', self.trait, 'newborn'
+            )
+            
+            ix.delete(cnxn, 'creatures_2', 2)
+            ix.update(cnxn, 'creatures_0', ['creators_id'], [1], ['id'], [3])
+            ix.update(cnxn, 'creatures_0', ['creators_id'], [4], ['id'], [2])
+            ix.update(cnxn, 'creatures_0_0', ['creatures_0_id'], [1], ['id'], [2])
+            seq: int = int(ix.get_changes(cnxn).seq.max())
+        
+        refreshed: pd.DataFrame = corpus.refresh(previous, since=0)
+        assertRefreshed(refreshed)
+        self.assertEqual(refreshed.attrs['seq'], seq)
+        self.assertListEqual(list(refreshed.index), list(range(refreshed.shape[0])))
+        
+        with Indexia(self.refresh_db) as ix:
+            cnxn = ix.open_cnxn(ix.db)
+            
+            ix.add_creature(
+                cnxn, self.genus, creators.iloc[[1]], 
+                'creatures_2', self.trait, 'latecomer'
+            )
+        
+        assertRefreshed(corpus.refresh(refreshed))
+        
+        with self.assertRaises(ValueError):
+            Corpus(self.test_db, self.genus, creators).refresh(previous, since=0)
+        
+    def testAssembleIdsOnly(self) -> None:
+        shutil.copyfile(self.test_db, self.closure_db)
+        
+        with Indexia(self.closure_db) as ix:
+            cnxn: Connection = ix.open_cnxn(ix.db)
+            ix.build_closure(cnxn)
+        
+        for db in [self.test_db, self.closure_db]:
+            corpus: pd.DataFrame = Corpus(
+                db, self.genus, self.creators, max_depth=3
+            ).assemble()
+            
+            ids_corpus = Corpus(
+                db, self.genus, self.creators, max_depth=3, ids_only=True
+            )
+            
+            ids_only: pd.DataFrame = ids_corpus.assemble()
+            
+            self.assertListEqual(
+                list(ids_only.columns), 
+                ['genus', 'creator_id', 'species', 'creature_id']
+            )
+            
+            pd.testing.assert_frame_equal(
+                ids_only.fillna(-1), corpus[ids_only.columns].fillna(-1), 
+                check_dtype=False
+            )
+            
+            filtered: pd.DataFrame = ids_only[ids_only.species != 'creatures_1']
+            
+            pd.testing.assert_frame_equal(
+                ids_corpus.hydrate(filtered, ['trait', 'expression']).fillna(-1),
+                corpus[corpus.species != 'creatures_1'].fillna(-1),
+                check_dtype=False
+            )
+            
+            self.assertListEqual(
+                list(ids_corpus.hydrate(filtered).columns), 
+                list(ids_only.columns) + ['expression']
+            )
+        
+        with self.assertRaises(ValueError):
+            ids_corpus.hydrate(ids_only, ['creator'])
+        
+    def testAssembleCompact(self) -> None:
+        corpus: pd.DataFrame = Corpus(
+            self.test_db, self.genus, self.creators, max_depth=3
+        ).assemble()
+        
+        compact: pd.DataFrame = Corpus(
+            self.test_db, self.genus, self.creators, max_depth=3, 
+            compact=True, string_storage='python'
+        ).assemble()
+        
+        self.assertDictEqual({c: str(t) for c, t in compact.dtypes.items()}, {
+            'genus': 'category', 'creator_id': 'Int64',
+            'species': 'category', 'creature_id': 'Int64',
+            'trait': 'category', 'expression': 'string'
+        })
+        
+        for column in corpus.columns:
+            self.assertListEqual(
+                list(compact[column].astype(object).fillna(-1)),
+                list(corpus[column].fillna(-1))
+            )
+        
+        self.assertLess(
+            compact.memory_usage(deep=True).sum(), 
+            corpus.memory_usage(deep=True).sum()
+        )
+        
+        diktua = Diktua(compact, as_nodes='creature_id', as_edges='species')
+        diktua.add_rows(compact.iloc[:2])
+        expected = Diktua(corpus, as_nodes='creature_id', as_edges='species')
+        expected.add_rows(corpus.iloc[:2])
+        self.assertSetEqual(set(diktua.G.nodes), set(expected.G.nodes))
+        self.assertSetEqual(set(diktua.G.edges), set(expected.G.edges))
+        
     def testToCSV(self) -> None:
         self.corpus.max_depth = 5
         corpus: pd.DataFrame = self.corpus.assemble()
@@ -340,10 +628,11 @@ class TestCorpus(TestSchemata):
     
     @classmethod
     def tearDownClass(cls) -> None:
-        try:
-            os.remove(cls.csv_path)
-        except:
-            pass
+        for file_path in [cls.csv_path, cls.closure_db, cls.refresh_db, cls.memory_db]:
+            try:
+                os.remove(file_path)
+            except:
+                pass
         
 class TestDiktua(TestSchemata):
     @classmethod
@@ -378,6 +667,70 @@ class TestDiktua(TestSchemata):
             
         return exp_edges
         
+    def testArcheion(self) -> None:
+        archeion = Archeion(self.archeion_dir)
+        
+        for _ in range(2):
+            diktua = Diktua(
+                self.corpus_df, as_nodes='species', as_edges='genus',
+                self_edges=self.self_edges, archeion=archeion
+            )
+            
+            self.assertSetEqual(set(diktua.G.nodes), set(self.diktua.G.nodes))
+            
+            self.assertSetEqual(
+                {tuple(sorted(e)) for e in diktua.G.edges}, 
+                {tuple(sorted(e)) for e in self.diktua.G.edges}
+            )
+        
+        self.assertEqual((archeion.hits, archeion.misses), (1, 1))
+        
+        Diktua(
+            self.corpus_df.iloc[:-1], as_nodes='species', as_edges='genus',
+            archeion=archeion
+        )
+        
+        self.assertEqual(archeion.misses, 2)
+        shutil.rmtree(self.archeion_dir)
+        
+    def testAddRemoveRows(self) -> None:
+        corpus_df: pd.DataFrame = Corpus(
+            self.test_db, self.genus, self.creators, max_depth=2
+        ).assemble()
+        
+        half: int = corpus_df.shape[0] // 2
+        
+        def assertGraphEqual(diktua: Diktua, expected: Diktua) -> None:
+            self.assertSetEqual(set(diktua.G.nodes), set(expected.G.nodes))
+            
+            self.assertSetEqual(
+                {tuple(sorted(e)) for e in diktua.G.edges}, 
+                {tuple(sorted(e)) for e in expected.G.edges}
+            )
+            
+            self.assertDictEqual(dict(diktua.G.nodes), dict(expected.G.nodes))
+        
+        for as_nodes, as_edges, self_edges in [
+            ('species', 'genus', True), 
+            ('expression', 'creator_id', False),
+            ('creature_id', 'species', True)
+        ]:
+            diktua = Diktua(corpus_df.iloc[:half], as_nodes, as_edges, self_edges)
+            diktua.style_nodes()
+            diktua.add_rows(corpus_df.iloc[half:])
+            full = Diktua(corpus_df, as_nodes, as_edges, self_edges)
+            full.style_nodes()
+            assertGraphEqual(diktua, full)
+            self.assertListEqual(list(diktua.corpus.index), list(corpus_df.index))
+            
+            diktua.remove_rows(corpus_df.iloc[half:])
+            part = Diktua(corpus_df.iloc[:half], as_nodes, as_edges, self_edges)
+            part.style_nodes()
+            assertGraphEqual(diktua, part)
+        
+        with self.assertRaises(ValueError):
+            diktua.remove_rows(corpus_df.iloc[half:])
+    
     def testGetGraphElements(self) -> None:
         exp_nodes: set[str] = set(list(self.corpus_df.species)) - {self.genus}
         exp_edges: set[tuple[str, ...] | tuple[str, str]] = self.get_expected_edges(self.self_edges)
@@ -0,0 +1,71 @@
+from indexia.thesaurus import Thesaurus
+import os
+import pandas as pd
+import shutil
+import sqlite3
+import unittest as ut
+
+
+class TestThesaurus(ut.TestCase):
+    def setUp(self) -> None:
+        self.db: str = 'tests/data/test_thesaurus.db'
+        self.spill_dir: str = 'tests/data/thesaurus'
+        self.thesaurus = Thesaurus(size=1, spill_dir=self.spill_dir)
+        self.cnxn: sqlite3.Connection = sqlite3.connect(self.db)
+        self.cnxn.execute('CREATE TABLE creators (id INTEGER, name TEXT)')
+        self.cnxn.commit()
+        self.sql: str = 'SELECT * FROM creators WHERE id = ?'
+        self.father = pd.DataFrame(data={'id': [1], 'name': ['father']})
+        self.mother = pd.DataFrame(data={'id': [2], 'name': ['mother']})
+        
+    def testInit(self) -> None:
+        self.assertRaises(ValueError, Thesaurus, 0)
+        
+    def testGetPut(self) -> None:
+        self.assertIsNone(self.thesaurus.get(self.db, self.sql, (1,)))
+        self.thesaurus.put(self.db, self.sql, (1,), self.father)
+        df: pd.DataFrame | None = self.thesaurus.get(self.db, self.sql, (1,))
+        self.assertIsNotNone(df)
+        pd.testing.assert_frame_equal(df, self.father)
+        self.assertIsNone(self.thesaurus.get(self.db, self.sql, (2,)))
+        self.assertEqual((self.thesaurus.hits, self.thesaurus.misses), (1, 2))
+        
+    def testSpill(self) -> None:
+        self.thesaurus.get(self.db, self.sql, (1,))
+        self.thesaurus.put(self.db, self.sql, (1,), self.father)
+        self.thesaurus.put(self.db, self.sql, (2,), self.mother)
+        self.assertEqual(self.thesaurus.spills, 1)
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+        
+        df: pd.DataFrame | None = self.thesaurus.get(self.db, self.sql, (1,))
+        self.assertIsNotNone(df)
+        pd.testing.assert_frame_equal(df, self.father)
+        self.assertListEqual(list(self.thesaurus.entries), [(self.db, self.sql, (1,))])
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+        
+    def testValidate(self) -> None:
+        self.thesaurus.get(self.db, self.sql, (1,))
+        self.thesaurus.put(self.db, self.sql, (1,), self.father)
+        self.thesaurus.put(self.db, self.sql, (2,), self.mother)
+        self.assertIsNotNone(self.thesaurus.get(self.db, self.sql, (2,)))
+        
+        self.cnxn.execute("INSERT INTO creators VALUES (1, 'father')")
+        self.cnxn.commit()
+        self.assertIsNone(self.thesaurus.get(self.db, self.sql, (2,)))
+        self.assertEqual(len(self.thesaurus.spilled), 0)
+        self.assertEqual(len(os.listdir(self.spill_dir)), 0)
+        
+        self.thesaurus.put(self.db, self.sql, (2,), self.mother)
+        self.cnxn.execute('CREATE INDEX creators_name ON creators (name)')
+        self.cnxn.commit()
+        self.assertIsNone(self.thesaurus.get(self.db, self.sql, (2,)))
+        
+    def tearDown(self) -> None:
+        self.thesaurus.close()
+        self.cnxn.close()
+        os.remove(self.db)
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    ut.main()